@@ -0,0 +1 @@
+# Makes the repository root importable (`modules`, `langgraph_agent`) when running `pytest` from any directory.
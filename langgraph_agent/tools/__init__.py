@@ -2,5 +2,6 @@ __all__ = [
     "tools",
     "missing_handler_tool",
     "outlier_handler_tool",
+    "outlier_index",
     "hypothesis_tests_tool"
 ]
\ No newline at end of file
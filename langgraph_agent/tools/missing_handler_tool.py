@@ -3,6 +3,8 @@ import numpy as np
 from scipy import stats
 import json
 
+from modules.helpers.column_profile import shared_profile_cache
+
 
 class MissingHandler:
     def __init__(self, dataset):
@@ -156,9 +158,7 @@ class MissingHandler:
         Check if a numeric column follows a normal distribution using the Shapiro-Wilk test.
         Returns True if normally distributed, otherwise False.
         """
-        series_clean = series.dropna()
-        stat, p_value = stats.shapiro(series_clean)
-        return p_value > 0.05  # Normally distributed if p > 0.05
+        return shared_profile_cache.is_normal(series, 'shapiro')  # Normally distributed if p > 0.05
 
     def _z_score_outliers(self, series):
         """
@@ -2,10 +2,18 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from modules.helpers.column_profile import shared_profile_cache
+
 
 class OutlierHandler:
-    def __init__(self, dataset):
+    def __init__(self, dataset, outlier_index=None):
+        """
+        Args:
+            dataset (pd.DataFrame): The dataset to be handled.
+            outlier_index (OutlierIndex, optional): Precomputed outliers of the dataset, read instead of rescanning it.
+        """
         self.dataset = dataset
+        self.outlier_index = outlier_index
 
     def handle_outliers(self):
         """
@@ -61,6 +69,8 @@ class OutlierHandler:
         Detects outliers in a numeric series using the IQR method or Z-score for normal distribution.
         Returns a boolean mask where True indicates an outlier.
         """
+        if self.outlier_index is not None and self.outlier_index.covers(series):
+            return pd.Series(self.outlier_index.outlier_mask(series.name), index=series.index)
         if self._is_normal_distribution(series):
             z_scores = np.abs(stats.zscore(series.dropna()))
             return z_scores > 3  # Z-score > 3 indicates outliers
@@ -75,6 +85,6 @@ class OutlierHandler:
         Check if a numeric column follows a normal distribution using the Shapiro-Wilk test.
         Returns True if normally distributed, otherwise False.
         """
-        series_clean = series.dropna()
-        stat, p_value = stats.shapiro(series_clean)
-        return p_value > 0.05  # Normally distributed if p > 0.05
+        if self.outlier_index is not None and self.outlier_index.covers(series):
+            return self.outlier_index.is_normal[series.name]
+        return shared_profile_cache.is_normal(series, 'shapiro')  # Normally distributed if p > 0.05
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from modules.helpers.column_profile import shared_profile_cache
+from modules.outlier_handler import OutlierHandler as ModuleOutlierHandler
+
+
+class OutlierIndex:
+    """
+    Outliers of every numeric column of one dataset version, computed once and shared by the tools.
+
+    IQR flags are computed for all numeric columns, z-score (|z| > 3) flags for the columns passing the Shapiro
+    normality test, each in one vectorized pass. Flags are stored as packed bitmaps (see `OutlierMask`) next to
+    the bounds used.
+
+    The index does not watch the dataset: it is valid for the `version` it was built for, and whoever writes to the
+    dataset starts a new version (see `tools.mark_dataset_changed`).
+    """
+
+    def __init__(self, dataset: pd.DataFrame, version=None) -> None:
+        self.version = version
+        numeric_columns = list(dataset.select_dtypes(include=np.number).columns)
+        self.n_rows = len(dataset)
+
+        self.is_normal = {}
+        for column in numeric_columns:
+            profile = shared_profile_cache.profile(dataset[column])
+            self.is_normal[column] = profile.count >= 3 and shared_profile_cache.is_normal(dataset[column], 'shapiro')
+
+        detector = ModuleOutlierHandler()
+        self.iqr = detector.detect_all(dataset, numeric_columns, ModuleOutlierHandler.Identifier.IQR)
+        self.zscore = detector.detect_all(dataset, [column for column in numeric_columns if self.is_normal[column]],
+                                          ModuleOutlierHandler.Identifier.ZSCORE)
+        self.iqr_counts = self.iqr.counts()
+        self.zscore_counts = self.zscore.counts()
+
+    @property
+    def columns(self) -> list:
+        return self.iqr.columns
+
+    def covers(self, series: pd.Series) -> bool:
+        """Whether `series`, a column of the dataset at the indexed version, is one of the indexed columns."""
+        return series.name in self.is_normal and len(series) == self.n_rows
+
+    def outlier_count(self, column) -> int:
+        """Number of IQR outliers of a column."""
+        return int(self.iqr_counts[column])
+
+    def outlier_mask(self, column) -> np.ndarray:
+        """Row mask of the outliers: z-score flags for normal columns, IQR flags otherwise."""
+        if self.is_normal[column]:
+            return self.zscore.column_mask(column)
+        return self.iqr.column_mask(column)
+
+    def has_outliers(self, column) -> bool:
+        """True when the column has z-score outliers (normal columns only) or IQR outliers."""
+        if self.is_normal[column] and self.zscore_counts[column] > 0:
+            return True
+        return bool(self.iqr_counts[column] > 0)
+
+    def any_outliers(self) -> bool:
+        return any(self.has_outliers(column) for column in self.columns)
@@ -9,12 +9,18 @@ import pandas as pd
 from langchain.tools import tool
 from langgraph.prebuilt import ToolExecutor, ToolNode
 
+from modules.helpers.column_profile import shared_profile_cache
+from modules.helpers.execution import ExecutionMode
+from modules.data_type_converter import DataTypeConverter
 from . import hypothesis_tests_tool
 from .test import parametric, regression, correlation, nonparametric
 from .missing_handler_tool import MissingHandler
 from .outlier_handler_tool import OutlierHandler
+from .outlier_index import OutlierIndex
 
 global dataset
+dataset_version = 0
+_outlier_index = None
 
 
 class ToolEditor:
@@ -52,9 +58,40 @@ class ToolEditor:
         return nonparametric.nonparametric_tests + regression.regression_tests + correlation.correlation_tests
 
 
-def set_dataset(path):
+def set_dataset(path, compact_dtypes: bool = False):
+    """
+    Load the dataset the tools work on.
+
+    With `compact_dtypes`, numeric columns are stored in the smallest dtype that holds their values exactly,
+    which saves memory on large files. It is off by default: the tools compute and write float64 values in
+    place (means, medians, transforms), which can overflow narrowed integer columns and upcasts float32 ones.
+    Strings are left as objects, the cleaning tools fill them with arbitrary constants.
+    """
     global dataset
     dataset = pd.read_csv(path)
+    if compact_dtypes:
+        dataset = DataTypeConverter(ExecutionMode.INPLACE).compact_dtypes(dataset, category_threshold=None,
+                                                                          integral_floats=False)
+    mark_dataset_changed()
+
+
+def mark_dataset_changed():
+    """Start a new dataset version, to be called by every tool that modifies or replaces the dataset."""
+    global dataset_version
+    dataset_version += 1
+
+
+def get_outlier_index() -> OutlierIndex:
+    """
+    Outlier index of the current dataset version, built on first use.
+
+    The index is keyed on `dataset_version` alone, so reading it costs nothing once built; writers must call
+    `mark_dataset_changed`.
+    """
+    global _outlier_index
+    if _outlier_index is None or _outlier_index.version != dataset_version:
+        _outlier_index = OutlierIndex(dataset, dataset_version)
+    return _outlier_index
 
 
 def get_dataset_sample():
@@ -107,13 +144,14 @@ def summarize_dataset() -> dict:
 
     Notes:
     ------
-    - The 'mean' and 'median' are calculated only for columns with numeric data types ('int64', 'float64').
+    - The 'mean' and 'median' are calculated only for numeric (non-boolean) columns, whatever their width.
     - The 'mode' is calculated by dropping NaN values from the column. If the column is multimodal
       or contains no valid values, the 'mode' will be set to None.
     - The normality test is applied to numeric columns only.
     - Outliers are detected using the IQR method for numeric columns.
     """
     summary = defaultdict(dict)
+    outlier_index = get_outlier_index()
 
     for column in dataset.columns:
         col_data = dataset[column]
@@ -135,10 +173,11 @@ def summarize_dataset() -> dict:
         except StatisticsError:
             summary[column]['mode'] = None
 
-        if col_data.dtype in ['int64', 'float64']:
-            # Numeric statistics
-            summary[column]['mean'] = float(col_data.mean()) if not pd.isna(col_data.mean()) else None
-            summary[column]['median'] = float(col_data.median()) if not pd.isna(col_data.median()) else None
+        if pd.api.types.is_numeric_dtype(col_data) and not pd.api.types.is_bool_dtype(col_data):
+            # Numeric statistics, shared with the other tools through the profile cache
+            profile = shared_profile_cache.profile(col_data)
+            summary[column]['mean'] = profile.mean if not pd.isna(profile.mean) else None
+            summary[column]['median'] = profile.median if not pd.isna(profile.median) else None
 
             # To avoid Json serialization errors
             summary[column]['min'] = float(summary[column]['min'])
@@ -146,8 +185,8 @@ def summarize_dataset() -> dict:
 
             # Normality test (using Shapiro-Wilk test)
             try:
-                if len(col_data.dropna()) >= 3:
-                    stat, p_value = shapiro(col_data.dropna())
+                if profile.count >= 3:
+                    stat, p_value = shared_profile_cache.normality_test(col_data, 'shapiro')
                     summary[column]['normality_test'] = {
                         "statistic": float(stat),
                         "p_value": float(p_value),
@@ -159,11 +198,7 @@ def summarize_dataset() -> dict:
                 summary[column]['normality_test'] = None
 
             # Outlier detection using IQR method
-            Q1 = col_data.quantile(0.25)
-            Q3 = col_data.quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = col_data[(col_data < (Q1 - 1.5 * IQR)) | (col_data > (Q3 + 1.5 * IQR))]
-            summary[column]['outlier_count'] = len(outliers)
+            summary[column]['outlier_count'] = outlier_index.outlier_count(column)
 
         else:
             # For non-numeric columns, set None for numeric values
@@ -194,20 +229,16 @@ def check_preprocess_needed():
         return "preprocess"
 
     # Check for outliers in numeric columns
-    numeric_cols = dataset.select_dtypes(include=np.number).columns
-    for col in numeric_cols:
-        if is_outlier_present(dataset[col]):
-            return "preprocess"
+    if get_outlier_index().any_outliers():
+        return "preprocess"
 
     return "skip"
 
 
 def should_handle_outliers():
     # Check for outliers in numeric columns
-    numeric_cols = dataset.select_dtypes(include=np.number).columns
-    for col in numeric_cols:
-        if is_outlier_present(dataset[col]):
-            return "handle"
+    if get_outlier_index().any_outliers():
+        return "handle"
 
     return "skip"
 
@@ -225,19 +256,22 @@ def is_outlier_present(series):
     if series.isnull().all():
         return False  # Skip if the column is completely NaN
 
+    outlier_index = get_outlier_index()
+    if outlier_index.covers(series):
+        return outlier_index.has_outliers(series.name)
+
+    profile = shared_profile_cache.profile(series)
+
     # Outlier detection using the Z-score (for normal distribution)
-    if is_normal_distribution(series):
-        z_scores = np.abs(stats.zscore(series.dropna()))
-        if np.any(z_scores > 3):  # Z-score > 3 indicates outliers
+    if profile.count >= 3 and shared_profile_cache.is_normal(series, 'shapiro'):
+        lower_bound, upper_bound = profile.zscore_bounds(3)
+        if profile.min < lower_bound or profile.max > upper_bound:  # Z-score > 3 indicates outliers
             return True
 
     # Outlier detection using IQR (for non-normal distribution)
-    Q1 = series.quantile(0.25)
-    Q3 = series.quantile(0.75)
-    IQR = Q3 - Q1
-    outliers = (series < (Q1 - 1.5 * IQR)) | (series > (Q3 + 1.5 * IQR))
+    lower_bound, upper_bound = profile.iqr_bounds()
 
-    return outliers.any()
+    return profile.min < lower_bound or profile.max > upper_bound
 
 @tool
 def is_normal_distribution(column):
@@ -250,9 +284,7 @@ def is_normal_distribution(column):
     Returns:
         bool: True if the column is normally distributed, False otherwise.
     """
-    series_clean = dataset[column].dropna()
-    stat, p_value = shapiro(series_clean)
-    return p_value > 0.05  # Normally distributed if p > 0.05
+    return shared_profile_cache.is_normal(dataset[column], 'shapiro')  # Normally distributed if p > 0.05
 
 
 @tool
@@ -340,7 +372,9 @@ def handle_missing_values() -> str:
 
     This method modifies the 'dataset' DataFrame directly.
     """
-    return MissingHandler(dataset).handle_missing_value()
+    change_log = MissingHandler(dataset).handle_missing_value()
+    mark_dataset_changed()
+    return change_log
 
 
 @tool
@@ -387,7 +421,9 @@ def handle_outliers() -> str:
         'C': 'Applied square root transformation'
     }
     """
-    return OutlierHandler(dataset).handle_outliers()
+    log = OutlierHandler(dataset, get_outlier_index()).handle_outliers()
+    mark_dataset_changed()
+    return log
 
 
 @tool
@@ -406,6 +442,7 @@ def replace_with_mean(column_name: str) -> str:
         mean_value = dataset[column_name].mean()
         missing_count = dataset[column_name].isna().sum()
         dataset[column_name].fillna(mean_value, inplace=True)
+        mark_dataset_changed()
         return f"Filled {missing_count} missing values in '{column_name}' with mean value {mean_value}."
     else:
         raise ValueError(f"Column '{column_name}' is not numeric.")
@@ -427,6 +464,7 @@ def replace_with_median(column_name: str) -> str:
         median_value = dataset[column_name].median()
         missing_count = dataset[column_name].isna().sum()
         dataset[column_name].fillna(median_value, inplace=True)
+        mark_dataset_changed()
         return f"Filled {missing_count} missing values in '{column_name}' with median value {median_value}."
     else:
         raise ValueError(f"Column '{column_name}' is not numeric.")
@@ -447,6 +485,7 @@ def replace_with_mode(column_name: str) -> str:
     mode_value = dataset[column_name].mode()[0]
     missing_count = dataset[column_name].isna().sum()
     dataset[column_name].fillna(mode_value, inplace=True)
+    mark_dataset_changed()
     return f"Filled {missing_count} missing values in '{column_name}' with mode value '{mode_value}'."
 
 
@@ -1,23 +1,34 @@
+import importlib.util
+from enum import Enum
 from typing import Union
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import LabelEncoder
 import category_encoders as ce
 from modules.helpers.validators import ColumnTypeValidators
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler, MaxAbsScaler, PowerTransformer
+from modules.helpers.execution import ExecutionMode, working_frame
+from modules.helpers.power_transformer import ColumnPowerTransformer
+from modules.helpers.categorical_encoder import CategoricalEncoder
+from modules.helpers.one_hot_encoder import SparseOneHotEncoder
+from modules.helpers.batch_scaler import BatchScaler
 
 
 class DataTypeConverter:
-    def __init__(self) -> None:
+    class DtypeBackend(Enum):
+        NUMPY = 0
+        NULLABLE = 1
+        PYARROW = 2
+
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
 
     # -------------- CATEGORICAL ENCODERS --------------
     @ColumnTypeValidators.string_required
     def label_encoding(self, dataframe: pd.DataFrame, column: Union[str, int], fit=None):
         """Convert categorical variables into numerical values"""
 
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         encoder = LabelEncoder()
 
         if fit is None:
@@ -27,32 +38,235 @@ class DataTypeConverter:
             df_copy[column] = encoder.transform(df_copy[column])
         return df_copy
 
-    def one_hot_encoding(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        df_copy = dataframe.copy()
-        one_hot_encoded = pd.get_dummies(df_copy[column], prefix=column)
-        df_copy = df_copy.drop(column, axis=1)
-        df_copy = df_copy.join(one_hot_encoded)
+    def categorical_encoding(self, dataframe: pd.DataFrame, columns: list, shared: list = None,
+                             encoder: CategoricalEncoder = None, suffix: str = ''):
+        """
+        Label encode several columns in one pass, see CategoricalEncoder.
+
+        Columns grouped in `shared` get one common vocabulary. Pass a fitted (or loaded) `encoder` to reuse its
+        vocabularies on a new file; otherwise one is fitted on `columns`. Codes are written to `column + suffix`,
+        so a non-empty suffix keeps the original columns.
+        """
+        for column in columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+        if encoder is None:
+            encoder = CategoricalEncoder().fit(dataframe, columns, shared)
+        encoded = encoder.transform(dataframe, columns)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        for column in columns:
+            df_copy[f"{column}{suffix}"] = encoded[column]
         return df_copy
 
+    def one_hot_encoding(self, dataframe: pd.DataFrame, column: Union[str, int], sparse_output: bool = False,
+                         max_categories: int = None, hash_features: int = None,
+                         encoder: SparseOneHotEncoder = None):
+        """
+        Replace `column` by its one-hot columns.
+
+        With `sparse_output`, `max_categories` (top-K levels plus an "other" column), `hash_features` (hashing
+        trick with a fixed width) or a fitted `encoder`, the columns are built by SparseOneHotEncoder as
+        `pd.SparseDtype` columns, so memory scales with the rows instead of rows x levels. Otherwise they are
+        dense `pd.get_dummies` columns.
+        """
+        ColumnTypeValidators.check_column_existance(dataframe, column)
+        if encoder is None and (sparse_output or max_categories is not None or hash_features is not None):
+            encoder = SparseOneHotEncoder(max_categories, hash_features=hash_features).fit(dataframe[column])
+        if encoder is not None:
+            one_hot_encoded = encoder.transform_frame(dataframe[column])
+        else:
+            one_hot_encoded = pd.get_dummies(dataframe[column], prefix=column)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        del df_copy[column]
+        if self.execution_mode == ExecutionMode.INPLACE:
+            df_copy[one_hot_encoded.columns] = one_hot_encoded
+            return df_copy
+        # Sparse columns are one block each, joining them at once avoids a fragmented frame
+        return pd.concat([df_copy, one_hot_encoded], axis=1, copy=False)
+
     # -------------- SCALAR CONVERTIONS --------------
     @ColumnTypeValidators.numeric_required
     def standardize_data(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        scaler = StandardScaler()
-        scaled_data = scaler.fit_transform(dataframe[[column]])
-        df_copy = dataframe.copy()
-        df_copy[column] = scaled_data
-        return df_copy
+        return self.scale_columns(dataframe, [column], BatchScaler.Method.STANDARD)
 
     @ColumnTypeValidators.numeric_required
     def normalize_data(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        scaler = MinMaxScaler()
-        scaled_data = scaler.fit_transform(dataframe[[column]])
-        df_copy = dataframe.copy()
-        df_copy[column] = scaled_data
+        return self.scale_columns(dataframe, [column], BatchScaler.Method.MINMAX)
+
+    def scale_columns(self, dataframe: pd.DataFrame, columns: list,
+                      method: BatchScaler.Method = BatchScaler.Method.STANDARD, scaler: BatchScaler = None,
+                      dtype=np.float64):
+        """
+        Standardize, min-max or robust scale several columns in one vectorized pass, see BatchScaler.
+
+        Pass a fitted `scaler` (from `fit`, `partial_fit` or `fit_scaler_streaming`) to reuse its parameters on a
+        new batch; otherwise one is fitted on `columns`.
+        """
+        for column in columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+            if not pd.api.types.is_numeric_dtype(dataframe[column]):
+                raise ValueError(f"Column '{column}' must be of numeric type.")
+        if scaler is None:
+            scaler = BatchScaler(method, dtype).fit(dataframe, columns)
+        scaled = scaler.transform(dataframe)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[scaler.columns_] = scaled
         return df_copy
 
+    def fit_scaler_streaming(self, path: str, columns: list,
+                             method: BatchScaler.Method = BatchScaler.Method.STANDARD, dtype=np.float64,
+                             chunksize: int = 100_000, **read_csv_kwargs) -> BatchScaler:
+        """Fit a BatchScaler on `columns` of a CSV file read chunk by chunk, without loading the whole file."""
+        scaler = BatchScaler(method, dtype)
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize, **read_csv_kwargs):
+            scaler.partial_fit(chunk, columns)
+        return scaler
+
     @ColumnTypeValidators.numeric_required
     def normalize_vectors(self, dataframe: pd.DataFrame, column: Union[str, int]):
         norm = np.linalg.norm(dataframe[column], axis=1)
         normalized_data = dataframe[column].div(norm, axis=0)
         return pd.DataFrame(normalized_data, columns=dataframe.columns)
+
+    # -------------- POWER TRANSFORMS --------------
+    def power_transform(self, dataframe: pd.DataFrame, columns: list,
+                        method: ColumnPowerTransformer.Method = ColumnPowerTransformer.Method.YEO_JOHNSON,
+                        transformer: ColumnPowerTransformer = None, dtype=np.float64):
+        """
+        Apply a log / log1p / sqrt / Box-Cox / Yeo-Johnson transform to several columns in one vectorized pass.
+
+        Pass a fitted `transformer` to reuse its lambdas on a later batch; otherwise one is fitted on `columns`.
+        Keep the fitted transformer (ColumnPowerTransformer(method).fit(...)) to map results back with
+        `inverse_power_transform`.
+        """
+        for column in columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+            if not pd.api.types.is_numeric_dtype(dataframe[column]):
+                raise ValueError(f"Column '{column}' must be of numeric type.")
+        if transformer is None:
+            transformer = ColumnPowerTransformer(method, dtype).fit(dataframe, columns)
+        transformed = transformer.transform(dataframe)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[transformer.columns_] = transformed
+        return df_copy
+
+    def inverse_power_transform(self, dataframe: pd.DataFrame, transformer: ColumnPowerTransformer):
+        """Map the columns of a fitted `transformer` back to their original scale."""
+        restored = transformer.inverse_transform(dataframe)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[transformer.columns_] = restored
+        return df_copy
+
+    # -------------- MEMORY --------------
+    def compact_dtypes(self, dataframe: pd.DataFrame, columns: list = None, category_threshold: float = 0.5,
+                       integral_floats: bool = True, lossy_floats: bool = False,
+                       backend: DtypeBackend = DtypeBackend.NUMPY, return_report: bool = False):
+        """
+        Store every column in the smallest dtype that holds its values.
+
+        Arithmetic on narrowed integer columns can overflow silently (int8 100 - (-100) wraps), and writing
+        float64 values into float32 columns upcasts them: cast back with `astype` before such computations.
+
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame to compact.
+        columns : list, optional
+            Columns to compact, all of them by default.
+        category_threshold : float, default 0.5
+            String columns whose distinct values make up at most this share of their non-missing values become
+            'category'. None keeps strings as they are (or as string dtypes with NULLABLE / PYARROW).
+        integral_floats : bool, default True
+            Float columns holding whole numbers only become integers. With the NUMPY backend this only applies
+            to columns without missing values, the other backends have a missing marker for integers.
+        lossy_floats : bool, default False
+            Downcast floats to float32 whenever they are in its range. By default only columns whose values are
+            all exactly representable in float32 are downcast.
+        backend : DtypeBackend, default NUMPY
+            NUMPY: numpy dtypes. NULLABLE: pandas masked dtypes ('Int8', 'Float32', 'string', ...). PYARROW:
+            Arrow-backed dtypes ('int8[pyarrow]', 'string[pyarrow]', ...), which requires pyarrow.
+        return_report : bool, default False
+            Also return the per-column report: dtype and memory (deep, in bytes) before and after.
+
+        Returns:
+        -------
+        pd.DataFrame
+            The compacted DataFrame, followed by the report when `return_report` is True.
+        """
+        if backend == self.DtypeBackend.PYARROW and importlib.util.find_spec('pyarrow') is None:
+            raise ValueError("The PYARROW backend requires the 'pyarrow' package.")
+        columns = list(dataframe.columns) if columns is None else list(columns)
+        for column in columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+
+        before = dataframe[columns].memory_usage(index=False, deep=True)
+        before_dtypes = dataframe[columns].dtypes.astype(str)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        for column in columns:
+            dtype = self._compact_dtype(df_copy[column], category_threshold, integral_floats, lossy_floats, backend)
+            if dtype is not None:
+                df_copy[column] = df_copy[column].astype(dtype)
+
+        if not return_report:
+            return df_copy
+        after = df_copy[columns].memory_usage(index=False, deep=True)
+        report = pd.DataFrame({'dtype_before': before_dtypes, 'dtype_after': df_copy[columns].dtypes.astype(str),
+                               'bytes_before': before, 'bytes_after': after, 'bytes_saved': before - after})
+        return df_copy, report
+
+    # Signed only: on unsigned dtypes any negative intermediate result wraps around. Narrow signed dtypes still
+    # overflow silently in arithmetic (int8 100 - (-100)), so compaction is meant for storage and transfer.
+    _INTEGER_DTYPES = [np.dtype(dtype) for dtype in (np.int8, np.int16, np.int32, np.int64)]
+    _NULLABLE_NAMES = {'int8': 'Int8', 'int16': 'Int16', 'int32': 'Int32', 'int64': 'Int64', 'uint8': 'UInt8',
+                       'uint16': 'UInt16', 'uint32': 'UInt32', 'uint64': 'UInt64', 'float32': 'Float32',
+                       'float64': 'Float64'}
+
+    def _compact_dtype(self, series: pd.Series, category_threshold, integral_floats, lossy_floats, backend):
+        """Target dtype of one column, or None to leave it unchanged."""
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iuf':
+            values = series.to_numpy()
+            missing = np.isnan(values) if values.dtype.kind == 'f' else None
+            present = values if missing is None else values[~missing]
+            if present.size == 0:
+                return None
+            low, high = present.min(), present.max()
+            if values.dtype.kind == 'f':
+                integral = (integral_floats and np.isfinite(low) and np.isfinite(high) and low >= -2 ** 63
+                            and high < 2 ** 63 and (backend != self.DtypeBackend.NUMPY or not missing.any())
+                            and bool((present == np.floor(present)).all()))
+                if not integral:
+                    if values.dtype == np.float32:
+                        target = values.dtype
+                    elif lossy_floats:
+                        finite = present[np.isfinite(present)]
+                        fits = finite.size == 0 or np.abs(finite).max() <= np.finfo(np.float32).max
+                        target = np.dtype(np.float32) if fits else values.dtype
+                    else:
+                        exact = (present.astype(np.float32).astype(values.dtype) == present).all()
+                        target = np.dtype(np.float32) if exact else values.dtype
+                    return self._backend_dtype(target, series.dtype, backend)
+            # Range-checked: the first integer dtype whose bounds contain [low, high]
+            for target in self._INTEGER_DTYPES:
+                info = np.iinfo(target)
+                if info.min <= low and high <= info.max:
+                    return self._backend_dtype(target, series.dtype, backend)
+            return None
+
+        if pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+            if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+                return None
+            non_missing = series.count()
+            if category_threshold is not None and non_missing and \
+                    series.nunique(dropna=True) <= category_threshold * non_missing:
+                return 'category'
+            if backend == self.DtypeBackend.NULLABLE:
+                return 'string'
+            if backend == self.DtypeBackend.PYARROW:
+                return 'string[pyarrow]'
+        return None
+
+    def _backend_dtype(self, target: np.dtype, current, backend):
+        if backend == self.DtypeBackend.NULLABLE:
+            return self._NULLABLE_NAMES[target.name]
+        if backend == self.DtypeBackend.PYARROW:
+            return f"{target.name}[pyarrow]"
+        return target if target.itemsize < current.itemsize else None
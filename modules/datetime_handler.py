@@ -3,15 +3,16 @@ import pytz
 from datetime import datetime, timedelta
 from typing import Union
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.execution import ExecutionMode, working_frame
 
 class DatetimeHandler:
     
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
 
     def convert_to_datetime(self, dataframe: pd.DataFrame, column: Union[str, int], format: str = '%Y-%m-%d %H:%M:%S'):
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = pd.to_datetime(dataframe[column], format=format, errors='coerce')
         return df_copy
 
@@ -24,7 +25,7 @@ class DatetimeHandler:
             except:
                 return pd.NaT
 
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column].apply(correct_date)
         return df_copy
     
@@ -32,35 +33,35 @@ class DatetimeHandler:
     def extract_components(self, dataframe: pd.DataFrame, column: Union[str, int]) -> pd.DataFrame:
         '''Extract date components (year, month, day, hour, minute, second) into separate columns.'''
         
-        df_copy = dataframe.copy()
-        df_copy['year'] = dataframe.iloc[:, column].dt.year
-        df_copy['month'] = dataframe.iloc[:, column].dt.month
-        df_copy['day'] = dataframe.iloc[:, column].dt.day
-        df_copy['hour'] = dataframe.iloc[:, column].dt.hour
-        df_copy['minute'] = dataframe.iloc[:, column].dt.minute
-        df_copy['second'] = dataframe.iloc[:, column].dt.second
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy['year'] = dataframe[column].dt.year
+        df_copy['month'] = dataframe[column].dt.month
+        df_copy['day'] = dataframe[column].dt.day
+        df_copy['hour'] = dataframe[column].dt.hour
+        df_copy['minute'] = dataframe[column].dt.minute
+        df_copy['second'] = dataframe[column].dt.second
         return df_copy
 
     @ColumnTypeValidators.datetime_required
     def reformat_date(self, dataframe: pd.DataFrame, column: Union[str, int]) -> pd.DataFrame:
         '''Reformat the datetime objects in the specified column to a different string format.'''
         
-        df_copy = dataframe.copy()
-        df_copy.iloc[:, column] = df_copy.iloc[:, column].apply(lambda x: x.strftime('%d-%m-%Y %H:%M:%S') if pd.notnull(x) else x)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = df_copy[column].apply(lambda x: x.strftime('%d-%m-%Y %H:%M:%S') if pd.notnull(x) else x)
         return df_copy
 
     @ColumnTypeValidators.datetime_required
     def calculate_datetime_differences(self, dataframe: pd.DataFrame, column: Union[str, int]) -> pd.DataFrame:
         '''Calculate the difference between consecutive datetime entries in the specified column.'''
-        df_copy = dataframe.copy()
-        df_copy['time_diff'] = df_copy.iloc[:, column].diff().dt.total_seconds()
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy['time_diff'] = df_copy[column].diff().dt.total_seconds()
         return df_copy
 
     @ColumnTypeValidators.datetime_required
     def convert_datetime_to_different_timezones(self, dataframe: pd.DataFrame, column: Union[str, int], from_tz='UTC', to_tz='America/New_York') -> pd.DataFrame:
         '''Convert datetime objects from one timezone to another.'''
         
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         from_zone = pytz.timezone(from_tz)
         to_zone = pytz.timezone(to_tz)
         def convert_timezone(dt):
@@ -68,14 +69,14 @@ class DatetimeHandler:
                 dt = from_zone.localize(dt) if dt.tzinfo is None else dt
                 return dt.astimezone(to_zone)
             return dt
-        df_copy.iloc[:, column] = df_copy.iloc[:, column].apply(convert_timezone)
+        df_copy[column] = df_copy[column].apply(convert_timezone)
         return df_copy
 
     @ColumnTypeValidators.datetime_required
     def shift_time(self, dataframe: pd.DataFrame, column: Union[str, int], shift_value=1, unit='days') -> pd.DataFrame:
         '''Shift the datetime values in the specified column by a given amount.'''
         
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column] + pd.to_timedelta(shift_value, unit=unit)
         return df_copy
     
@@ -83,13 +84,13 @@ class DatetimeHandler:
     @ColumnTypeValidators.datetime_required
     def moving_average(self, dataframe: pd.DataFrame, column: Union[str, int], window: int = 3) -> pd.DataFrame:
         '''Calculate the moving average of a datetime series over a specified window.'''
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[f'{column}_moving_avg'] = df_copy[column].rolling(window=window).mean()
         return df_copy
     
     @ColumnTypeValidators.datetime_required
     def exponential_smoothing(self, dataframe: pd.DataFrame, column: Union[str, int], alpha: float = 0.5) -> pd.DataFrame:
         '''Apply exponential smoothing to a datetime series.'''
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[f'{column}_exp_smooth'] = df_copy[column].ewm(alpha=alpha).mean()
         return df_copy
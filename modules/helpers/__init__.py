@@ -1,3 +1,17 @@
 __all__ = [
     "validators",
+    "execution",
+    "fingerprint",
+    "missing_patterns",
+    "gmm_imputer",
+    "parallel",
+    "sketches",
+    "mice_imputer",
+    "outlier_mask",
+    "model_cache",
+    "column_profile",
+    "power_transformer",
+    "categorical_encoder",
+    "one_hot_encoder",
+    "batch_scaler",
 ]
\ No newline at end of file
@@ -0,0 +1,92 @@
+from enum import Enum
+import numpy as np
+import pandas as pd
+
+from modules.helpers.sketches import RunningMoments, KLLSketch
+
+
+class BatchScaler:
+    """
+    Standard, min-max or robust scaling of many columns at once as one vectorized pass over the 2-D block.
+
+    The fitted `center_` and `scale_` (Series indexed by column) give x' = (x - center) / scale:
+
+    - STANDARD: mean and population std (sklearn's StandardScaler).
+    - MINMAX: min and max - min (sklearn's MinMaxScaler with the (0, 1) range).
+    - ROBUST: median and interquartile range (sklearn's RobustScaler).
+
+    Zero scales are replaced by 1 and missing values are ignored when fitting and kept when transforming. `fit`
+    is exact. `partial_fit` accumulates batches (e.g. CSV chunks) without keeping them: moments and extremes are
+    merged exactly, robust quartiles come from a KLL sketch of `sketch_size` items per column (rank error about
+    1.65% at the default). `dtype` sets the output precision, e.g. np.float32 to halve memory.
+    """
+
+    class Method(Enum):
+        STANDARD = 0
+        MINMAX = 1
+        ROBUST = 2
+
+    def __init__(self, method: Method = Method.STANDARD, dtype=np.float64, sketch_size: int = 200) -> None:
+        self.method = method
+        self.dtype = np.dtype(dtype)
+        self.sketch_size = sketch_size
+        self.columns_ = None
+        self.center_ = None
+        self.scale_ = None
+        self._states = None
+
+    def fit(self, dataframe: pd.DataFrame, columns: list = None) -> "BatchScaler":
+        self.columns_ = list(dataframe.columns) if columns is None else list(columns)
+        values = dataframe[self.columns_].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'):
+            if self.method == self.Method.STANDARD:
+                center, scale = np.nanmean(values, axis=0), np.nanstd(values, axis=0)
+            elif self.method == self.Method.MINMAX:
+                center = np.nanmin(values, axis=0)
+                scale = np.nanmax(values, axis=0) - center
+            else:
+                q1, center, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+                scale = q3 - q1
+        self._states = None
+        self._set_params(center, scale)
+        return self
+
+    def partial_fit(self, dataframe: pd.DataFrame, columns: list = None) -> "BatchScaler":
+        if self._states is None:
+            self.columns_ = list(dataframe.columns) if columns is None else list(columns)
+            if self.method == self.Method.ROBUST:
+                self._states = [KLLSketch(self.sketch_size) for _ in self.columns_]
+            else:
+                self._states = [RunningMoments() for _ in self.columns_]
+        values = dataframe[self.columns_].to_numpy(dtype=float)
+        for position, state in enumerate(self._states):
+            state.update(values[:, position])
+
+        if self.method == self.Method.STANDARD:
+            center = np.array([state.mean if state.count else np.nan for state in self._states])
+            scale = np.array([np.sqrt(state.m2 / state.count) if state.count else np.nan for state in self._states])
+        elif self.method == self.Method.MINMAX:
+            center = np.array([state.min if state.count else np.nan for state in self._states])
+            scale = np.array([state.max if state.count else np.nan for state in self._states]) - center
+        else:
+            q1, center, q3 = np.array([state.quantile([0.25, 0.5, 0.75]) for state in self._states]).T
+            scale = q3 - q1
+        self._set_params(center, scale)
+        return self
+
+    def _set_params(self, center: np.ndarray, scale: np.ndarray):
+        self.center_ = pd.Series(center, index=self.columns_)
+        self.scale_ = pd.Series(np.where(scale == 0, 1.0, scale), index=self.columns_)
+
+    def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        values = dataframe[self.columns_].to_numpy(dtype=self.dtype)
+        result = (values - self.center_.to_numpy(dtype=self.dtype)) / self.scale_.to_numpy(dtype=self.dtype)
+        return pd.DataFrame(result, index=dataframe.index, columns=self.columns_)
+
+    def inverse_transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        values = dataframe[self.columns_].to_numpy(dtype=self.dtype)
+        result = values * self.scale_.to_numpy(dtype=self.dtype) + self.center_.to_numpy(dtype=self.dtype)
+        return pd.DataFrame(result, index=dataframe.index, columns=self.columns_)
+
+    def fit_transform(self, dataframe: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        return self.fit(dataframe, columns).transform(dataframe)
@@ -0,0 +1,92 @@
+import pickle
+from enum import Enum
+import numpy as np
+import pandas as pd
+
+
+class CategoricalEncoder:
+    """
+    Label encoding of many columns with vocabularies that are fitted once and reused.
+
+    A vocabulary is the sorted set of distinct non-missing values (LabelEncoder's ordering), gathered by hashing
+    (`pd.unique`), so fitting costs O(n) plus a sort of the distinct values only. Columns listed together in a
+    group of `shared` (e.g. ['ORIGIN_CITY', 'DEST_CITY']) get one common vocabulary, so equal values get equal
+    codes. Codes are looked up through a hash index and stored in the smallest signed integer dtype that fits
+    the vocabulary.
+
+    Missing values and, with `unknown=Unknown.MISSING`, values absent from the vocabulary are encoded as -1.
+    `unknown=Unknown.ERROR` raises instead. Vocabularies are pickled with `save` and reloaded with `load`, so
+    later files get the same codes.
+    """
+
+    class Unknown(Enum):
+        ERROR = 0
+        MISSING = 1
+
+    def __init__(self, unknown: Unknown = Unknown.MISSING) -> None:
+        self.unknown = unknown
+        self.vocabularies_ = {}
+
+    def fit(self, dataframe: pd.DataFrame, columns: list = None, shared: list = None) -> "CategoricalEncoder":
+        groups = [list(group) for group in shared or []]
+        grouped = {column for group in groups for column in group}
+        columns = list(dataframe.columns) if columns is None else list(columns)
+        groups += [[column] for column in columns if column not in grouped]
+
+        for group in groups:
+            distinct = pd.unique(np.concatenate([pd.unique(dataframe[column].to_numpy()) for column in group]))
+            vocabulary = pd.Index(distinct).dropna().sort_values()
+            for column in group:
+                self.vocabularies_[column] = vocabulary
+        return self
+
+    def transform(self, dataframe: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        columns = list(self.vocabularies_) if columns is None else list(columns)
+        encoded = {}
+        for column in columns:
+            vocabulary = self._vocabulary(column)
+            codes = vocabulary.get_indexer(dataframe[column])
+            if self.unknown == self.Unknown.ERROR:
+                unseen = (codes == -1) & dataframe[column].notna().to_numpy()
+                if unseen.any():
+                    values = dataframe[column][unseen].unique()[:5].tolist()
+                    raise ValueError(f"Column '{column}' has values missing from its vocabulary: {values}.")
+            encoded[column] = codes.astype(self.code_dtype(len(vocabulary)), copy=False)
+        return pd.DataFrame(encoded, index=dataframe.index)
+
+    def fit_transform(self, dataframe: pd.DataFrame, columns: list = None, shared: list = None) -> pd.DataFrame:
+        return self.fit(dataframe, columns, shared).transform(dataframe, columns)
+
+    def inverse_transform(self, dataframe: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        columns = list(self.vocabularies_) if columns is None else list(columns)
+        decoded = {}
+        for column in columns:
+            codes = dataframe[column].to_numpy()
+            decoded[column] = pd.Categorical.from_codes(codes, categories=self._vocabulary(column))
+        return pd.DataFrame(decoded, index=dataframe.index)
+
+    def _vocabulary(self, column) -> pd.Index:
+        if column not in self.vocabularies_:
+            raise ValueError(f"Column '{column}' has no fitted vocabulary.")
+        # Shared vocabularies are one Index object, so its hash table is built once for the whole group
+        return self.vocabularies_[column]
+
+    @staticmethod
+    def code_dtype(size: int) -> np.dtype:
+        """Smallest signed integer dtype holding the codes 0..size-1 and the -1 marker."""
+        for dtype in (np.int8, np.int16, np.int32):
+            if size <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+
+    def save(self, path: str) -> None:
+        # Pickle keeps object identity, so shared vocabularies are stored once and shared again after `load`
+        with open(path, 'wb') as file:
+            pickle.dump(self.vocabularies_, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str, unknown: Unknown = Unknown.MISSING) -> "CategoricalEncoder":
+        encoder = cls(unknown)
+        with open(path, 'rb') as file:
+            encoder.vocabularies_ = pickle.load(file)
+        return encoder
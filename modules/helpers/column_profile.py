@@ -0,0 +1,98 @@
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from modules.helpers.fingerprint import content_fingerprint
+
+
+class ColumnProfile:
+    """Moments, quartiles and normality test results of the non-missing values of one column version."""
+
+    def __init__(self, values: np.ndarray, missing_count: int) -> None:
+        self.count = len(values)
+        self.missing_count = missing_count
+        if self.count:
+            self.mean = float(values.mean())
+            self.std = float(values.std(ddof=1)) if self.count > 1 else np.nan
+            self.min = float(values.min())
+            self.max = float(values.max())
+            self.q1, self.median, self.q3 = (float(q) for q in np.quantile(values, [0.25, 0.5, 0.75]))
+        else:
+            self.mean = self.std = self.min = self.max = np.nan
+            self.q1 = self.median = self.q3 = np.nan
+        self.tests = {}
+
+    def iqr_bounds(self, threshold: float = 1.5) -> tuple:
+        iqr = self.q3 - self.q1
+        return self.q1 - threshold * iqr, self.q3 + threshold * iqr
+
+    def zscore_bounds(self, threshold: float = 3) -> tuple:
+        """Bounds of |z| <= threshold, z being computed with the population std like `scipy.stats.zscore`."""
+        population_std = self.std * np.sqrt((self.count - 1) / self.count) if self.count > 1 else 0.0
+        return self.mean - threshold * population_std, self.mean + threshold * population_std
+
+
+class ColumnProfileCache:
+    """
+    Shared cache of column profiles, so the moments, quartiles and normality of a column are computed once.
+
+    Profiles are keyed by a content digest of the column, which is one cheap O(n) read: a column keeps its
+    profile until its values change, however it is mutated (`df[column] = ...`, `.loc` writes or
+    `inplace=True`), and identical columns share one profile. Normality tests are run lazily, once per test and
+    column version, always on the non-missing values:
+
+    - 'shapiro': Shapiro-Wilk.
+    - 'kstest': Kolmogorov-Smirnov against the standard normal law.
+    - 'kstest_fitted': Kolmogorov-Smirnov against a normal law with the column's mean and std.
+    - 'normaltest': D'Agostino and Pearson's K2.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._profiles = OrderedDict()
+
+    def _lookup(self, series: pd.Series) -> tuple:
+        values = series.to_numpy(dtype=float)
+        key = content_fingerprint(values)
+        profile = self._profiles.get(key)
+        if profile is None:
+            missing = np.isnan(values)
+            profile = ColumnProfile(values[~missing], int(missing.sum()))
+            self._profiles[key] = profile
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+        else:
+            self._profiles.move_to_end(key)
+        return profile, values
+
+    def profile(self, series: pd.Series) -> ColumnProfile:
+        """Profile of a numeric (or boolean) series."""
+        return self._lookup(series)[0]
+
+    def normality_test(self, series: pd.Series, test: str = 'shapiro') -> tuple:
+        """(statistic, p_value) of a normality test, see the class docstring for the test names."""
+        profile, values = self._lookup(series)
+        if test not in profile.tests:
+            values = values[~np.isnan(values)]
+            if test == 'shapiro':
+                result = stats.shapiro(values)
+            elif test == 'kstest':
+                result = stats.kstest(values, 'norm')
+            elif test == 'kstest_fitted':
+                result = stats.kstest(values, 'norm', args=(profile.mean, profile.std))
+            elif test == 'normaltest':
+                result = stats.normaltest(values)
+            else:
+                raise ValueError(f"Unknown normality test '{test}'.")
+            profile.tests[test] = (float(result[0]), float(result[1]))
+        return profile.tests[test]
+
+    def is_normal(self, series: pd.Series, test: str = 'shapiro', alpha: float = 0.05) -> bool:
+        return self.normality_test(series, test)[1] > alpha
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+
+shared_profile_cache = ColumnProfileCache()
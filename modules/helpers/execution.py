@@ -0,0 +1,35 @@
+from enum import Enum
+import pandas as pd
+
+
+class ExecutionMode(Enum):
+    """How a transformer treats the DataFrame it receives."""
+    COPY = 0
+    COLUMN_COPY = 1
+    INPLACE = 2
+
+
+def working_frame(dataframe: pd.DataFrame, mode: ExecutionMode = ExecutionMode.COPY) -> pd.DataFrame:
+    """
+    Return the frame a transformer method should write into.
+
+    Parameters:
+    ----------
+    dataframe : pd.DataFrame
+        The frame passed by the caller.
+    mode : ExecutionMode, default COPY
+        COPY: deep copy of the whole frame (the historical behaviour).
+        COLUMN_COPY: shallow copy sharing every column buffer with the input. Writes must replace whole
+        columns (`frame[column] = ...` or `del frame[column]`), never go through `.loc`/`.iloc` or
+        `inplace=True`, so only the columns that actually change get new arrays.
+        INPLACE: the input frame itself.
+
+    Returns:
+    -------
+    pd.DataFrame
+    """
+    if mode == ExecutionMode.INPLACE:
+        return dataframe
+    if mode == ExecutionMode.COLUMN_COPY:
+        return dataframe.copy(deep=False)
+    return dataframe.copy()
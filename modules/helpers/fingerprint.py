@@ -0,0 +1,38 @@
+import hashlib
+import numpy as np
+import pandas as pd
+
+
+def column_fingerprint(series: pd.Series) -> tuple:
+    """
+    Cheap identity of the data behind a column: dtype, length and the address of its buffer.
+
+    It changes whenever the column is replaced (`df[column] = ...`, which always allocates a new array) but, being
+    O(1), it can not see cells written in place through `.loc`/`.iloc` or `inplace=True`.
+    """
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy(copy=False)
+        address = (values.__array_interface__['data'][0], values.strides)
+    else:
+        address = id(series.array)
+    return str(series.dtype), len(series), address
+
+
+def frame_fingerprint(dataframe: pd.DataFrame) -> tuple:
+    """Column labels, shape and the fingerprint of every column."""
+    return (tuple(dataframe.columns), dataframe.shape,
+            tuple(column_fingerprint(dataframe.iloc[:, position]) for position in range(dataframe.shape[1])))
+
+
+def content_fingerprint(values: np.ndarray) -> str:
+    """
+    Digest of the dtype, shape and bytes of a numeric array.
+
+    Unlike `column_fingerprint` it reads every value (O(n)), but it sees in-place writes and is stable across
+    sessions, so it can key caches persisted on disk.
+    """
+    values = np.ascontiguousarray(values)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{values.dtype}{values.shape}".encode())
+    digest.update(values.data)
+    return digest.hexdigest()
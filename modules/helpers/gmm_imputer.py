@@ -0,0 +1,172 @@
+from typing import Union
+import numpy as np
+import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
+from scipy.special import logsumexp
+from sklearn.mixture import GaussianMixture
+
+from modules.helpers.missing_patterns import group_missing_patterns
+
+
+class GaussianMixtureImputer:
+    """
+    EM for a full-covariance Gaussian mixture fitted directly on incomplete data.
+
+    Every iteration computes the responsibilities of each row once, from the marginal density of its observed
+    values, and derives the conditional mean E[x_missing | x_observed] of every component with one Cholesky
+    solve per missingness pattern. Missing values are imputed with the responsibility-weighted conditional mean.
+
+    With `batch_size` set, rows are streamed through the E-step in chunks of that size and only the sufficient
+    statistics are accumulated, so the working memory is bounded by the chunk and not by the number of rows.
+    The initial parameters are then fitted on a random sample of `batch_size` rows.
+    """
+
+    def __init__(self, n_components: int = 3, max_iter: int = 100, tol: float = 1e-4, batch_size: int = None,
+                 reg_covar: float = 1e-6, random_state: int = 42) -> None:
+        self.n_components = n_components
+        self.max_iter = max_iter
+        self.tol = tol
+        self.batch_size = batch_size
+        self.reg_covar = reg_covar
+        self.random_state = random_state
+
+        self.weights_ = None
+        self.means_ = None
+        self.covariances_ = None
+        self.n_iter_ = 0
+        self.converged_ = False
+        self.log_likelihood_ = -np.inf
+
+    def fit(self, data: Union[pd.DataFrame, np.ndarray]):
+        self._initialize(data)
+        n_features = data.shape[1]
+
+        for iteration in range(1, self.max_iter + 1):
+            statistics = {
+                'counts': np.zeros(self.n_components),
+                'sums': np.zeros((self.n_components, n_features)),
+                'squares': np.zeros((self.n_components, n_features, n_features)),
+            }
+            log_likelihood = 0.0
+            for _, chunk in self._chunks(data):
+                _, chunk_log_likelihood = self._expectation(chunk, statistics)
+                log_likelihood += chunk_log_likelihood
+            log_likelihood /= data.shape[0]
+            self._maximization(statistics)
+
+            self.n_iter_ = iteration
+            change = log_likelihood - self.log_likelihood_
+            self.log_likelihood_ = log_likelihood
+            if abs(change) < self.tol:
+                self.converged_ = True
+                break
+        return self
+
+    def transform(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        imputed = np.empty(data.shape, dtype=float)
+        for start, chunk in self._chunks(data):
+            imputed[start:start + len(chunk)], _ = self._expectation(chunk)
+        return imputed
+
+    def fit_transform(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        return self.fit(data).transform(data)
+
+    def _chunks(self, data: Union[pd.DataFrame, np.ndarray]):
+        n_rows = data.shape[0]
+        step = self.batch_size or n_rows
+        for start in range(0, n_rows, step):
+            if isinstance(data, pd.DataFrame):
+                yield start, data.iloc[start:start + step].to_numpy(dtype=float, copy=True)
+            else:
+                yield start, np.array(data[start:start + step], dtype=float)
+
+    def _initialize(self, data: Union[pd.DataFrame, np.ndarray]):
+        n_rows = data.shape[0]
+        if self.batch_size and n_rows > self.batch_size:
+            rng = np.random.default_rng(self.random_state)
+            rows = np.sort(rng.choice(n_rows, self.batch_size, replace=False))
+            sample = data.iloc[rows] if isinstance(data, pd.DataFrame) else data[rows]
+        else:
+            sample = data
+        sample = np.array(sample, dtype=float)
+
+        complete = sample[~np.isnan(sample).any(axis=1)]
+        if len(complete) >= 10 * self.n_components:
+            start_data = complete
+        else:
+            start_data = np.where(np.isnan(sample), np.nanmean(sample, axis=0), sample)
+
+        gmm = GaussianMixture(n_components=self.n_components, covariance_type='full', reg_covar=self.reg_covar,
+                              random_state=self.random_state)
+        gmm.fit(start_data)
+        self.weights_ = gmm.weights_
+        self.means_ = gmm.means_
+        self.covariances_ = gmm.covariances_
+        self.n_iter_ = 0
+        self.converged_ = False
+        self.log_likelihood_ = -np.inf
+
+    def _expectation(self, chunk: np.ndarray, statistics: dict = None):
+        """Impute one chunk with the current parameters and optionally accumulate its sufficient statistics."""
+        imputed = chunk.copy()
+        log_likelihood = 0.0
+        log_weights = np.log(self.weights_)
+
+        for pattern, rows in group_missing_patterns(np.isnan(chunk), include_complete=True):
+            observed = np.flatnonzero(~pattern)
+            missing = np.flatnonzero(pattern)
+            x_observed = chunk[np.ix_(rows, observed)]
+
+            log_prob = np.empty((len(rows), self.n_components))
+            component_values = np.empty((self.n_components, len(rows), chunk.shape[1]))
+            conditional_covariances = []
+            for k in range(self.n_components):
+                mean, covariance = self.means_[k], self.covariances_[k]
+                component_values[k][:, observed] = x_observed
+                if observed.size == 0:
+                    log_prob[:, k] = log_weights[k]
+                    component_values[k][:, missing] = mean[missing]
+                    conditional_covariances.append(covariance)
+                    continue
+
+                factor = cho_factor(covariance[np.ix_(observed, observed)], lower=True)
+                centered = x_observed - mean[observed]
+                solved = cho_solve(factor, centered.T)
+                log_det = 2 * np.log(np.diag(factor[0])).sum()
+                mahalanobis = np.einsum('ij,ji->i', centered, solved)
+                log_prob[:, k] = log_weights[k] - 0.5 * (observed.size * np.log(2 * np.pi) + log_det + mahalanobis)
+
+                if missing.size:
+                    cross = covariance[np.ix_(missing, observed)]
+                    component_values[k][:, missing] = mean[missing] + (cross @ solved).T
+                    conditional_covariances.append(covariance[np.ix_(missing, missing)]
+                                                   - cross @ cho_solve(factor, cross.T))
+                else:
+                    conditional_covariances.append(None)
+
+            row_log_likelihood = logsumexp(log_prob, axis=1)
+            responsibilities = np.exp(log_prob - row_log_likelihood[:, None])
+            log_likelihood += row_log_likelihood.sum()
+
+            if missing.size:
+                imputed[np.ix_(rows, missing)] = np.einsum('ik,kij->ij', responsibilities,
+                                                           component_values[:, :, missing])
+            if statistics is not None:
+                for k in range(self.n_components):
+                    weights = responsibilities[:, k]
+                    total = weights.sum()
+                    statistics['counts'][k] += total
+                    statistics['sums'][k] += weights @ component_values[k]
+                    statistics['squares'][k] += (component_values[k] * weights[:, None]).T @ component_values[k]
+                    if missing.size:
+                        statistics['squares'][k][np.ix_(missing, missing)] += total * conditional_covariances[k]
+
+        return imputed, log_likelihood
+
+    def _maximization(self, statistics: dict):
+        counts = np.maximum(statistics['counts'], 10 * np.finfo(float).eps)
+        self.weights_ = counts / counts.sum()
+        self.means_ = statistics['sums'] / counts[:, None]
+        self.covariances_ = (statistics['squares'] / counts[:, None, None]
+                             - np.einsum('ki,kj->kij', self.means_, self.means_))
+        self.covariances_ += self.reg_covar * np.eye(self.means_.shape[1])
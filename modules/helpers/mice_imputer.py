@@ -0,0 +1,157 @@
+import time
+from typing import Union
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.linear_model import BayesianRidge
+
+from modules.helpers.parallel import map_in_processes
+
+
+class ParallelMICEImputer:
+    """
+    Multiple imputation by chained equations, the imputations being drawn in parallel.
+
+    Every round regresses each incomplete column, in ascending order of missing values, on all other columns,
+    using the values already updated in the same round (a Gauss-Seidel sweep, as sklearn's IterativeImputer).
+    Updating the columns one after the other is what makes the chain converge when collinear columns are
+    missing together; a sweep updating all columns from the previous round oscillates.
+
+    The chain stops when the largest row-wise sum of absolute changes falls below `tol` times the largest
+    absolute observed value (IterativeImputer's criterion). With `subsample` set, each model is fitted on a random
+    subset of its observed rows (an int for a row count, a float for a fraction), which bounds the fitting cost on
+    very tall frames; predictions are still made for every missing row.
+
+    With `n_imputations` > 1, that many imputations are drawn from the converged chain, each by one more sweep
+    drawing every missing value from the posterior of its model (so the estimator must support `return_std`, like
+    BayesianRidge). The draws are independent, so they run across a process pool of `n_jobs` workers; they are
+    kept in `imputations_` and averaged. The chain itself is sequential by nature and always runs in the calling
+    process, so `n_jobs` only speeds up the draws.
+
+    Fitted attributes: `n_iter_`, `converged_`, `changes_` (scaled change per round) and `timings_` (seconds
+    per round) of the chain, and `imputations_`.
+    """
+
+    def __init__(self, max_iter: int = 10, tol: float = 1e-3, n_jobs: int = 1, subsample: Union[int, float] = None,
+                 estimator=None, random_state: int = 0, n_imputations: int = 1) -> None:
+        self.max_iter = max_iter
+        self.tol = tol
+        self.n_jobs = n_jobs
+        self.subsample = subsample
+        self.estimator = estimator
+        self.random_state = random_state
+        self.n_imputations = n_imputations
+
+        self.n_iter_ = 0
+        self.converged_ = False
+        self.changes_ = []
+        self.timings_ = []
+        self.imputations_ = []
+
+    def fit_transform(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        values = np.array(data, dtype=float)
+        missing = np.isnan(values)
+        estimator = self.estimator if self.estimator is not None else BayesianRidge()
+        initargs = (values, missing, estimator, self.max_iter, self.tol, self.subsample)
+
+        # The Gauss-Seidel chain converges first, serially and with IterativeImputer's early stopping
+        filled, self.changes_, self.timings_ = map_in_processes(_run_chain, [self.random_state],
+                                                                initializer=_init_worker, initargs=initargs,
+                                                                state=_mice_state)[0]
+        self.n_iter_ = len(self.changes_)
+        self.converged_ = bool(self.changes_) and self.changes_[-1] < self.tol
+        if self.n_imputations == 1:
+            self.imputations_ = [filled]
+            return filled
+
+        seeds = [None if self.random_state is None else self.random_state + draw + 1
+                 for draw in range(self.n_imputations)]
+        self.imputations_ = map_in_processes(_draw_imputation, seeds, n_jobs=self.n_jobs, initializer=_init_worker,
+                                             initargs=(filled,) + initargs[1:], state=_mice_state)
+        return np.mean(self.imputations_, axis=0)
+
+
+# -------------- PROCESS POOL WORKERS --------------
+_mice_state = {}
+
+
+def _init_worker(values: np.ndarray, missing: np.ndarray, estimator, max_iter: int, tol: float, subsample):
+    _mice_state['values'] = values
+    _mice_state['missing'] = missing
+    _mice_state['estimator'] = estimator
+    _mice_state['max_iter'] = max_iter
+    _mice_state['tol'] = tol
+    _mice_state['subsample'] = subsample
+
+
+def _run_chain(seed) -> tuple:
+    """The chained equations imputation: (imputed matrix, scaled change per round, seconds per round)."""
+    values, missing = _mice_state['values'], _mice_state['missing']
+    rng = np.random.default_rng(seed)
+
+    filled = values.copy()
+    observed_columns, targets = _column_order(missing)
+    filled[:, observed_columns] = np.where(missing[:, observed_columns],
+                                           np.nanmean(values[:, observed_columns], axis=0),
+                                           values[:, observed_columns])
+    scale = np.abs(values[~missing]).max() if (~missing).any() else 0.0
+
+    changes, timings = [], []
+    if not targets or observed_columns.size < 2:
+        return filled, changes, timings
+    for _ in range(_mice_state['max_iter']):
+        started = time.perf_counter()
+        previous = filled.copy()
+        _sweep(filled, missing, observed_columns, targets, False, rng)
+        # Largest row-wise sum of absolute changes, relative to the largest observed magnitude
+        change = np.abs(filled - previous).sum(axis=1).max()
+        changes.append(change / scale if scale > 0 else change)
+        timings.append(time.perf_counter() - started)
+        if changes[-1] < _mice_state['tol']:
+            break
+    return filled, changes, timings
+
+
+def _draw_imputation(seed) -> np.ndarray:
+    """One posterior sweep from the converged chain, installed as `values` by the initializer."""
+    filled = _mice_state['values'].copy()
+    missing = _mice_state['missing']
+    observed_columns, targets = _column_order(missing)
+    if targets and observed_columns.size >= 2:
+        _sweep(filled, missing, observed_columns, targets, True, np.random.default_rng(seed))
+    return filled
+
+
+def _column_order(missing: np.ndarray) -> tuple:
+    """Columns with observed values, and the incomplete ones among them in ascending missing count."""
+    observed_columns = np.flatnonzero(~missing.all(axis=0))
+    missing_counts = missing[:, observed_columns].sum(axis=0)
+    targets = observed_columns[np.argsort(missing_counts, kind='mergesort')]
+    return observed_columns, [column for column in targets if missing[:, column].any()]
+
+
+def _sweep(filled: np.ndarray, missing: np.ndarray, observed_columns: np.ndarray, targets: list,
+           sample_posterior: bool, rng: np.random.Generator):
+    for column in targets:
+        predictors = observed_columns[observed_columns != column]
+        filled[missing[:, column], column] = _impute_column(filled, missing, column, predictors, sample_posterior,
+                                                            rng)
+
+
+def _impute_column(filled: np.ndarray, missing: np.ndarray, column: int, predictors: np.ndarray,
+                   sample_posterior: bool, rng: np.random.Generator) -> np.ndarray:
+    """Fit the conditional model of one column on its observed rows and predict its missing rows."""
+    subsample = _mice_state['subsample']
+    train_rows = np.flatnonzero(~missing[:, column])
+    if subsample is not None:
+        size = int(subsample * len(train_rows)) if isinstance(subsample, float) else int(subsample)
+        if size < len(train_rows):
+            train_rows = np.sort(rng.choice(train_rows, max(size, 1), replace=False))
+    predict_rows = missing[:, column]
+
+    model = clone(_mice_state['estimator'])
+    model.fit(filled[np.ix_(train_rows, predictors)], filled[train_rows, column])
+    if not sample_posterior:
+        return model.predict(filled[predict_rows][:, predictors])
+    mean, std = model.predict(filled[predict_rows][:, predictors], return_std=True)
+    return rng.normal(mean, np.maximum(std, 1e-12))
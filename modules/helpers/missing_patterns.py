@@ -0,0 +1,30 @@
+import numpy as np
+
+
+def group_missing_patterns(missing_mask: np.ndarray, include_complete: bool = False) -> list:
+    """
+    Group row positions by missingness pattern.
+
+    Parameters:
+    ----------
+    missing_mask : np.ndarray
+        Boolean (rows x columns) matrix, True where a value is missing.
+    include_complete : bool, default False
+        Also return the group of rows without any missing value.
+
+    Returns:
+    -------
+    list
+        (pattern, row positions) pairs, one per distinct pattern. Row positions keep their original order.
+    """
+    if include_complete:
+        rows = np.arange(missing_mask.shape[0])
+    else:
+        rows = np.flatnonzero(missing_mask.any(axis=1))
+    if rows.size == 0:
+        return []
+    patterns, inverse = np.unique(missing_mask[rows], axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind='stable')
+    boundaries = np.cumsum(np.bincount(inverse, minlength=len(patterns)))[:-1]
+    return list(zip(patterns, np.split(rows[order], boundaries)))
@@ -0,0 +1,83 @@
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+
+class ModelCache:
+    """
+    LRU cache of fitted models.
+
+    At most `max_entries` models, and with `max_bytes` at most that many pickled bytes, are kept in memory, the
+    least recently used ones being evicted first; an entry larger than `max_bytes` on its own is not kept. Models
+    such as LocalOutlierFactor hold their whole training matrix, so a byte bound is what keeps a long-lived cache
+    from pinning memory. With a `directory`, every stored model is also pickled there under a digest of its key,
+    so evicted models and models fitted in earlier sessions are loaded back instead of being refitted. Keys must
+    be tuples of plain values (strings, numbers, tuples) whose repr is stable across sessions.
+    """
+
+    def __init__(self, max_entries: int = 32, directory: str = None, max_bytes: int = None) -> None:
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Pickled size of the entries kept in memory (only tracked with `max_bytes`)."""
+        return sum(self._sizes.values())
+
+    def _path(self, key: tuple) -> str:
+        return os.path.join(self.directory, hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest() + '.pkl')
+
+    def get(self, key: tuple):
+        """Return the value stored under `key`, or None."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), 'rb') as file:
+                payload = file.read()
+            value = pickle.loads(payload)
+            self._remember(key, value, len(payload))
+            return value
+        return None
+
+    def put(self, key: tuple, value) -> None:
+        payload = None
+        if self.directory is not None or self.max_bytes is not None:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, value, None if payload is None else len(payload))
+        if self.directory is not None:
+            with open(self._path(key), 'wb') as file:
+                file.write(payload)
+
+    def _remember(self, key: tuple, value, size: int = None) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Too large to ever fit: keeping it would only flush every other entry
+            self._entries.pop(key, None)
+            self._sizes.pop(key, None)
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.max_bytes is not None:
+            self._sizes[key] = size
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            evicted, _ = self._entries.popitem(last=False)
+            self._sizes.pop(evicted, None)
+
+    def clear(self) -> None:
+        """Forget the models kept in memory; files on disk are left untouched."""
+        self._entries.clear()
+        self._sizes.clear()
+
+
+# Shared by every OutlierHandler by default, so it is bounded by bytes as well
+shared_model_cache = ModelCache(max_entries=32, max_bytes=256 * 2 ** 20)
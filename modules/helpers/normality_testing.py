@@ -5,6 +5,7 @@ from scipy import stats
 from scipy.stats._morestats import AndersonResult
 
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.column_profile import ColumnProfileCache, shared_profile_cache
 
 
 class NormalityTesting:
@@ -15,9 +16,9 @@ class NormalityTesting:
         KOLMOGOROV_SMIRNOW = 2
         K2 = 3
 
-    def __init__(self):
+    def __init__(self, profile_cache: ColumnProfileCache = None):
         """"""
-        pass
+        self.profile_cache = profile_cache if profile_cache is not None else shared_profile_cache
 
     @ColumnTypeValidators.numeric_required
     def shapiro_test(self, dataframe: pd.DataFrame, column: Union[str, int]):
@@ -35,17 +36,16 @@ class NormalityTesting:
     def anderson_test(self, dataframe: pd.DataFrame, column: Union[str, int]) -> AndersonResult:
         return stats.anderson(dataframe[column], dist='norm')
 
+    @ColumnTypeValidators.numeric_required
     def test_normality(self, dataframe: pd.DataFrame, column: Union[str, int], test: NormalityTests = NormalityTests.AUTO):
         if test == self.NormalityTests.AUTO:
             test = self.NormalityTests.SHAPIRO if (len(dataframe[column]) < 5000) else self.NormalityTests.KOLMOGOROV_SMIRNOW
+        # Verdicts are read from the shared profile cache, so a column is only tested again once it changes
         if test == self.NormalityTests.SHAPIRO:
-            stat, p_value = self.shapiro_test(dataframe, column)
-            return p_value > 0.05
+            return self.profile_cache.is_normal(dataframe[column], 'shapiro')
         elif test == self.NormalityTests.KOLMOGOROV_SMIRNOW:
-            stat, p_value = self.kolmogorov_smirnov_test(dataframe, column)
-            return p_value > 0.05
+            return self.profile_cache.is_normal(dataframe[column], 'kstest')
         elif test == self.NormalityTests.K2:
-            stat, p_value = self.k2_test(dataframe, column)
-            return p_value > 0.05
+            return self.profile_cache.is_normal(dataframe[column], 'normaltest')
         else:
             print("Unexpected Normality Test Type!")
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class SparseOneHotEncoder:
+    """
+    One-hot encoding of a column into a sparse matrix, whose memory scales with the rows, not rows x levels.
+
+    - `max_categories`: only the most frequent levels (ties broken by value) get their own column; every other
+      level, including values unseen at fit time, goes to one extra `other_label` column. If a kept level has
+      the same column name, the other column's label is prefixed with underscores until it is unique.
+    - `hash_features`: the hashing trick, for very high cardinality columns. The `repr` of every value is hashed
+      (`pd.util.hash_array`, stable across sessions) into a fixed number of columns, so nothing needs to be fitted
+      or stored and the output width is known in advance; distinct levels may collide. Hashing the `repr` keeps
+      equal values of different types (1, 1.0, '1', True) apart, as they are different levels.
+
+    Missing values produce empty rows. Without either option every fitted level gets a column, like
+    `pd.get_dummies`.
+    """
+
+    def __init__(self, max_categories: int = None, other_label: str = 'other', hash_features: int = None,
+                 prefix: str = None) -> None:
+        self.max_categories = max_categories
+        self.other_label = other_label
+        self.hash_features = hash_features
+        self.prefix = prefix
+        self.categories_ = None
+        self.other_label_ = other_label
+
+    def fit(self, series: pd.Series) -> "SparseOneHotEncoder":
+        if self.prefix is None:
+            self.prefix = str(series.name)
+        if self.hash_features is None:
+            counts = series.value_counts(dropna=True)
+            if self.max_categories is not None and len(counts) > self.max_categories:
+                counts = counts.sort_index(kind='stable').sort_values(ascending=False, kind='stable')
+                categories = counts.index[:self.max_categories]
+            else:
+                categories = counts.index
+            self.categories_ = categories.sort_values()
+            if self._has_other():
+                self.other_label_ = self._unique_other_label()
+        return self
+
+    def _unique_other_label(self) -> str:
+        names = {f"{self.prefix}_{category}" for category in self.categories_}
+        label = self.other_label
+        while f"{self.prefix}_{label}" in names:
+            label = f"_{label}"
+        if label != self.other_label:
+            print(f"'{self.other_label}' is a level of '{self.prefix}', its overflow column is named "
+                  f"'{self.prefix}_{label}' instead.")
+        return label
+
+    @property
+    def feature_names_(self) -> list:
+        if self.hash_features is not None:
+            return [f"{self.prefix}_hash{position}" for position in range(self.hash_features)]
+        names = [f"{self.prefix}_{category}" for category in self.categories_]
+        if self._has_other():
+            names.append(f"{self.prefix}_{self.other_label_}")
+        return names
+
+    def _has_other(self) -> bool:
+        return self.max_categories is not None
+
+    def transform(self, series: pd.Series) -> sparse.csr_matrix:
+        """(rows x features) CSR matrix of uint8 ones, one nonzero per non-missing row."""
+        present = series.notna().to_numpy()
+        if self.hash_features is not None:
+            hashes = pd.util.hash_array(self._hash_keys(series[present]))
+            columns = (hashes % np.uint64(self.hash_features)).astype(np.int64)
+            width = self.hash_features
+        else:
+            columns = self.categories_.get_indexer(series[present])
+            width = len(self.categories_)
+            if self._has_other():
+                columns[columns == -1] = width
+                width += 1
+            else:
+                # Without an `other` column, levels unseen at fit time produce empty rows
+                present[present] = columns != -1
+                columns = columns[columns != -1]
+        rows = np.flatnonzero(present)
+        data = np.ones(len(rows), dtype=np.uint8)
+        return sparse.csr_matrix((data, (rows, columns)), shape=(len(series), width))
+
+    @staticmethod
+    def _hash_keys(series: pd.Series) -> np.ndarray:
+        if series.dtype == object:
+            # Factorizing alone would merge the equal values 1, 1.0 and True, so levels are (value, type) pairs;
+            # only the first row of each level is formatted
+            value_codes, _ = pd.factorize(series)
+            type_codes, types = pd.factorize(series.map(type))
+            _, first, codes = np.unique(value_codes.astype(np.int64) * len(types) + type_codes, return_index=True,
+                                        return_inverse=True)
+            return np.array([repr(series.iat[row]) for row in first], dtype=object)[codes]
+        codes, uniques = pd.factorize(series)
+        return np.array([repr(value) for value in uniques.astype(object)], dtype=object)[codes]
+
+    def transform_frame(self, series: pd.Series) -> pd.DataFrame:
+        """The encoding as a DataFrame of `pd.SparseDtype` columns."""
+        return pd.DataFrame.sparse.from_spmatrix(self.transform(series), index=series.index,
+                                                 columns=self.feature_names_)
+
+    def fit_transform(self, series: pd.Series) -> sparse.csr_matrix:
+        return self.fit(series).transform(series)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+
+class OutlierMask:
+    """
+    Outlier flags of several columns, stored as one bit per cell.
+
+    The flags are packed along the rows (`np.packbits`), so a million-row column costs 125 KB instead of 1 MB
+    as a boolean array. The detection method and the (lower, upper) bounds of every column are kept alongside, so
+    the structure can be reported and applied without recomputing anything.
+    """
+
+    def __init__(self, index: pd.Index, columns: list, flags: np.ndarray, bounds: pd.DataFrame) -> None:
+        self.index = index
+        self.columns = list(columns)
+        self.bounds = bounds
+        self._positions = {column: position for position, column in enumerate(self.columns)}
+        self._bits = np.packbits(flags, axis=0)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def column_mask(self, column) -> np.ndarray:
+        """Boolean row mask of one column."""
+        return np.unpackbits(self._bits[:, self._positions[column]], count=len(self.index)).astype(bool)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Boolean DataFrame aligned with the scanned frame."""
+        flags = np.unpackbits(self._bits, axis=0, count=len(self.index)).astype(bool)
+        return pd.DataFrame(flags, index=self.index, columns=self.columns)
+
+    def indices(self, column) -> pd.Index:
+        """Index labels of the outliers of one column."""
+        return self.index[self.column_mask(column)]
+
+    def counts(self) -> pd.Series:
+        """Number of outliers per column."""
+        flags = np.unpackbits(self._bits, axis=0, count=len(self.index))
+        return pd.Series(flags.sum(axis=0), index=self.columns, name='outlier_count')
@@ -0,0 +1,59 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def resolve_n_jobs(n_jobs: int = 1) -> int:
+    """Translate an sklearn style `n_jobs` (None, 1, n or -1 for all cores) into a worker count."""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def map_in_processes(function, tasks, n_jobs: int = 1, initializer=None, initargs: tuple = (),
+                     state: dict = None) -> list:
+    """
+    Apply `function` to every task, sharding the tasks across a process pool when more than one job is requested.
+
+    Parameters:
+    ----------
+    function : callable
+        Module level function taking a single task. It must be picklable.
+    tasks : iterable
+        Task arguments. A generator is consumed lazily: at most two tasks per worker are submitted ahead of the
+        results, so the pickled task payloads in flight stay bounded whatever the number of tasks.
+    n_jobs : int, default 1
+        Number of worker processes. With a single job everything runs in the calling process.
+    initializer : callable, optional
+        Called once per worker with `initargs`, typically to install large read-only state (a fitted index,
+        a donor matrix) so it is pickled once per worker instead of once per task.
+    state : dict, optional
+        The module level dict filled by `initializer`. With a single job the initializer runs in the calling
+        process, so the dict is cleared once the tasks are done instead of keeping the arrays alive.
+
+    Returns:
+    -------
+    list
+        Results in task order.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    if hasattr(tasks, '__len__'):
+        n_jobs = min(n_jobs, max(len(tasks), 1))
+    if n_jobs == 1:
+        try:
+            if initializer is not None:
+                initializer(*initargs)
+            return [function(task) for task in tasks]
+        finally:
+            if state is not None:
+                state.clear()
+    results, pending = [], deque()
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=initializer, initargs=initargs) as executor:
+        for task in tasks:
+            if len(pending) >= 2 * n_jobs:
+                results.append(pending.popleft().result())
+            pending.append(executor.submit(function, task))
+        results.extend(future.result() for future in pending)
+    return results
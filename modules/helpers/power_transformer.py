@@ -0,0 +1,102 @@
+from enum import Enum
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+class ColumnPowerTransformer:
+    """
+    Power transforms applied to many columns at once as vectorized ufuncs over the 2-D block.
+
+    Box-Cox and Yeo-Johnson lambdas are fitted per column by maximum likelihood (on the non-missing values) and
+    stored in `lambdas_`, so later batches are transformed, or mapped back with `inverse_transform`, without
+    refitting. Values outside a transform's domain (x <= 0 for LOG and BOX_COX, x < 0 for SQRT, x <= -1 for
+    LOG1P) become NaN. Fitting a lambda raises ValueError for a column with fewer than two distinct usable values.
+    `dtype` sets the compute precision, e.g. np.float32 to halve memory and bandwidth.
+    """
+
+    class Method(Enum):
+        LOG = 0
+        LOG1P = 1
+        SQRT = 2
+        BOX_COX = 3
+        YEO_JOHNSON = 4
+
+    def __init__(self, method: Method = Method.YEO_JOHNSON, dtype=np.float64) -> None:
+        self.method = method
+        self.dtype = np.dtype(dtype)
+        self.columns_ = None
+        self.lambdas_ = None
+
+    def fit(self, dataframe: pd.DataFrame, columns: list = None) -> "ColumnPowerTransformer":
+        self.columns_ = list(dataframe.columns) if columns is None else list(columns)
+        lambdas = np.zeros(len(self.columns_))
+        if self.method in (self.Method.BOX_COX, self.Method.YEO_JOHNSON):
+            values = dataframe[self.columns_].to_numpy(dtype=float)
+            for position in range(len(self.columns_)):
+                column_values = values[:, position]
+                column_values = column_values[~np.isnan(column_values)]
+                if self.method == self.Method.BOX_COX:
+                    column_values = column_values[column_values > 0]
+                if len(column_values) < 2 or np.ptp(column_values) == 0:
+                    raise ValueError(f"Column '{self.columns_[position]}' needs at least two distinct "
+                                     f"{'positive ' if self.method == self.Method.BOX_COX else ''}values to fit "
+                                     f"a {self.method.name} lambda.")
+                if self.method == self.Method.BOX_COX:
+                    lambdas[position] = stats.boxcox_normmax(column_values, method='mle')
+                else:
+                    lambdas[position] = stats.yeojohnson_normmax(column_values)
+        self.lambdas_ = pd.Series(lambdas, index=self.columns_)
+        return self
+
+    def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        values = dataframe[self.columns_].to_numpy(dtype=self.dtype)
+        lambdas = self.lambdas_.to_numpy(dtype=self.dtype)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            if self.method == self.Method.LOG:
+                result = np.log(np.where(values > 0, values, np.nan))
+            elif self.method == self.Method.LOG1P:
+                result = np.log1p(np.where(values > -1, values, np.nan))
+            elif self.method == self.Method.SQRT:
+                result = np.sqrt(np.where(values >= 0, values, np.nan))
+            elif self.method == self.Method.BOX_COX:
+                logs = np.log(np.where(values > 0, values, np.nan))
+                result = np.where(lambdas == 0, logs, np.expm1(lambdas * logs) / self._nonzero(lambdas))
+            else:
+                positive = values >= 0
+                upper = np.log1p(np.where(positive, values, 0))
+                lower = np.log1p(np.where(positive, 0, -values))
+                result = np.where(positive,
+                                  np.where(lambdas == 0, upper, np.expm1(lambdas * upper) / self._nonzero(lambdas)),
+                                  np.where(lambdas == 2, -lower,
+                                           -np.expm1((2 - lambdas) * lower) / self._nonzero(2 - lambdas)))
+        return pd.DataFrame(result, index=dataframe.index, columns=self.columns_)
+
+    def inverse_transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        values = dataframe[self.columns_].to_numpy(dtype=self.dtype)
+        lambdas = self.lambdas_.to_numpy(dtype=self.dtype)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            if self.method == self.Method.LOG:
+                result = np.exp(values)
+            elif self.method == self.Method.LOG1P:
+                result = np.expm1(values)
+            elif self.method == self.Method.SQRT:
+                result = np.square(values)
+            elif self.method == self.Method.BOX_COX:
+                result = np.exp(np.where(lambdas == 0, values, np.log1p(lambdas * values) / self._nonzero(lambdas)))
+            else:
+                positive = values >= 0
+                result = np.where(positive,
+                                  np.where(lambdas == 0, np.expm1(values),
+                                           np.expm1(np.log1p(lambdas * values) / self._nonzero(lambdas))),
+                                  np.where(lambdas == 2, -np.expm1(-values),
+                                           -np.expm1(np.log1p(-(2 - lambdas) * values) / self._nonzero(2 - lambdas))))
+        return pd.DataFrame(result, index=dataframe.index, columns=self.columns_)
+
+    def fit_transform(self, dataframe: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        return self.fit(dataframe, columns).transform(dataframe)
+
+    @staticmethod
+    def _nonzero(values: np.ndarray) -> np.ndarray:
+        # The zero-lambda branches are selected by np.where, this only keeps the other branch finite
+        return np.where(values == 0, 1, values)
@@ -0,0 +1,190 @@
+from itertools import islice
+import numpy as np
+import pandas as pd
+
+from modules.helpers.parallel import map_in_processes, resolve_n_jobs
+
+
+class RunningMoments:
+    """Mergeable count, mean, variance, min and max of a numeric stream (Chan et al. parallel update)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values) -> "RunningMoments":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            other = RunningMoments()
+            other.count = values.size
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min = float(values.min())
+            other.max = float(values.max())
+            self.merge(other)
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+
+class KLLSketch:
+    """
+    Mergeable approximate quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Items are kept in a hierarchy of compactors whose capacities shrink geometrically (factor 2/3) from the top
+    level down to `k`. A full compactor is sorted and every other item, starting at a random offset, is promoted
+    to the next level with double weight. Memory is O(k log(n / k)) whatever the stream length, and sketches built
+    on separate chunks or processes can be merged.
+
+    Error bound: with 99% confidence the rank of a returned quantile is off by at most about 1.65% of n for the
+    default k=200. The error shrinks proportionally to 1/k (about 0.33% for k=1000) and does not grow with n.
+    """
+
+    def __init__(self, k: int = 200, random_state: int = None) -> None:
+        self.k = k
+        self.count = 0
+        self.compactors = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values) -> "KLLSketch":
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.count += values.size
+            self.compactors[0] = np.concatenate([self.compactors[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.compactors):
+            if len(self.compactors[level]) > self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(self.compactors[level])
+                # An odd item stays behind so the promoted half carries exactly twice the weight
+                keep = items[:len(items) % 2]
+                items = items[len(items) % 2:]
+                promoted = items[self._rng.integers(2)::2]
+                self.compactors[level] = keep
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+                # Adding a level shrinks the capacity of all lower ones, so restart from the bottom
+                level = 0
+                continue
+            level += 1
+
+    def quantile(self, q):
+        """Approximate quantile(s) of everything seen so far, `q` being a float or an array of floats in [0, 1]."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(items_), 2.0 ** level) for level, items_ in enumerate(self.compactors)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(q, dtype=float) * cumulative[-1], side='left')
+        result = items[np.minimum(positions, len(items) - 1)]
+        return result if np.ndim(q) else float(result)
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+
+class FrequentItems:
+    """
+    Mergeable heavy-hitter counter (Misra-Gries summary) used to track the mode of a stream.
+
+    At most `capacity` counters are kept. Every count is underestimated by at most n / (capacity + 1), so any
+    value more frequent than that is guaranteed to be tracked; with fewer distinct values than `capacity` the
+    counts are exact.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=float)
+
+    def update(self, values) -> "FrequentItems":
+        batch_counts = pd.Series(values).value_counts(dropna=True).astype(float)
+        return self._combine(batch_counts)
+
+    def merge(self, other: "FrequentItems") -> "FrequentItems":
+        return self._combine(other.counts)
+
+    def _combine(self, counts: pd.Series) -> "FrequentItems":
+        combined = self.counts.add(counts, fill_value=0) if len(self.counts) else counts
+        if len(combined) > self.capacity:
+            combined = combined.sort_values(ascending=False)
+            combined = combined - combined.iloc[self.capacity]
+            combined = combined[combined > 0]
+        self.counts = combined
+        return self
+
+    def most_common(self):
+        if self.counts.empty:
+            return np.nan
+        return self.counts.idxmax()
+
+
+def sketch_chunks(chunks, columns: list, k: int = 200, n_jobs: int = 1, random_state: int = None) -> dict:
+    """
+    Build one KLLSketch per column over a stream of DataFrame chunks in a single pass.
+
+    Every chunk is sketched independently, in worker processes when `n_jobs` > 1, and the chunk sketches are
+    merged into the running ones. Chunks are consumed `n_jobs` at a time, so at most that many are held in
+    memory whatever the length of the stream.
+    """
+    sketches = {column: KLLSketch(k, random_state) for column in columns}
+    n_jobs = resolve_n_jobs(n_jobs)
+    chunks = iter(chunks)
+    position = 0
+    while True:
+        wave = list(islice(chunks, n_jobs))
+        if not wave:
+            return sketches
+        tasks = []
+        for chunk in wave:
+            seed = None if random_state is None else random_state + position + 1
+            tasks.append((chunk[columns].to_numpy(dtype=float), k, seed))
+            position += 1
+        for chunk_sketches in map_in_processes(_sketch_chunk, tasks, n_jobs=n_jobs):
+            for column, chunk_sketch in zip(columns, chunk_sketches):
+                sketches[column].merge(chunk_sketch)
+
+
+def _sketch_chunk(task) -> list:
+    values, k, seed = task
+    return [KLLSketch(k, seed).update(values[:, position]) for position in range(values.shape[1])]
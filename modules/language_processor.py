@@ -6,12 +6,13 @@ from nltk.stem import WordNetLemmatizer, PorterStemmer
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from contractions import contractions_dict
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.execution import ExecutionMode, working_frame
 
 
 class LanguageProcessor:
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
 
     @ColumnTypeValidators.string_required
     def remove_stopwords(self, dataframe: pd.DataFrame, column: Union[str, int], language: str = 'english'):
@@ -20,7 +21,7 @@ class LanguageProcessor:
         except OSError:
             raise ValueError(f"Language '{language}' is not supported for stopword removal.")
         
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column].apply(lambda x: ' '.join([word for word in x.split() if word.lower() not in stop_words]))
         return df_copy
 
@@ -32,20 +33,20 @@ class LanguageProcessor:
                 return contractions_dict[match.group(0)]
             return contraction_re.sub(replace, text)
 
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column].apply(lambda x: expand_text(x))
         return df_copy
 
     @ColumnTypeValidators.string_required
     def lemmatization(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         lemmatizer = WordNetLemmatizer()
         df_copy[column] = df_copy[column].apply(lambda x: ' '.join([lemmatizer.lemmatize(word) for word in x.split()]))
         return df_copy
     
     @ColumnTypeValidators.string_required
     def stemming(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         stemmer = PorterStemmer()
         df_copy[column] = df_copy[column].apply(lambda x: ' '.join([stemmer.stem(word) for word in x.split()]))
         return df_copy
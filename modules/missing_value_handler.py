@@ -1,16 +1,22 @@
+import weakref
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Union
+from typing import Union, Iterable
 from enum import Enum
 
-from sklearn.impute import KNNImputer, IterativeImputer
-from sklearn.linear_model import LinearRegression
-from sklearn.mixture import GaussianMixture
-from sklearn.impute import SimpleImputer
+from sklearn.impute import KNNImputer
 from sklearn.neighbors import NearestNeighbors
+from sklearn.metrics.pairwise import nan_euclidean_distances
 
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.execution import ExecutionMode, working_frame
+from modules.helpers.fingerprint import frame_fingerprint
+from modules.helpers.gmm_imputer import GaussianMixtureImputer
+from modules.helpers.mice_imputer import ParallelMICEImputer
+from modules.helpers.missing_patterns import group_missing_patterns
+from modules.helpers.parallel import map_in_processes, resolve_n_jobs
+from modules.helpers.sketches import RunningMoments, KLLSketch, FrequentItems
 
 
 class MissingValueHandler:
@@ -34,22 +40,99 @@ class MissingValueHandler:
         NONE = 14
     
     
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
+        self._scan_cache = {}
     
     
     # -------------- ANALYSE MISSING VALUES --------------
-    def calculate_nan_ratios(self, df: pd.DataFrame, none_values: list) -> pd.Series:
+    def scan_missing_values(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]], none_values: list = None,
+                            use_cache: bool = False) -> pd.DataFrame:
+        """
+        Count NaNs and sentinel values (e.g. "?", "N/A", -999) per column without building a replaced frame.
+
+        Parameters:
+        ----------
+        data : pd.DataFrame or iterable of pd.DataFrame
+            A frame, or the chunks of one (e.g. `pd.read_csv(path, chunksize=...)`) whose counts are summed.
+        none_values : list, optional
+            Values counted as missing on top of NaN/None/NaT.
+        use_cache : bool, default False
+            Reuse the result of a previous scan of the same frame object, for repeated scans of a frame that is
+            not modified in between. The cache entry is dropped when a column is replaced or the shape changes,
+            but NOT when cells are written in place through `.loc`/`inplace=True`, which would return stale
+            counts.
+
+        Returns:
+        -------
+        pd.DataFrame
+            Indexed by column with 'dtype', 'nan_count', 'sentinel_count', 'missing_count' and 'missing_ratio'.
+        """
+        sentinels = [value for value in (none_values or []) if not pd.isna(value)]
+        if not isinstance(data, pd.DataFrame):
+            result, total_rows = None, 0
+            for chunk in data:
+                counts = self._count_missing(chunk, sentinels)
+                if result is None:
+                    result = counts
+                else:
+                    result[['nan_count', 'sentinel_count']] += counts[['nan_count', 'sentinel_count']]
+                total_rows += len(chunk)
+            return self._finish_scan(result, total_rows)
+
+        cache_key = (id(data), tuple(sentinels))
+        fingerprint = frame_fingerprint(data)
+        cached = self._scan_cache.get(cache_key)
+        if use_cache and cached is not None and cached[0]() is data and cached[1] == fingerprint:
+            return cached[2].copy()
+
+        result = self._finish_scan(self._count_missing(data, sentinels), len(data))
+        if use_cache:
+            if len(self._scan_cache) >= 16:
+                self._scan_cache.pop(next(iter(self._scan_cache)))
+            self._scan_cache[cache_key] = (weakref.ref(data), fingerprint, result.copy())
+        return result
+
+    @staticmethod
+    def _count_missing(dataframe: pd.DataFrame, sentinels: list) -> pd.DataFrame:
+        numeric_sentinels = [value for value in sentinels
+                             if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)]
+        rows = []
+        for position in range(dataframe.shape[1]):
+            series = dataframe.iloc[:, position]
+            nan_mask = series.isna().to_numpy()
+            sentinel_count = 0
+            if pd.api.types.is_datetime64_any_dtype(series):
+                dtype = 'datetime'
+            elif pd.api.types.is_string_dtype(series):
+                dtype = 'string'
+            else:
+                dtype = str(series.dtype)
+
+            if sentinels and pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                if numeric_sentinels and isinstance(series.dtype, np.dtype):
+                    sentinel_count = int(np.isin(series.to_numpy(copy=False), numeric_sentinels).sum())
+                elif numeric_sentinels:
+                    sentinel_count = int((series.isin(numeric_sentinels).to_numpy() & ~nan_mask).sum())
+            elif sentinels and (series.dtype == object
+                                or isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype))):
+                sentinel_count = int((series.isin(sentinels).to_numpy() & ~nan_mask).sum())
+            rows.append((dtype, int(nan_mask.sum()), sentinel_count))
+        return pd.DataFrame(rows, index=dataframe.columns, columns=['dtype', 'nan_count', 'sentinel_count'])
+
+    @staticmethod
+    def _finish_scan(counts: pd.DataFrame, total_rows: int) -> pd.DataFrame:
+        counts = counts.astype({'nan_count': 'int64', 'sentinel_count': 'int64'})
+        counts['missing_count'] = counts['nan_count'] + counts['sentinel_count']
+        counts['missing_ratio'] = counts['missing_count'] / total_rows
+        return counts
+
+    def calculate_nan_ratios(self, df: pd.DataFrame, none_values: list, use_cache: bool = False) -> pd.Series:
         """Calculate none ratio of dataset directly, considering specific values as NaNs."""
-        if none_values is not None:
-            df = df.replace(none_values, np.nan)
-        nan_counts = df.isna().sum()
-        total_counts = len(df)
-        nan_ratios = nan_counts / total_counts
-        return nan_ratios 
+        return self.scan_missing_values(df, none_values, use_cache)['missing_ratio']
     
-    def print_nan_ratios(self, df: pd.DataFrame, none_values: list = None):
+    def print_nan_ratios(self, df: pd.DataFrame, none_values: list = None, use_cache: bool = False):
         def get_status(ratio):
             if ratio > 0.20:
                 return 'Critical'
@@ -58,15 +141,10 @@ class MissingValueHandler:
             else:
                 return 'Good'
 
-        overall_nan_ratio = self.calculate_nan_ratios(df, none_values)
+        scan = self.scan_missing_values(df, none_values, use_cache)
 
-        for column, ratio in overall_nan_ratio.items():
+        for column, dtype, ratio in zip(scan.index, scan['dtype'], scan['missing_ratio']):
             status = get_status(ratio)
-            dtype = df[column].dtype
-            if pd.api.types.is_datetime64_any_dtype(df[column]):
-                dtype = 'datetime'
-            elif pd.api.types.is_string_dtype(df[column]):
-                dtype = 'string'
             print(f"'{column}' \nnone value ratio: {ratio:.2%} | Data type: {dtype} | Status: {status}")
 
 
@@ -74,8 +152,8 @@ class MissingValueHandler:
     def replace_mode(self, dataframe: pd.DataFrame, column: Union[int, str]) -> pd.DataFrame:
         if dataframe[column].mode().empty:
             print(f"There is no mode value for column '{column}. Using Median replacement instead...'")
-            self.replace_median(dataframe, column)
-        df_copy = dataframe.copy()
+            return self.replace_median(dataframe, column)
+        df_copy = working_frame(dataframe, self.execution_mode)
         
         mode_value = dataframe[column].mode()[0]
         df_copy[column] = df_copy[column].fillna(mode_value)
@@ -84,21 +162,21 @@ class MissingValueHandler:
     
     @ColumnTypeValidators.numeric_required
     def replace_mean(self, dataframe: pd.DataFrame, column: Union[int, str]) -> pd.DataFrame:
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         mean_value = df_copy[column].mean()
         df_copy[column] = df_copy[column].fillna(mean_value)
         return df_copy
 
     @ColumnTypeValidators.numeric_required
     def replace_median(self, dataframe: pd.DataFrame, column: Union[int, str]) -> pd.DataFrame:
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         median_value = df_copy[column].median()
         df_copy[column] = df_copy[column].fillna(median_value)
         
         return df_copy
     
     def replace_constant(self, dataframe: pd.DataFrame, column: Union[int, str], const: Union[int, str, datetime]) -> pd.DataFrame:
-       df_copy = dataframe.copy()
+       df_copy = working_frame(dataframe, self.execution_mode)
        if pd.api.types.is_numeric_dtype(df_copy[column]) and (isinstance(const, int) or isinstance(const, float)):
            const_value = const
        elif pd.api.types.is_string_dtype(df_copy[column]) and isinstance(const, str):
@@ -114,49 +192,177 @@ class MissingValueHandler:
 
 
     def replace_remove_row(self, dataframe: pd.DataFrame, column: Union[int, str]) -> pd.DataFrame:
-        df_copy = dataframe.copy()
-        return df_copy.dropna(subset=[column])
+        # Dropping rows always builds a new frame, so there is nothing to copy up front
+        return dataframe.dropna(subset=[column])
 
     def replace_remove_column(self, dataframe: pd.DataFrame, column: Union[int, str]) -> pd.DataFrame:
-        df_copy = dataframe.copy()
-        return df_copy.drop(columns=[column])
+        df_copy = working_frame(dataframe, self.execution_mode)
+        del df_copy[column]
+        return df_copy
     
     def replace_forward_backward(self, dataframe: pd.DataFrame, column: Union[int, str], method: str = "ffill") -> pd.DataFrame:
-        df_copy = dataframe.copy()
-        df_copy[column] = df_copy[column].fillna(method)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = df_copy[column].bfill() if method == "bfill" else df_copy[column].ffill()
         return df_copy
 
     # ___________________ ADVANCED HANDLING ___________________
-    def knn_imputation(self, dataframe: pd.DataFrame, n_neighbors=3):
-        knn_imputer = KNNImputer(n_neighbors=n_neighbors)
-        df_imputed = knn_imputer.fit_transform(dataframe)
-        df_imputed = pd.DataFrame(df_imputed, columns=dataframe.columns)
-        return df_imputed
-
-    def mice_imputation(self, dataframe: pd.DataFrame, max_iter: int = 10, random_state: int = 0):
-        imputer = IterativeImputer(max_iter=max_iter, random_state=random_state)
+    def knn_imputation(self, dataframe: pd.DataFrame, n_neighbors=3, block_size: int = None, n_jobs: int = 1):
+        """
+        Fill missing values with the mean of the k nearest neighbours.
+
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            Numeric DataFrame with missing values.
+        n_neighbors : int, default 3
+            Number of neighbours averaged for every missing value.
+        block_size : int, optional
+            Enables the blocked mode for large frames. Only rows with missing values are queried, `block_size`
+            of them at a time, so the distance matrix held in memory is `block_size` x rows instead of rows x
+            rows. Neighbours are chosen like `KNNImputer` does: for every missing cell, among the rows observing
+            its column, by nan-euclidean distance over the columns both rows observe, so partially observed rows
+            are donors too and the result equals `KNNImputer`'s. Columns without any observed value stay
+            missing. When omitted the whole frame is handed to sklearn's `KNNImputer`.
+        n_jobs : int, default 1
+            Worker processes the query blocks are sharded across in blocked mode (-1 uses every core).
+
+        Returns:
+        -------
+        pd.DataFrame
+            The imputed DataFrame.
+        """
+        if block_size is None:
+            knn_imputer = KNNImputer(n_neighbors=n_neighbors)
+            df_imputed = knn_imputer.fit_transform(dataframe)
+            df_imputed = pd.DataFrame(df_imputed, columns=dataframe.columns)
+            return df_imputed
+
+        values = dataframe.to_numpy(dtype=float, copy=True)
+        missing_mask = np.isnan(values)
+        imputable = ~missing_mask.all(axis=0)
+        receivers = np.flatnonzero(missing_mask[:, imputable].any(axis=1))
+
+        blocks = [receivers[start:start + block_size] for start in range(0, len(receivers), block_size)]
+        filled_blocks = map_in_processes(_impute_knn_block, blocks, n_jobs=n_jobs, initializer=_init_knn_worker,
+                                         initargs=(values, n_neighbors), state=_knn_state)
+        for block_rows, filled in zip(blocks, filled_blocks):
+            values[block_rows] = filled
+
+        df_copy = working_frame(dataframe, self.execution_mode)
+        for position in np.flatnonzero(missing_mask.any(axis=0) & imputable):
+            df_copy[dataframe.columns[position]] = values[:, position]
+        return df_copy
+
+    def mice_imputation(self, dataframe: pd.DataFrame, max_iter: int = 10, random_state: int = 0,
+                        tol: float = 1e-3, n_jobs: int = 1, subsample: Union[int, float] = None,
+                        n_imputations: int = 1, return_imputer: bool = False):
+        """
+        Chained equations imputation (sequential column updates, as sklearn's IterativeImputer).
+
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            The numeric DataFrame to impute.
+        max_iter : int, default 10
+            Maximum number of rounds.
+        random_state : int, default 0
+            Seed of the row subsampling and of the posterior draws.
+        tol : float, default 1e-3
+            Stop once the largest row-wise sum of changes, relative to the largest observed value, is below it.
+        n_jobs : int, default 1
+            Worker processes drawing the imputations when `n_imputations` > 1. The chain itself is sequential.
+        subsample : Union[int, float], optional
+            Fit every model on this many (int) or this fraction (float) of its observed rows.
+        n_imputations : int, default 1
+            Number of imputations drawn from the posterior of the converged chain and averaged. With 1 the
+            imputation is deterministic.
+        return_imputer : bool, default False
+            Also return the fitted ParallelMICEImputer, whose `timings_`, `changes_` and `imputations_` give the
+            duration and the relative change of every round and each imputation.
+
+        Returns:
+        -------
+        pd.DataFrame
+            The imputed DataFrame, followed by the imputer when `return_imputer` is True.
+        """
+        imputer = ParallelMICEImputer(max_iter=max_iter, tol=tol, n_jobs=n_jobs, subsample=subsample,
+                                      random_state=random_state, n_imputations=n_imputations)
         imputed_data = imputer.fit_transform(dataframe)
-        imputed_data = pd.DataFrame(imputed_data, columns=dataframe.columns)
+        imputed_data = pd.DataFrame(imputed_data, columns=dataframe.columns, index=dataframe.index)
+        if return_imputer:
+            return imputed_data, imputer
         return imputed_data
 
-    def regression_imputation(self,  dataframe: pd.DataFrame, target_column: str, predictor_columns: list[str]):
-        predictors = dataframe[predictor_columns]
-        target = dataframe[target_column]
-
-        x_train = predictors[target.notna()]
-        y_train = target[target.notna()]
-        x_test = predictors[target.isna()]
+    def regression_imputation(self, dataframe: pd.DataFrame, target_column: Union[str, list[str]],
+                              predictor_columns: list[str]):
+        """
+        Fill one or several target columns with linear regressions on the predictor columns.
 
-        # Train and Predict
-        model = LinearRegression()
-        model.fit(x_train, y_train)
-        y_pred = model.predict(x_test)
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame containing the data to be imputed.
+        target_column : Union[str, list[str]]
+            Column(s) to fill. Targets that are also predictors of other targets are filled first (then the ones
+            with fewer gaps), so their filled values feed the later models.
+        predictor_columns : list[str]
+            Predictor columns. A target is never used to predict itself.
 
-        # Fill in the missing values
-        dataframe.loc[target.isna(), target_column] = y_pred
-        return dataframe
+        Returns:
+        -------
+        pd.DataFrame
+            The DataFrame with the target columns filled.
+
+        Notes:
+        ------
+        The normal equations X'X of the rows with complete predictors are computed once per predictor set and
+        shared by all targets; each target only subtracts the few rows where it is missing. Rows with missing
+        predictors are predicted per missingness pattern from the sub-model on the predictors they observe,
+        solved from the same shared matrix.
+        """
+        targets = [target_column] if isinstance(target_column, str) else list(target_column)
+        for column in targets + list(predictor_columns):
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+        df_copy = working_frame(dataframe, self.execution_mode)
+
+        order = sorted(targets, key=lambda target: (target not in predictor_columns, dataframe[target].isna().sum()))
+        shared_systems = {}
+        for target in order:
+            y = df_copy[target].to_numpy(dtype=float)
+            y_missing = np.isnan(y)
+            if not y_missing.any():
+                continue
+
+            predictors = tuple(column for column in predictor_columns if column != target)
+            if predictors not in shared_systems:
+                design = np.column_stack([np.ones(len(df_copy)), df_copy[list(predictors)].to_numpy(dtype=float)])
+                complete_rows = ~np.isnan(design).any(axis=1)
+                complete_design = design[complete_rows]
+                shared_systems[predictors] = (design, complete_rows, complete_design.T @ complete_design)
+            design, complete_rows, gram = shared_systems[predictors]
+
+            train_rows = complete_rows & ~y_missing
+            if not train_rows.any():
+                raise ValueError(f"No row has both '{target}' and all predictors observed.")
+            excluded = design[complete_rows & y_missing]
+            target_gram = gram - excluded.T @ excluded
+            moment = design[train_rows].T @ y[train_rows]
+
+            query_rows = np.flatnonzero(y_missing)
+            filled = y.copy()
+            for pattern, positions in group_missing_patterns(np.isnan(design[query_rows]), include_complete=True):
+                rows = query_rows[positions]
+                observed = np.flatnonzero(~pattern)
+                coefficients = np.linalg.lstsq(target_gram[np.ix_(observed, observed)], moment[observed], rcond=None)[0]
+                filled[rows] = design[np.ix_(rows, observed)] @ coefficients
+            df_copy[target] = filled
+
+            # The filled target changes the design matrix of every predictor set it belongs to
+            shared_systems = {key: system for key, system in shared_systems.items() if target not in key}
+        return df_copy
 
-    def interpolate_missings(self, dataframe: pd.DataFrame, column: Union[str, int], method: str = 'linear'):
+    def interpolate_missings(self, dataframe: pd.DataFrame, column: Union[str, int, list], method: str = 'linear',
+                             group_by: Union[str, list] = None, order_by: str = None, n_jobs: int = 1):
         """
         Interpolates missing values in a specified column of a DataFrame.
 
@@ -164,8 +370,8 @@ class MissingValueHandler:
         ----------
         dataframe : pd.DataFrame
             The DataFrame containing the data to be interpolated.
-        column : Union[str, int]
-            The column in which to interpolate missing values.
+        column : Union[str, int, list]
+            The column(s) in which to interpolate missing values.
         method : str, default 'linear'
             Interpolation technique to use. One of:
 
@@ -177,60 +383,154 @@ class MissingValueHandler:
             'krogh', 'piecewise_polynomial', 'spline', 'pchip', 'akima', 'cubicspline': Wrappers around the SciPy interpolation methods of similar names.
             'from_derivatives': Refers to scipy.interpolate.BPoly.from_derivatives.
 
+            Grouped interpolation supports 'linear', 'pad', 'time', 'values' and 'index'. 'time' and 'values'
+            interpolate along the `order_by` column, 'index' along the index. Every group is interpolated in the
+            order of that key, like pandas on the rows sorted by it (leading gaps are the ones before the smallest
+            observed key), and the result is returned in the original row order. A missing row whose key equals
+            the key of observed rows takes the value of the nearest of them in row order.
+        group_by : Union[str, list], optional
+            Interpolate separately inside every group (e.g. per 'TAIL_NUM'). Rows are sorted once by group and
+            key, segment boundaries are located and every group and column is interpolated in a single
+            vectorized pass, values never leaking across groups.
+        order_by : str, optional
+            Column defining the order inside each group (e.g. 'FL_DATE'). Row order is kept when omitted, except
+            for 'index' which always follows the index values.
+        n_jobs : int, default 1
+            Worker processes for grouped interpolation. The sorted rows are split at group boundaries into one
+            shard per worker.
+
         Returns:
         -------
         pd.DataFrame
             The DataFrame with missing values interpolated in the specified column.
         """
-        return dataframe[[column]].interpolate(method=method)
-
-    def expectation_maximization_with_gmm(self, dataframe: pd.DataFrame, n_components=3, max_iter=100):
-        # Separate features and initialize the SimpleImputer
-        imputer = SimpleImputer(strategy='mean')
-        data_imputed = imputer.fit_transform(dataframe)
-
-        # Fit the Gaussian Mixture Model
-        gmm = GaussianMixture(n_components=n_components, max_iter=max_iter, random_state=42)
-        gmm.fit(data_imputed)
-
-        # Predict the missing values using the fitted GMM
-        missing_mask = np.isnan(dataframe)
-        for feature in range(dataframe.shape[1]):
-            if np.any(missing_mask[:, feature]):
-                # Predict the component probabilities for each sample
-                responsibilities = gmm.predict_proba(data_imputed)
-
-                # Compute the expected value for the missing feature based on GMM components
-                expected_values = np.dot(responsibilities, gmm.means_[:, feature])
+        columns = list(column) if isinstance(column, list) else [column]
+        if group_by is None:
+            return dataframe[columns].interpolate(method=method)
+
+        if method not in ('linear', 'pad', 'time', 'values', 'index'):
+            raise ValueError(f"Method '{method}' is not supported for grouped interpolation.")
+        if method in ('time', 'values') and order_by is None:
+            raise ValueError(f"Method '{method}' needs an 'order_by' column.")
+
+        group_codes = dataframe.groupby(group_by, sort=False, dropna=False).ngroup().to_numpy()
+        # Stable sort by group, then by the interpolation key, ties keeping the row order
+        if method == 'index':
+            order = np.lexsort((dataframe.index.to_numpy(), group_codes))
+        elif order_by is None:
+            order = np.argsort(group_codes, kind='stable')
+        else:
+            order = np.lexsort((dataframe[order_by].to_numpy(), group_codes))
+        sorted_codes = group_codes[order]
+        starts = np.empty(len(order), dtype=bool)
+        starts[:1] = True
+        starts[1:] = sorted_codes[1:] != sorted_codes[:-1]
+
+        if method in ('time', 'values'):
+            positions = dataframe[order_by].to_numpy()[order]
+            positions = positions.astype('int64' if method == 'time' else float).astype(float)
+        elif method == 'index':
+            positions = dataframe.index.to_numpy(dtype=float)[order]
+        else:
+            positions = np.arange(len(order), dtype=float)
+        values = dataframe[columns].to_numpy(dtype=float)[order]
+
+        # Shards end on group boundaries so no group is split between two workers
+        group_starts = np.flatnonzero(starts)
+        n_shards = min(resolve_n_jobs(n_jobs), len(group_starts))
+        # A split point past the last group start belongs to the last group; np.unique drops repeated bounds
+        split_groups = np.searchsorted(group_starts, np.linspace(0, len(order), n_shards + 1)[1:-1])
+        bounds = group_starts[np.minimum(split_groups, len(group_starts) - 1)]
+        bounds = np.unique(np.concatenate([[0], bounds, [len(order)]]))
+        tasks = [(values[begin:end], positions[begin:end], starts[begin:end], method)
+                 for begin, end in zip(bounds[:-1], bounds[1:])]
+        interpolated = np.concatenate(map_in_processes(_interpolate_sorted_segments, tasks, n_jobs=n_jobs))
+
+        result = np.empty_like(interpolated)
+        result[order] = interpolated
+        return pd.DataFrame(result, index=dataframe.index, columns=columns)
+
+    def expectation_maximization_with_gmm(self, dataframe: pd.DataFrame, n_components=3, max_iter=100, tol=1e-4,
+                                          batch_size: int = None, random_state=42):
+        """
+        Impute missing values with a Gaussian mixture fitted by EM on the incomplete data.
 
-                # Replace the missing values with the expected values
-                data_imputed[missing_mask[:, feature], feature] = expected_values[missing_mask[:, feature]]
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            Numeric DataFrame with missing values.
+        n_components : int, default 3
+            Number of mixture components.
+        max_iter : int, default 100
+            Maximum number of EM iterations.
+        tol : float, default 1e-4
+            Convergence threshold on the change of the mean log-likelihood.
+        batch_size : int, optional
+            Stream the rows through each EM iteration in chunks of this size so memory stays bounded on very tall
+            frames. The whole frame is processed at once when omitted.
+        random_state : int, default 42
+            Seed of the initial mixture fit.
 
-        return pd.DataFrame(data_imputed, columns=dataframe.columns)
+        Returns:
+        -------
+        pd.DataFrame
+            The DataFrame with every missing value replaced by its conditional expectation under the mixture.
+        """
+        imputer = GaussianMixtureImputer(n_components=n_components, max_iter=max_iter, tol=tol,
+                                         batch_size=batch_size, random_state=random_state)
+        imputed_values = imputer.fit_transform(dataframe)
 
-    def hot_deck_imputation(self, dataframe: pd.DataFrame, n_neighbors=5):
-        missing_indices = np.where(dataframe.isnull())
-        imputed_data = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
+        for position in np.flatnonzero(dataframe.isna().to_numpy().any(axis=0)):
+            df_copy[dataframe.columns[position]] = imputed_values[:, position]
+        return df_copy
 
-        # Use NearestNeighbors to find similar records
-        nbrs = NearestNeighbors(n_neighbors=n_neighbors, algorithm='auto').fit(dataframe.dropna())
+    def hot_deck_imputation(self, dataframe: pd.DataFrame, n_neighbors=5, random_state=None):
+        """
+        Fill missing cells with values copied from a donor drawn at random among the nearest complete rows.
 
-        for row, col in zip(missing_indices[0], missing_indices[1]):
-            if dataframe.iloc[row].isnull().any():
-                row_values = dataframe.iloc[row].values.reshape(1, -1)
-                mask = np.isnan(row_values)
+        Rows are grouped by missingness pattern. Each pattern gets one neighbour index built on the columns it
+        observes, all of its rows are answered by a single batched `kneighbors` query and one donor per row is
+        drawn with a seeded vectorized choice among the `n_neighbors` candidates.
 
-                # Find the nearest neighbors
-                distances, indices = nbrs.kneighbors(row_values[~mask].reshape(1, -1))
-                neighbors = dataframe.iloc[indices[0]].dropna()
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            Numeric DataFrame with missing values.
+        n_neighbors : int, default 5
+            Number of nearest complete rows to draw the donor from.
+        random_state : int, optional
+            Seed of the donor draw.
 
-                # Randomly select a donor from the neighbors
-                donor = neighbors.sample(1)
-                imputed_data.iat[row, col] = donor.iloc[0, col]
+        Returns:
+        -------
+        pd.DataFrame
+            The DataFrame with every missing cell filled from its donor row.
+        """
+        values = dataframe.to_numpy(dtype=float, copy=True)
+        missing_mask = np.isnan(values)
+        donors = values[~missing_mask.any(axis=1)]
+        if len(donors) == 0:
+            raise ValueError("Hot deck imputation needs at least one row without missing values.")
+        n_neighbors = min(n_neighbors, len(donors))
+        rng = np.random.default_rng(random_state)
+
+        for pattern, rows in group_missing_patterns(missing_mask):
+            observed = ~pattern
+            if observed.any():
+                nbrs = NearestNeighbors(n_neighbors=n_neighbors, algorithm='auto').fit(donors[:, observed])
+                _, indices = nbrs.kneighbors(values[np.ix_(rows, observed)])
+                donor_rows = indices[np.arange(len(rows)), rng.integers(0, n_neighbors, size=len(rows))]
+            else:
+                # Nothing to match on, any complete row is an equally good donor
+                donor_rows = rng.integers(0, len(donors), size=len(rows))
+            values[np.ix_(rows, pattern)] = donors[np.ix_(donor_rows, pattern)]
 
+        imputed_data = working_frame(dataframe, self.execution_mode)
+        for position in np.flatnonzero(missing_mask.any(axis=0)):
+            imputed_data[dataframe.columns[position]] = values[:, position]
         return imputed_data
 
-
     @ColumnTypeValidators.is_column_exists
     def replace_missing_values(self, dataframe: pd.DataFrame, column: Union[int, str] = 0, strategy: Strategy = Strategy.MEAN, const : Union[int, str, datetime] = np.nan) -> pd.DataFrame:
         if strategy == self.Strategy.MODE:
@@ -254,5 +554,265 @@ class MissingValueHandler:
         else:
             raise ValueError("Invalid strategy")
 
+    def replace_missing_values_batch(self, dataframe: pd.DataFrame, plan: dict) -> pd.DataFrame:
+        """
+        Apply a whole replacement plan in one go instead of calling `replace_missing_values` once per column.
+
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame containing the missing values.
+        plan : dict
+            Mapping of column -> Strategy. Any value that is not a Strategy is used as a CONSTANT fill value.
+            Supported strategies are MODE, MEAN, MEDIAN, CONSTANT, REMOVE_ROW, REMOVE_COLUMN, FORWARD, BACKWARD
+            and NONE.
+
+        Returns:
+        -------
+        pd.DataFrame
+            Rows of REMOVE_ROW columns and all REMOVE_COLUMN columns are dropped first, then mean/median/mode
+            statistics are computed in one vectorized call per strategy on the remaining rows and every fill is
+            written into that frame. In COPY mode the surviving rows and columns are selected with a single take,
+            so the input is copied only once; the other execution modes replace just the filled columns.
+        """
+        supported = {self.Strategy.MODE, self.Strategy.MEAN, self.Strategy.MEDIAN, self.Strategy.CONSTANT,
+                     self.Strategy.REMOVE_ROW, self.Strategy.REMOVE_COLUMN, self.Strategy.FORWARD,
+                     self.Strategy.BACKWARD, self.Strategy.NONE}
+        columns_by_strategy = {strategy: [] for strategy in supported}
+        fill_values = {}
+        for column, strategy in plan.items():
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+            if not isinstance(strategy, self.Strategy):
+                fill_values[column] = strategy
+                strategy = self.Strategy.CONSTANT
+            elif strategy == self.Strategy.CONSTANT:
+                fill_values[column] = np.nan
+            if strategy not in supported:
+                raise ValueError("Invalid strategy")
+            if strategy in (self.Strategy.MEAN, self.Strategy.MEDIAN) and not pd.api.types.is_numeric_dtype(dataframe[column]):
+                raise ValueError(f"Column '{column}' must be of numeric type.")
+            columns_by_strategy[strategy].append(column)
+
+        removed_columns = set(columns_by_strategy[self.Strategy.REMOVE_COLUMN])
+        removed_rows = columns_by_strategy[self.Strategy.REMOVE_ROW]
+        row_mask = dataframe[removed_rows].notna().all(axis=1)
+        if self.execution_mode == ExecutionMode.COPY:
+            # Single write: select the surviving rows and columns together
+            kept_columns = [column for column in dataframe.columns if column not in removed_columns]
+            df_copy = dataframe.loc[row_mask, kept_columns]
+        else:
+            df_copy = working_frame(dataframe, self.execution_mode)
+            for column in removed_columns:
+                del df_copy[column]
+            if removed_rows:
+                df_copy = df_copy[row_mask].copy(deep=False)
+
+        mean_columns = [c for c in columns_by_strategy[self.Strategy.MEAN] if c not in removed_columns]
+        median_columns = [c for c in columns_by_strategy[self.Strategy.MEDIAN] if c not in removed_columns]
+        mode_columns = [c for c in columns_by_strategy[self.Strategy.MODE] if c not in removed_columns]
+        if mean_columns:
+            fill_values.update(df_copy[mean_columns].mean().to_dict())
+        if median_columns:
+            fill_values.update(df_copy[median_columns].median().to_dict())
+        if mode_columns:
+            modes = df_copy[mode_columns].mode()
+            for column in mode_columns:
+                if modes.empty or pd.isna(modes[column].iloc[0]):
+                    print(f"There is no mode value for column '{column}. Using Median replacement instead...'")
+                    fill_values[column] = df_copy[column].median()
+                else:
+                    fill_values[column] = modes[column].iloc[0]
+
+        for column, value in fill_values.items():
+            if column not in removed_columns:
+                df_copy[column] = df_copy[column].fillna(value)
+        forward_columns = [c for c in columns_by_strategy[self.Strategy.FORWARD] if c not in removed_columns]
+        backward_columns = [c for c in columns_by_strategy[self.Strategy.BACKWARD] if c not in removed_columns]
+        if forward_columns:
+            df_copy[forward_columns] = df_copy[forward_columns].ffill()
+        if backward_columns:
+            df_copy[backward_columns] = df_copy[backward_columns].bfill()
+        return df_copy
 
+    def replace_missing_values_streaming(self, path: str, output_path: str, plan: dict, chunksize: int = 100_000,
+                                         **read_csv_kwargs) -> "StreamingImputer":
+        """
+        Apply a replacement plan to a CSV file larger than memory and write the result to `output_path`.
 
+        The file is read twice in chunks of `chunksize` rows: once to accumulate the fill statistics and once to
+        fill and write every chunk. Returns the fitted StreamingImputer so it can be reused on other files.
+        """
+        return StreamingImputer(plan).fit_transform_csv(path, output_path, chunksize, **read_csv_kwargs)
+
+
+class StreamingImputer:
+    """
+    Fit/transform imputer for files that do not fit in memory.
+
+    `fit` consumes DataFrame chunks (e.g. `pd.read_csv(path, chunksize=...)`) and only keeps mergeable
+    statistics per column: running moments for MEAN, a KLL quantile sketch for MEDIAN and a Misra-Gries
+    heavy-hitter summary for MODE. `transform` then fills every chunk as it streams to the output, so a file is
+    processed in two passes with memory bounded by the chunk size. Medians and modes are approximate, see
+    `KLLSketch` and `FrequentItems` for their error bounds.
+
+    Supported strategies are MEAN, MEDIAN, MODE, CONSTANT (any non-Strategy plan value), REMOVE_ROW,
+    REMOVE_COLUMN, FORWARD and NONE. FORWARD carries the last seen value across chunk boundaries.
+    """
+
+    def __init__(self, plan: dict, sketch_size: int = 200, max_counters: int = 1000) -> None:
+        Strategy = MissingValueHandler.Strategy
+        supported = {Strategy.MEAN, Strategy.MEDIAN, Strategy.MODE, Strategy.CONSTANT, Strategy.REMOVE_ROW,
+                     Strategy.REMOVE_COLUMN, Strategy.FORWARD, Strategy.NONE}
+        for column, strategy in plan.items():
+            if isinstance(strategy, Strategy) and strategy not in supported:
+                raise ValueError(f"Strategy '{strategy.name}' of column '{column}' can not be streamed.")
+        self.plan = plan
+        self.sketch_size = sketch_size
+        self.max_counters = max_counters
+        self.statistics_ = {}
+        self.fill_values_ = {}
+        self._last_values = {}
+
+    def _columns(self, strategy) -> list:
+        return [column for column, value in self.plan.items() if value is strategy]
+
+    def partial_fit(self, chunk: pd.DataFrame) -> "StreamingImputer":
+        Strategy = MissingValueHandler.Strategy
+        # Statistics describe the rows that survive REMOVE_ROW, as in `replace_missing_values_batch`
+        removed_rows = self._columns(Strategy.REMOVE_ROW)
+        if removed_rows:
+            chunk = chunk.dropna(subset=removed_rows)
+        for column in self._columns(Strategy.MEAN):
+            self.statistics_.setdefault(column, RunningMoments()).update(chunk[column].to_numpy(dtype=float))
+        for column in self._columns(Strategy.MEDIAN):
+            self.statistics_.setdefault(column, KLLSketch(self.sketch_size)).update(chunk[column].to_numpy(dtype=float))
+        for column in self._columns(Strategy.MODE):
+            self.statistics_.setdefault(column, FrequentItems(self.max_counters)).update(chunk[column])
+        self._finalize()
+        return self
+
+    def fit(self, chunks) -> "StreamingImputer":
+        self.statistics_ = {}
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    def _finalize(self):
+        Strategy = MissingValueHandler.Strategy
+        self.fill_values_ = {}
+        for column, strategy in self.plan.items():
+            if not isinstance(strategy, Strategy):
+                self.fill_values_[column] = strategy
+            elif strategy == Strategy.MEAN and column in self.statistics_:
+                self.fill_values_[column] = self.statistics_[column].mean
+            elif strategy == Strategy.MEDIAN and column in self.statistics_:
+                self.fill_values_[column] = self.statistics_[column].median()
+            elif strategy == Strategy.MODE and column in self.statistics_:
+                self.fill_values_[column] = self.statistics_[column].most_common()
+
+    def transform(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        Strategy = MissingValueHandler.Strategy
+        removed_rows = self._columns(Strategy.REMOVE_ROW)
+        if removed_rows:
+            chunk = chunk.dropna(subset=removed_rows)
+        # Shallow copy: only the filled columns get new arrays
+        chunk = chunk.copy(deep=False)
+        for column in self._columns(Strategy.REMOVE_COLUMN):
+            del chunk[column]
+        for column, value in self.fill_values_.items():
+            chunk[column] = chunk[column].fillna(value)
+        for column in self._columns(Strategy.FORWARD):
+            filled = chunk[column].ffill()
+            if column in self._last_values:
+                filled = filled.fillna(self._last_values[column])
+            last_valid = filled.last_valid_index()
+            if last_valid is not None:
+                self._last_values[column] = filled[last_valid]
+            chunk[column] = filled
+        return chunk
+
+    def transform_chunks(self, chunks):
+        """Yield every chunk filled, forward fills continuing across chunk boundaries."""
+        self._last_values = {}
+        for chunk in chunks:
+            yield self.transform(chunk)
+
+    def fit_transform_csv(self, path: str, output_path: str, chunksize: int = 100_000,
+                          **read_csv_kwargs) -> "StreamingImputer":
+        """Fit on `path` in a first pass, then write the filled rows to `output_path` in a second one."""
+        self.fit(pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs))
+        chunks = pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs)
+        for position, chunk in enumerate(self.transform_chunks(chunks)):
+            chunk.to_csv(output_path, mode='w' if position == 0 else 'a', header=position == 0, index=False)
+        return self
+
+
+# -------------- PROCESS POOL WORKERS --------------
+_knn_state = {}
+
+
+def _init_knn_worker(values: np.ndarray, n_neighbors: int):
+    observed = ~np.isnan(values)
+    _knn_state.update(values=values, n_neighbors=n_neighbors,
+                      donors=[np.flatnonzero(observed[:, column]) for column in range(values.shape[1])],
+                      means=np.nanmean(np.where(observed.any(axis=0), values, 0), axis=0))
+
+
+def _impute_knn_block(receivers: np.ndarray) -> np.ndarray:
+    """Rows `receivers` with their missing cells filled as KNNImputer does (uniform weights)."""
+    values, donors_by_column = _knn_state['values'], _knn_state['donors']
+    block = values[receivers]
+    distances = nan_euclidean_distances(block, values)
+    filled = block.copy()
+    for column in np.flatnonzero(np.isnan(block).any(axis=0)):
+        donors = donors_by_column[column]
+        if len(donors) == 0:
+            continue
+        rows = np.flatnonzero(np.isnan(block[:, column]))
+        donor_distances = distances[np.ix_(rows, donors)]
+        # Receivers sharing no observed column with any donor get the column mean
+        no_distance = np.isnan(donor_distances).all(axis=1)
+        filled[rows[no_distance], column] = _knn_state['means'][column]
+        rows, donor_distances = rows[~no_distance], donor_distances[~no_distance]
+        if len(rows) == 0:
+            continue
+        n_neighbors = min(_knn_state['n_neighbors'], len(donors))
+        nearest = np.argpartition(donor_distances, n_neighbors - 1, axis=1)[:, :n_neighbors]
+        weights = ~np.isnan(np.take_along_axis(donor_distances, nearest, axis=1))
+        neighbour_values = values[donors[nearest], column]
+        filled[rows, column] = (neighbour_values * weights).sum(axis=1) / weights.sum(axis=1)
+    return filled
+
+
+def _interpolate_sorted_segments(task) -> np.ndarray:
+    """Interpolate the columns of rows sorted by segment, `starts` flagging the first row of every segment."""
+    values, positions, starts, method = task
+    n_rows = len(values)
+    rows = np.arange(n_rows)
+    valid = ~np.isnan(values)
+    segment_start = np.maximum.accumulate(np.where(starts, rows, 0))
+    ends = np.append(starts[1:], True)
+    segment_end = np.minimum.accumulate(np.where(ends, rows, n_rows - 1)[::-1])[::-1]
+
+    previous = np.maximum.accumulate(np.where(valid, rows[:, None], -1), axis=0)
+    has_previous = previous >= segment_start[:, None]
+    following = np.minimum.accumulate(np.where(valid, rows[:, None], n_rows)[::-1], axis=0)[::-1]
+    has_following = following <= segment_end[:, None]
+
+    previous = np.clip(previous, 0, n_rows - 1)
+    following = np.clip(following, 0, n_rows - 1)
+    columns = np.arange(values.shape[1])
+    previous_values = values[previous, columns]
+    following_values = values[following, columns]
+
+    result = values.copy()
+    # Like pandas' forward interpolation: trailing gaps repeat the last value, leading gaps stay missing
+    fill = ~valid & has_previous
+    result[fill] = previous_values[fill]
+    if method != 'pad':
+        between = fill & has_following
+        span = positions[following] - positions[previous]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(span > 0, (positions[:, None] - positions[previous]) / span, 0.0)
+        result[between] = (previous_values + (following_values - previous_values) * weight)[between]
+    return result
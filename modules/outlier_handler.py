@@ -1,16 +1,26 @@
+from collections import deque
 from typing import Union
 import pandas as pd
 import numpy as np
-from scipy.spatial.distance import mahalanobis
-from scipy.stats import zscore, kstest, chi2
+from scipy.linalg import cholesky, solve_triangular
+from scipy.special import ndtr
+from scipy.stats import zscore, chi2, kstwo, kstwobign
 from enum import Enum
 
 from sklearn.cluster import DBSCAN
-from sklearn.covariance import EllipticEnvelope
+from sklearn.covariance import EllipticEnvelope, MinCovDet
 from sklearn.ensemble import IsolationForest
-from sklearn.neighbors import LocalOutlierFactor
+from sklearn.neighbors import LocalOutlierFactor, KDTree, BallTree
 
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.execution import ExecutionMode, working_frame
+from modules.helpers.column_profile import ColumnProfileCache, shared_profile_cache
+from modules.helpers.fingerprint import content_fingerprint
+from modules.helpers.model_cache import ModelCache, shared_model_cache
+from modules.helpers.outlier_mask import OutlierMask
+from modules.helpers.parallel import map_in_processes
+from modules.helpers.power_transformer import ColumnPowerTransformer
+from modules.helpers.sketches import KLLSketch, sketch_chunks
 from modules.missing_value_handler import MissingValueHandler
 
 class OutlierHandler:
@@ -24,10 +34,18 @@ class OutlierHandler:
         DBSCAN = 6
         LOF = 7
         AUTO = 8
+
+    _FITS_PER_KEY = 4
     
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY, model_cache: ModelCache = None,
+                 profile_cache: ColumnProfileCache = None, use_model_cache: bool = True) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
+        if not use_model_cache:
+            self.model_cache = None
+        else:
+            self.model_cache = model_cache if model_cache is not None else shared_model_cache
+        self.profile_cache = profile_cache if profile_cache is not None else shared_profile_cache
     
     # -------------- DETECT OUTLIERS --------------
     @ColumnTypeValidators.numeric_required
@@ -57,7 +75,7 @@ class OutlierHandler:
 
     def choose_outlier_method(self, dataframe: pd.DataFrame, column: Union[str, int]):
         # Check for normality using the Kolmogorov-Smirnov test
-        stat, p_value = kstest(dataframe[column], 'norm', args=(dataframe[column].mean(), dataframe[column].std()))
+        stat, p_value = self.profile_cache.normality_test(dataframe[column], 'kstest_fitted')
         if p_value > 0.05:
             # Data is normally distributed
             return self.Identifier.ZSCORE
@@ -65,49 +83,293 @@ class OutlierHandler:
             # Data is not normally distributed
             return self.Identifier.IQR
 
-    # -------------- ADVANCED OUTLIER DETECTION --------------
-    def identify_outliers_isolation_forest(self, dataframe: pd.DataFrame, column: str, contamination: float = 0.1):
-        model = IsolationForest(contamination=contamination)
-        model.fit(dataframe[[column]])
+    def detect_all(self, dataframe: pd.DataFrame, columns: list = None, identifier: Identifier = Identifier.AUTO,
+                   iqr_threshold: float = 1.5, zscore_threshold: float = 3) -> OutlierMask:
+        """
+        Detect the outliers of many numeric columns in one vectorized pass over the 2-D block.
+
+        Parameters:
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame to scan.
+        columns : list, optional
+            Columns to scan, every numeric column by default.
+        identifier : Identifier, default AUTO
+            IQR, ZSCORE or AUTO. AUTO picks ZSCORE for the columns passing a Kolmogorov-Smirnov normality test
+            and IQR for the others, like `choose_outlier_method`.
+        iqr_threshold : float, default 1.5
+            IQR multiplier of the IQR bounds.
+        zscore_threshold : float, default 3
+            Absolute z-score above which a value is an outlier.
+
+        Returns:
+        -------
+        OutlierMask
+            Packed per-column outlier flags with the method and bounds used for each column. Missing values are
+            ignored by every statistic and never flagged.
+        """
+        if columns is None:
+            columns = [column for column in dataframe.columns if pd.api.types.is_numeric_dtype(dataframe[column])]
+        for column in columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+            if not pd.api.types.is_numeric_dtype(dataframe[column]):
+                raise ValueError(f"Column '{column}' must be of numeric type.")
+        if identifier not in (self.Identifier.IQR, self.Identifier.ZSCORE, self.Identifier.AUTO):
+            raise ValueError("Invalid Identifier")
 
-        outliers = model.predict(dataframe[[column]])
+        # One sort of the block serves the quartiles and the normality test; NaNs sort to the end of each column
+        values = dataframe[columns].to_numpy(dtype=float)
+        ordered = np.sort(values, axis=0)
+        counts = (~np.isnan(ordered)).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nanmean(ordered, axis=0)
+            std = np.nanstd(ordered, axis=0)
+            q1, q3 = self._sorted_quantiles(ordered, counts, 0.25), self._sorted_quantiles(ordered, counts, 0.75)
 
-        # Return indices of outliers
-        outlier_indices = dataframe.index[outliers == -1].tolist()
-        return outlier_indices
-
-    def identify_outliers_elliptic_envolpe(self, dataframe: pd.DataFrame, column: str, contamination: float = 0.1):
-        model = EllipticEnvelope(contamination=contamination)
+        if identifier == self.Identifier.AUTO:
+            sample_std = std * np.sqrt(counts / np.maximum(counts - 1, 1))
+            use_zscore = self._ks_normality_pvalues(ordered, counts, mean, sample_std) > 0.05
+        else:
+            use_zscore = np.full(len(columns), identifier == self.Identifier.ZSCORE)
+
+        iqr = q3 - q1
+        lower = np.where(use_zscore, mean - zscore_threshold * std, q1 - iqr_threshold * iqr)
+        upper = np.where(use_zscore, mean + zscore_threshold * std, q3 + iqr_threshold * iqr)
+        with np.errstate(invalid='ignore'):
+            flags = (values < lower) | (values > upper)
+
+        bounds = pd.DataFrame({'method': np.where(use_zscore, self.Identifier.ZSCORE.name, self.Identifier.IQR.name),
+                               'lower': lower, 'upper': upper}, index=columns)
+        return OutlierMask(dataframe.index, columns, flags, bounds)
+
+    def detect_grouped(self, dataframe: pd.DataFrame, group_by: Union[str, list], columns: list = None,
+                       identifier: Identifier = Identifier.IQR, iqr_threshold: float = 1.5,
+                       zscore_threshold: float = 3) -> OutlierMask:
+        """
+        Detect outliers against per-group bounds (e.g. per carrier and airport) for many columns at once.
+
+        The quartiles (IQR) or mean and std (ZSCORE) of every group and column come from a single grouped
+        aggregation; each row is then compared to its group's bounds with one broadcast comparison, without a
+        Python loop over the groups.
+
+        Returns:
+        -------
+        OutlierMask
+            Packed per-column outlier flags. Its `bounds` has one row per group and ('lower', 'upper') pairs per
+            column.
+        """
+        group_keys = [group_by] if not isinstance(group_by, list) else group_by
+        if columns is None:
+            columns = [column for column in dataframe.columns
+                       if column not in group_keys and pd.api.types.is_numeric_dtype(dataframe[column])]
+        for column in group_keys + columns:
+            ColumnTypeValidators.check_column_existance(dataframe, column)
+        if identifier not in (self.Identifier.IQR, self.Identifier.ZSCORE):
+            raise ValueError("Invalid Identifier")
 
-        data = dataframe[[column]].values.reshape(-1, 1)
-        model.fit(data)
+        grouped = dataframe.groupby(group_by, sort=False, dropna=False, observed=True)[columns]
+        # Groups are numbered in the order the aggregations below list them
+        group_codes = grouped.ngroup().to_numpy()
+        if identifier == self.Identifier.IQR:
+            quartiles = grouped.quantile([0.25, 0.75])
+            q1 = quartiles.xs(0.25, level=-1)
+            q3 = quartiles.xs(0.75, level=-1)
+            lower = q1 - iqr_threshold * (q3 - q1)
+            upper = q3 + iqr_threshold * (q3 - q1)
+        else:
+            mean = grouped.mean()
+            std = grouped.std(ddof=0)
+            lower = mean - zscore_threshold * std
+            upper = mean + zscore_threshold * std
+
+        values = dataframe[columns].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'):
+            flags = (values < lower.to_numpy()[group_codes]) | (values > upper.to_numpy()[group_codes])
+
+        bounds = pd.concat({'lower': lower, 'upper': upper}, axis=1).swaplevel(axis=1).sort_index(axis=1, level=0)
+        return OutlierMask(dataframe.index, columns, flags, bounds)
+
+    @staticmethod
+    def _sorted_quantiles(ordered: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+        """Linearly interpolated quantile of every column of a column-sorted block holding `counts` values each."""
+        position = q * (counts - 1)
+        below = np.clip(np.floor(position).astype(int), 0, len(ordered) - 1)
+        above = np.clip(below + 1, 0, np.maximum(counts - 1, 0))
+        columns = np.arange(ordered.shape[1])
+        result = ordered[below, columns] + (position - below) * (ordered[above, columns] - ordered[below, columns])
+        return np.where(counts > 0, result, np.nan)
+
+    @staticmethod
+    def _ks_normality_pvalues(ordered: np.ndarray, counts: np.ndarray, mean: np.ndarray,
+                              std: np.ndarray) -> np.ndarray:
+        """Kolmogorov-Smirnov p-values of every column of a column-sorted block against its own normal law."""
+        ranks = np.arange(1, len(ordered) + 1)[:, None]
+        # Rows past each column's count are NaN padding
+        valid = ranks <= counts
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cdf = ndtr((ordered - mean) / std)
+            d_plus = np.where(valid, ranks / counts - cdf, -np.inf).max(axis=0, initial=-np.inf)
+            d_minus = np.where(valid, cdf - (ranks - 1) / counts, -np.inf).max(axis=0, initial=-np.inf)
+        statistic = np.maximum(d_plus, d_minus)
+
+        p_values = np.full(len(counts), np.nan)
+        for position, (d, n) in enumerate(zip(statistic, counts)):
+            if n > 0 and np.isfinite(d):
+                # Same switch as scipy's kstest: exact distribution for small samples, asymptotic otherwise
+                p_values[position] = kstwo.sf(d, n) if n <= 10000 else kstwobign.sf(d * np.sqrt(n))
+        return p_values
+
+    def iqr_bounds_streaming(self, chunks, columns: list, threshold: float = 1.5, sketch_size: int = 200,
+                             n_jobs: int = 1, random_state: int = None) -> pd.DataFrame:
+        """
+        Approximate IQR bounds and medians of columns too large for memory, from one pass over DataFrame chunks.
+
+        Each chunk is summarized by a KLL sketch per column (in `n_jobs` processes) and the sketches are merged,
+        so memory is bounded by the chunk size and the sketch size. With 99% confidence each quartile has a rank
+        error of at most about 1.65% of the row count for `sketch_size`=200, shrinking as 1 / `sketch_size`.
+
+        Returns:
+        -------
+        pd.DataFrame
+            One row per column with 'q1', 'median', 'q3', 'lower' and 'upper'.
+        """
+        sketches = sketch_chunks(chunks, columns, sketch_size, n_jobs, random_state)
+        quartiles = np.array([sketches[column].quantile([0.25, 0.5, 0.75]) for column in columns]).reshape(-1, 3)
+        bounds = pd.DataFrame(quartiles, index=columns, columns=['q1', 'median', 'q3'])
+        iqr = bounds['q3'] - bounds['q1']
+        bounds['lower'] = bounds['q1'] - threshold * iqr
+        bounds['upper'] = bounds['q3'] + threshold * iqr
+        return bounds
 
-        outliers = model.predict(data)
+    # -------------- ADVANCED OUTLIER DETECTION --------------
+    def identify_outliers_isolation_forest(self, dataframe: pd.DataFrame, column: Union[str, list[str]],
+                                           contamination: float = 0.1, n_jobs: int = None, random_state: int = None):
+        outliers = self._predict_with_cached_model(
+            dataframe, column, 'isolation_forest',
+            lambda: IsolationForest(contamination=contamination, n_jobs=n_jobs, random_state=random_state),
+            {'contamination': contamination, 'random_state': random_state})
 
         # Return indices of outliers
         outlier_indices = dataframe.index[outliers == -1].tolist()
         return outlier_indices
 
-    def identify_outliers_mahalanobis_distance(self, dataframe: pd.DataFrame, column: str):
-        df = dataframe[[column]]
-
-        # Covariance matrix and its inverse
-        cov_matrix = np.cov(df.T)
-        inv_cov_matrix = np.linalg.inv(cov_matrix)
-
-        mean_distr = df.mean().values
-        mahalanobis_distances = df.apply(lambda row: mahalanobis(row, mean_distr, inv_cov_matrix), axis=1)
-
-        # Set a threshold for outliers
-        threshold = chi2.ppf((1 - 0.01), df.shape[1])  # 99% confidence interval
-
-        outliers = mahalanobis_distances > threshold
-        outlier_indices = df.index[outliers]
+    def identify_outliers_elliptic_envolpe(self, dataframe: pd.DataFrame, column: Union[str, list[str]],
+                                           contamination: float = 0.1, random_state: int = None):
+        outliers = self._predict_with_cached_model(
+            dataframe, column, 'elliptic_envelope',
+            lambda: EllipticEnvelope(contamination=contamination, random_state=random_state),
+            {'contamination': contamination, 'random_state': random_state})
 
+        # Return indices of outliers
+        outlier_indices = dataframe.index[outliers == -1].tolist()
         return outlier_indices
 
-    def identify_outliers_dbscan(self, dataframe: pd.DataFrame, columns: list[str], eps=0.5, min_samples=5):
+    def _predict_with_cached_model(self, dataframe: pd.DataFrame, column: Union[str, list[str]], name: str,
+                                   build_model, params: dict) -> np.ndarray:
+        """
+        Label every row (-1 outlier, 1 inlier) with a model fitted on the column(s), reusing cached fits.
+
+        Fits are cached under the detector name, columns and hyperparameters, each one with the row count and a
+        content digest of the rows it was fitted on (the latest `_FITS_PER_KEY` are kept). When the frame extends
+        previously fitted rows (an appended batch), the cached labels of those rows are reused and only the new
+        rows are scored with the fitted model. Without a model cache every call fits a new model.
+        """
+        columns = list(column) if isinstance(column, list) else [column]
+        data = dataframe[columns].to_numpy(dtype=float)
+        key = (name, tuple(columns), tuple(sorted(params.items())))
+        fits = (self.model_cache.get(key) if self.model_cache is not None else None) or {}
+
+        entry = None
+        for n_rows, fingerprint in sorted(fits, reverse=True):
+            if n_rows <= len(data) and content_fingerprint(data[:n_rows]) == fingerprint:
+                entry = fits[(n_rows, fingerprint)]
+                break
+        if entry is None:
+            model = build_model().fit(data)
+            if getattr(model, 'novelty', False):
+                # Same labels as LocalOutlierFactor.fit_predict on the training rows
+                labels = np.where(model.negative_outlier_factor_ < model.offset_, -1, 1)
+            else:
+                labels = model.predict(data)
+            entry = {'model': model, 'labels': labels}
+            if self.model_cache is not None:
+                # Row counts and digests live in the entry, so they are evicted together with their models
+                fits = dict(list(fits.items())[-(self._FITS_PER_KEY - 1):])
+                fits[(len(data), content_fingerprint(data))] = entry
+                self.model_cache.put(key, fits)
+
+        labels = entry['labels']
+        if len(data) > len(labels):
+            labels = np.concatenate([labels, entry['model'].predict(data[len(labels):])])
+        return labels
+
+    def identify_outliers_mahalanobis_distance(self, dataframe: pd.DataFrame, column: Union[str, list[str]],
+                                               confidence: float = 0.99, robust: bool = False,
+                                               chunk_size: int = 500_000, fit_sample_size: int = 10_000,
+                                               random_state: int = None):
+        """
+        Flag rows whose squared Mahalanobis distance exceeds the chi-square quantile of `confidence`.
+
+        The covariance is Cholesky-factored once and rows are whitened chunk by chunk with one triangular solve,
+        so memory stays bounded by `chunk_size` rows. With `robust` the location and covariance come from the
+        Minimum Covariance Determinant estimator, which is not dragged by the outliers themselves; being costly,
+        it is fitted on at most `fit_sample_size` random complete rows. Rows with a missing value are never flagged.
+        """
+        columns = list(column) if isinstance(column, list) else [column]
+        values = dataframe[columns].to_numpy(dtype=float)
+        complete = ~np.isnan(values).any(axis=1)
+
+        if robust:
+            fit_rows = np.flatnonzero(complete)
+            if len(fit_rows) > fit_sample_size:
+                rng = np.random.default_rng(random_state)
+                fit_rows = rng.choice(fit_rows, fit_sample_size, replace=False)
+            estimator = MinCovDet(random_state=random_state).fit(values[fit_rows])
+            mean_distr, cov_matrix = estimator.location_, estimator.covariance_
+        else:
+            mean_distr = values[complete].mean(axis=0)
+            cov_matrix = np.atleast_2d(np.cov(values[complete], rowvar=False))
+        factor = cholesky(cov_matrix, lower=True)
+
+        squared_distances = np.full(len(values), np.nan)
+        for start in range(0, len(values), chunk_size):
+            whitened = solve_triangular(factor, (values[start:start + chunk_size] - mean_distr).T, lower=True,
+                                        check_finite=False)
+            squared_distances[start:start + chunk_size] = np.einsum('ij,ij->j', whitened, whitened)
+
+        # Squared distances of Gaussian data follow a chi-square law with one degree of freedom per column
+        threshold = chi2.ppf(confidence, len(columns))
+        outliers = squared_distances > threshold
+        return dataframe.index[outliers]
+
+    def identify_outliers_dbscan(self, dataframe: pd.DataFrame, columns: list[str], eps=0.5, min_samples=5,
+                                 sample_size: int = None, n_jobs: int = 1, chunk_size: int = 50_000,
+                                 algorithm: str = 'kd_tree', random_state: int = None):
+        """
+        Flag DBSCAN noise points.
+
+        With `sample_size` set the clustering itself is skipped, as only its noise set is needed: a point is
+        noise when it is not a core point (fewer than `min_samples` points within `eps`) and no core point lies
+        within `eps` of it. A KD-tree (or ball tree) indexes every row, core points are found on a stratified
+        sample, and rows are scored in `chunk_size` chunks across `n_jobs` processes: a row within `eps` of a core
+        sample point is settled with one nearest-neighbour query, and only the remaining sparse rows get exact
+        radius counts. The noise set is the exact DBSCAN one, without DBSCAN's neighbourhood lists, whose memory
+        grows quadratically on dense data.
+        """
         df = dataframe[columns]
+        if sample_size is not None and sample_size < len(df):
+            values = df.to_numpy(dtype=float)
+            tree = self._spatial_index(algorithm)(values)
+            sample = values[self._stratified_sample(values, sample_size, random_state)]
+            is_core = tree.query_radius(sample, eps, count_only=True) >= min_samples
+            core_tree = self._spatial_index(algorithm)(sample[is_core]) if is_core.any() else None
+            tasks = (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+            outliers = np.concatenate(map_in_processes(_dbscan_noise_chunk, tasks, n_jobs=n_jobs,
+                                                       initializer=_init_density_worker,
+                                                       initargs=((tree, core_tree, eps, min_samples),),
+                                                       state=_density_state))
+            return df.index[outliers]
+
         db = DBSCAN(eps=eps, min_samples=min_samples).fit(df)
 
         labels = db.labels_
@@ -117,18 +379,91 @@ class OutlierHandler:
 
         return outlier_indices
 
-    def identify_outliers_lof(self, dataframe: pd.DataFrame, columns: list[str], n_neighbors=20, contamination=0.1):
-        df = dataframe[columns]
+    def identify_outliers_lof(self, dataframe: pd.DataFrame, columns: list[str], n_neighbors=20, contamination=0.1,
+                              n_jobs: int = None, sample_size: int = None, chunk_size: int = 50_000,
+                              algorithm: str = 'kd_tree', random_state: int = None):
+        """
+        Flag Local Outlier Factor outliers.
 
-        # Fit the LOF model
-        lof = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination)
-        y_pred = lof.fit_predict(df)
+        With `sample_size` set the model is fitted on a stratified sample only, its tree index built once, and
+        the other rows are scored against it in `chunk_size` chunks across `n_jobs` processes, so the neighbour
+        graph never spans more than one chunk. Sample rows keep their training labels.
+        """
+        df = dataframe[columns]
+        if sample_size is not None and sample_size < len(df):
+            values = df.to_numpy(dtype=float)
+            sample_rows = self._stratified_sample(values, sample_size, random_state)
+            lof = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination, novelty=True,
+                                     algorithm=algorithm).fit(values[sample_rows])
+            tasks = (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+            outliers = np.concatenate(map_in_processes(_lof_outlier_chunk, tasks, n_jobs=n_jobs,
+                                                       initializer=_init_density_worker, initargs=(lof,),
+                                                       state=_density_state))
+            outliers[sample_rows] = lof.negative_outlier_factor_ < lof.offset_
+            return df.index[outliers]
+
+        # Fitted in novelty mode so the cached model can also score rows appended later
+        y_pred = self._predict_with_cached_model(
+            df, columns, 'lof',
+            lambda: LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination, novelty=True,
+                                       n_jobs=n_jobs),
+            {'n_neighbors': n_neighbors, 'contamination': contamination})
 
         outliers = y_pred == -1
         outlier_indices = df.index[outliers]
 
         return outlier_indices
 
+    @staticmethod
+    def _spatial_index(algorithm: str):
+        if algorithm == 'kd_tree':
+            return KDTree
+        elif algorithm == 'ball_tree':
+            return BallTree
+        raise ValueError(f"Unknown spatial index '{algorithm}'.")
+
+    @staticmethod
+    def _stratified_sample(values: np.ndarray, sample_size: int, random_state: int = None) -> np.ndarray:
+        """
+        Row positions of a sample stratified on a quantile grid of the columns.
+
+        Every non-empty grid cell gets a share of the sample proportional to its size, and at least one row, so
+        the sparse regions where outliers live are always represented. When rounding and those minimums add up
+        to more than `sample_size`, the largest cells give rows back, so the sample never exceeds it. Missing
+        values get a bin of their own in each column, so rows with NaN are sampled like any other cell.
+        """
+        n_rows, n_columns = values.shape
+        bins = max(2, int((sample_size / 20) ** (1 / n_columns)))
+        cells = np.zeros(n_rows, dtype=np.int64)
+        n_cells = 1
+        for position in range(n_columns):
+            if n_cells * (bins + 1) >= 2 ** 62:
+                # Renumber the occupied cells before the codes overflow, there are at most `n_rows` of them
+                _, cells = np.unique(cells, return_inverse=True)
+                n_cells = cells.max() + 1
+            n_cells *= bins + 1
+            column = values[:, position]
+            missing = np.isnan(column)
+            observed = column[~missing]
+            edges = np.quantile(observed, np.linspace(0, 1, bins + 1)[1:-1]) if len(observed) else np.empty(0)
+            cells = cells * (bins + 1) + np.where(missing, bins, np.searchsorted(edges, column, side='right'))
+        _, cells, sizes = np.unique(cells, return_inverse=True, return_counts=True)
+        quotas = np.maximum(1, np.round(sizes * sample_size / n_rows)).astype(int)
+        excess = quotas.sum() - sample_size
+        largest_first = np.argsort(-sizes, kind='stable')
+        while excess > 0:
+            # One row less for each of the `excess` largest cells, down to one row unless every cell is there
+            trimmable = largest_first[quotas[largest_first] > (1 if (quotas > 1).any() else 0)][:excess]
+            quotas[trimmable] -= 1
+            excess -= len(trimmable)
+
+        rng = np.random.default_rng(random_state)
+        shuffled = rng.permutation(n_rows)
+        shuffled = shuffled[np.argsort(cells[shuffled], kind='stable')]
+        starts = np.cumsum(sizes) - sizes
+        rank_in_cell = np.arange(n_rows) - starts[cells[shuffled]]
+        return np.sort(shuffled[rank_in_cell < quotas[cells[shuffled]]])
+
     # -------------- HANDLE OUTLIERS --------------
     @ColumnTypeValidators.is_column_exists
     def handle_outliers(self, dataframe: pd.DataFrame, column: Union[str, int], identifier: Identifier = Identifier.IQR,
@@ -147,22 +482,262 @@ class OutlierHandler:
 
         print(f"Detected Outlier Values {'_'*60}")
         print((dataframe.loc[outlier_indices])[column].head())
-        df_copy = dataframe.copy()
-        df_copy.loc[outlier_indices, column] = np.nan
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = df_copy[column].mask(df_copy.index.isin(outlier_indices))
 
-        missing_handler = MissingValueHandler()
+        # df_copy is already owned by this call, so the filling step can write into it directly
+        missing_handler = MissingValueHandler(ExecutionMode.INPLACE)
         df_copy = missing_handler.replace_missing_values(df_copy, column, filling_strategy, const)
 
         return df_copy
     
+    def handle_outliers_all(self, dataframe: pd.DataFrame, outlier_mask: OutlierMask = None,
+                            filling_strategy: MissingValueHandler.Strategy = MissingValueHandler.Strategy.MEAN,
+                            const=0, **detect_kwargs):
+        """
+        Replace the outliers of many columns in one step.
+
+        `outlier_mask` comes from `detect_all`; when omitted it is computed with `detect_kwargs`. Flagged cells
+        become NaN in a single masked write, then every affected column is filled with one
+        `replace_missing_values_batch` plan.
+        """
+        if outlier_mask is None:
+            outlier_mask = self.detect_all(dataframe, **detect_kwargs)
+        counts = outlier_mask.counts()
+        columns = list(counts.index[counts > 0])
+
+        print(f"Detected Outlier Values {'_'*60}")
+        print(outlier_mask.bounds.assign(outlier_count=counts))
+        df_copy = working_frame(dataframe, self.execution_mode)
+        if not columns:
+            return df_copy
+        flags = outlier_mask.to_frame()[columns].reindex(df_copy.index, fill_value=False)
+        df_copy[columns] = df_copy[columns].mask(flags)
+
+        if filling_strategy == MissingValueHandler.Strategy.CONSTANT:
+            filling_strategy = const
+        missing_handler = MissingValueHandler(ExecutionMode.INPLACE)
+        return missing_handler.replace_missing_values_batch(df_copy, {column: filling_strategy for column in columns})
+
+    def handle_outliers_streaming(self, path: str, output_path: str, columns: list, threshold: float = 1.5,
+                                  filling_strategy: MissingValueHandler.Strategy = MissingValueHandler.Strategy.NONE,
+                                  const=0, chunksize: int = 100_000, sketch_size: int = 200, n_jobs: int = 1,
+                                  random_state: int = None, **read_csv_kwargs) -> pd.DataFrame:
+        """
+        IQR outlier handling for a CSV file larger than memory.
+
+        A first pass derives approximate bounds and medians with `iqr_bounds_streaming`; a second one replaces the
+        outliers of every chunk (NONE leaves them missing, MEDIAN uses the sketch median, CONSTANT uses `const`)
+        and appends it to `output_path`. Returns the bounds. The sketches compact at random, so pass
+        `random_state` for bounds (and output) that are the same from run to run.
+        """
+        Strategy = MissingValueHandler.Strategy
+        if filling_strategy not in (Strategy.NONE, Strategy.MEDIAN, Strategy.CONSTANT):
+            raise ValueError("Invalid strategy")
+        bounds = self.iqr_bounds_streaming(pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs), columns,
+                                           threshold, sketch_size, n_jobs, random_state)
+        replacement = {Strategy.NONE: pd.Series(np.nan, index=columns),
+                       Strategy.MEDIAN: bounds['median'],
+                       Strategy.CONSTANT: pd.Series(const, index=columns)}[filling_strategy]
+
+        chunks = pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs)
+        for position, chunk in enumerate(chunks):
+            values = chunk[columns]
+            outliers = values.lt(bounds['lower']) | values.gt(bounds['upper'])
+            chunk[columns] = values.mask(outliers, replacement, axis=1)
+            chunk.to_csv(output_path, mode='w' if position == 0 else 'a', header=position == 0, index=False)
+        return bounds
+
     @ColumnTypeValidators.numeric_required
     def log_transform(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        df_copy = dataframe.copy()
-        df_copy[column] = df_copy[column].apply(lambda x: np.log(x) if x > 0 else np.nan)
+        transformer = ColumnPowerTransformer(ColumnPowerTransformer.Method.LOG).fit(dataframe, [column])
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = transformer.transform(dataframe)[column]
         return df_copy
     
     @ColumnTypeValidators.numeric_required
     def square_transform(self, dataframe: pd.DataFrame, column: Union[str, int]):
-        df_copy = dataframe.copy()
-        df_copy[column] = df_copy[column].apply(lambda x: np.sqrt(x) if x >= 0 else np.nan)
-        return df_copy
\ No newline at end of file
+        transformer = ColumnPowerTransformer(ColumnPowerTransformer.Method.SQRT).fit(dataframe, [column])
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = transformer.transform(dataframe)[column]
+        return df_copy
+
+
+class OnlineOutlierDetector:
+    """
+    Outlier screening of a live feed, one row batch at a time, without keeping or reprocessing history.
+
+    Every batch is flagged against the state built from the previous batches, then folded into that state,
+    in O(batch) time and constant memory per column:
+
+    - EWMA: exponentially weighted mean and variance with smoothing factor `alpha` (one row per step, in
+      arrival order); a value is an outlier when its z-score exceeds `zscore_threshold`.
+    - WINDOW_IQR: a KLL quantile sketch per column for each of the last `window` batches; a value is an outlier
+      when it falls outside the IQR bounds of the merged window.
+
+    Nothing is flagged until `warmup` values of a column have been seen. Flagged values are kept out of the
+    state so a burst of outliers does not drag the bounds. After `rebaseline_after` consecutive flagged values
+    of a column, the level is taken to have shifted: the state of that column is rebuilt from those values
+    alone (at the end of the batch that completes the run). `rebaseline_after=None` never re-baselines.
+    """
+
+    class Mode(Enum):
+        EWMA = 0
+        WINDOW_IQR = 1
+
+    def __init__(self, columns: list, mode: Mode = Mode.EWMA, alpha: float = 0.01, zscore_threshold: float = 3,
+                 window: int = 20, iqr_threshold: float = 1.5, sketch_size: int = 200, warmup: int = 30,
+                 rebaseline_after: int = 50) -> None:
+        self.columns = list(columns)
+        self.mode = mode
+        self.alpha = alpha
+        self.zscore_threshold = zscore_threshold
+        self.window = window
+        self.iqr_threshold = iqr_threshold
+        self.sketch_size = sketch_size
+        self.warmup = warmup
+        self.rebaseline_after = rebaseline_after
+
+        self.count_ = np.zeros(len(self.columns), dtype=np.int64)
+        self.mean_ = np.full(len(self.columns), np.nan)
+        self.var_ = np.full(len(self.columns), np.nan)
+        self._sketches = deque(maxlen=window)
+        # Latest run of consecutive flagged values of every column
+        self._flagged_runs = [deque(maxlen=rebaseline_after) for _ in self.columns]
+
+    def bounds(self) -> pd.DataFrame:
+        """Current (lower, upper) bounds of every column, NaN during the warm-up."""
+        if self.mode == self.Mode.EWMA:
+            spread = self.zscore_threshold * np.sqrt(self.var_)
+            lower, upper = self.mean_ - spread, self.mean_ + spread
+        else:
+            lower = np.full(len(self.columns), np.nan)
+            upper = np.full(len(self.columns), np.nan)
+            if self._sketches:
+                for position in range(len(self.columns)):
+                    merged = KLLSketch(self.sketch_size)
+                    for batch_sketches in self._sketches:
+                        merged.merge(batch_sketches[position])
+                    q1, q3 = merged.quantile([0.25, 0.75])
+                    lower[position] = q1 - self.iqr_threshold * (q3 - q1)
+                    upper[position] = q3 + self.iqr_threshold * (q3 - q1)
+        warming_up = self.count_ < self.warmup
+        lower[warming_up] = np.nan
+        upper[warming_up] = np.nan
+        return pd.DataFrame({'lower': lower, 'upper': upper}, index=self.columns)
+
+    def update(self, batch: pd.DataFrame) -> OutlierMask:
+        """Flag the outliers of `batch` against the current state, then add its inliers to the state."""
+        values = batch[self.columns].to_numpy(dtype=float)
+        bounds = self.bounds()
+        with np.errstate(invalid='ignore'):
+            flags = (values < bounds['lower'].to_numpy()) | (values > bounds['upper'].to_numpy())
+        self.partial_fit(np.where(flags, np.nan, values))
+        if self.rebaseline_after is not None:
+            self._track_flagged_runs(values, flags)
+        return OutlierMask(batch.index, self.columns, flags, bounds)
+
+    def _track_flagged_runs(self, values: np.ndarray, flags: np.ndarray):
+        for position, run in enumerate(self._flagged_runs):
+            valid = ~np.isnan(values[:, position])
+            column_values, column_flags = values[valid, position], flags[valid, position]
+            inliers = np.flatnonzero(~column_flags)
+            if inliers.size:
+                # An inlier ends the run, only the flagged values after the last one count
+                run.clear()
+                column_values = column_values[inliers[-1] + 1:]
+            run.extend(column_values)
+            if len(run) == self.rebaseline_after:
+                self._rebaseline(position, np.array(run))
+                run.clear()
+
+    def _rebaseline(self, position: int, run: np.ndarray):
+        """Restart the state of one column from the values of its flagged run."""
+        if self.mode == self.Mode.EWMA:
+            self.mean_[position] = run.mean()
+            self.var_[position] = run.var()
+        else:
+            for batch_sketches in self._sketches:
+                batch_sketches[position] = KLLSketch(self.sketch_size)
+            self._sketches[-1][position].update(run)
+        self.count_[position] = len(run)
+
+    def partial_fit(self, values) -> "OnlineOutlierDetector":
+        """Fold a batch (DataFrame or rows x columns array) into the state without flagging it."""
+        if isinstance(values, pd.DataFrame):
+            values = values[self.columns].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        if self.mode == self.Mode.EWMA:
+            self._update_ewma(values, valid)
+        else:
+            self._sketches.append([KLLSketch(self.sketch_size).update(values[:, position])
+                                   for position in range(len(self.columns))])
+        self.count_ += valid.sum(axis=0)
+        return self
+
+    def _update_ewma(self, values: np.ndarray, valid: np.ndarray):
+        # Columns seen for the first time start from the plain moments of the batch
+        new = np.isnan(self.mean_) & valid.any(axis=0)
+        if new.any():
+            with np.errstate(invalid='ignore'):
+                self.mean_[new] = np.nanmean(values[:, new], axis=0)
+                self.var_[new] = np.nanvar(values[:, new], axis=0)
+            valid = valid & ~new
+        if not valid.any():
+            return
+
+        # Closed form of the row-by-row recursions m <- (1 - a) m + a x and q <- (1 - a) q + a x^2: the weight
+        # of a row decays with the number of valid rows that arrive after it. Moments are taken around the
+        # previous mean to avoid cancellation in var = q - m^2.
+        decay = 1 - self.alpha
+        later_rows = valid[::-1].cumsum(axis=0)[::-1] - valid
+        weights = np.where(valid, self.alpha * decay ** later_rows, 0.0)
+        centered = np.where(valid, values - self.mean_, 0.0)
+        retained = decay ** valid.sum(axis=0)
+        shift = (weights * centered).sum(axis=0)
+        second_moment = retained * self.var_ + (weights * centered ** 2).sum(axis=0)
+        updated = valid.any(axis=0)
+        self.mean_[updated] += shift[updated]
+        self.var_[updated] = np.maximum(second_moment[updated] - shift[updated] ** 2, 0.0)
+
+
+# -------------- PROCESS POOL WORKERS --------------
+_density_state = {}
+
+
+def _init_density_worker(model):
+    _density_state['model'] = model
+
+
+def _dbscan_noise_chunk(chunk: np.ndarray) -> np.ndarray:
+    """DBSCAN noise flags of one chunk, see `OutlierHandler.identify_outliers_dbscan`."""
+    tree, core_tree, eps, min_samples = _density_state['model']
+    noise = np.ones(len(chunk), dtype=bool)
+    if core_tree is not None:
+        distances, _ = core_tree.query(chunk, k=1)
+        noise = distances[:, 0] > eps
+    candidates = np.flatnonzero(noise)
+    if candidates.size == 0:
+        return noise
+
+    # Rows that are core points themselves
+    is_core = tree.query_radius(chunk[candidates], eps, count_only=True) >= min_samples
+    noise[candidates[is_core]] = False
+    candidates = candidates[~is_core]
+    if candidates.size == 0:
+        return noise
+
+    # Border rows: within eps of a core point missing from the sample. These rows are sparse by construction,
+    # so their neighbourhoods are small.
+    neighbourhoods = tree.query_radius(chunk[candidates], eps)
+    neighbours = np.unique(np.concatenate(neighbourhoods))
+    data = np.asarray(tree.data)
+    core_neighbours = neighbours[tree.query_radius(data[neighbours], eps, count_only=True) >= min_samples]
+    for position, neighbourhood in zip(candidates, neighbourhoods):
+        if np.isin(neighbourhood, core_neighbours).any():
+            noise[position] = False
+    return noise
+
+
+def _lof_outlier_chunk(chunk: np.ndarray) -> np.ndarray:
+    return _density_state['model'].predict(chunk) == -1
@@ -12,22 +12,22 @@ missing_handler.print_nan_ratios(df)
 # Missing Values analysed. No missing value found. Skipping replacement...
 
 
-# Clean the texts on CAUSES column
-text_cleaner = text_cleaner.TextCleaner()
-
-# Remove punctuations
-df = text_cleaner.replace_regex(df, 'CAUSE', text_cleaner.RegexPatterns.PUNCTUATION.value, '')
-# Remove multiple blanks
-df = text_cleaner.replace_regex(df, 'CAUSE', text_cleaner.RegexPatterns.MULTI_BLANK_CHARACTERS.value, '')
+# Clean the texts on CAUSES column and preprocess them for NLP models in a single pass per string
+cause_pipeline = (text_cleaner.TextPipeline()
+                  # Remove punctuations
+                  .replace_regex(text_cleaner.TextCleaner.RegexPatterns.PUNCTUATION, '')
+                  # Remove multiple blanks
+                  .replace_regex(text_cleaner.TextCleaner.RegexPatterns.MULTI_BLANK_CHARACTERS, '')
+                  # Remove Stopwords
+                  .remove_stopwords('english'))
+cleaner = text_cleaner.TextCleaner()
+df = cleaner.apply_pipeline(df, 'CAUSE', cause_pipeline)
 print(f"\nAFTER TEXT CLEANING PROCESS {'_'*60}\n")
 print(df)
 
 
-# Preprocess the texts on CAUSES column for NLP models
+# Vectorize the texts on CAUSES column for NLP models
 language_processor = language_processor.LanguageProcessor()
-# Remove Stopwords
-df = language_processor.remove_stopwords(df, 'CAUSE')
-
 # Calculate TF-IDF
 tf_idf_data = language_processor.tf_idf(df, 'CAUSE')
 print(f"\nTF-IDF VECTORS {'_'*60}")
@@ -1,7 +1,10 @@
+import re
 import pandas as pd
 from typing import Union
 from nltk.corpus import stopwords
 from modules.helpers.validators import ColumnTypeValidators
+from modules.helpers.execution import ExecutionMode, working_frame
+from modules.helpers.parallel import map_in_processes
 from enum import Enum
 
 class TextCleaner:
@@ -22,9 +25,9 @@ class TextCleaner:
         MENTION = r'^@[a-zA-Z0-9_]+$'
 
 
-    def __init__(self) -> None:
+    def __init__(self, execution_mode: ExecutionMode = ExecutionMode.COPY) -> None:
         """"""
-        pass
+        self.execution_mode = execution_mode
     
     @ColumnTypeValidators.string_required
     def remove_repetitive_words(self, dataframe: pd.DataFrame, column: Union[str, int]) -> pd.DataFrame:
@@ -40,20 +43,121 @@ class TextCleaner:
                     seen.add(word)
             return ' '.join(unique_words)
 
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column].apply(remove_duplicates)
         return df_copy
 
     @ColumnTypeValidators.string_required
     def replace_regex(self, dataframe: pd.DataFrame, column: Union[str, int], regex:Union[RegexPatterns, str] = RegexPatterns.PUNCTUATION, replacement:str=''):
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         df_copy[column] = df_copy[column].str.replace(regex, replacement, regex=True)
         return df_copy
 
 
     @ColumnTypeValidators.string_required
     def filter_words(self, dataframe: pd.DataFrame, column: Union[str, int], remove=['fword']):
-        df_copy = dataframe.copy()
+        df_copy = working_frame(dataframe, self.execution_mode)
         remove_set = set(remove)
         df_copy[column] = df_copy[column].apply(lambda x: ' '.join([word for word in x.split() if word.lower() not in remove_set]))
         return df_copy
+
+    @ColumnTypeValidators.string_required
+    def apply_pipeline(self, dataframe: pd.DataFrame, column: Union[str, int], pipeline: "TextPipeline",
+                       n_jobs: int = 1, chunk_size: int = 100_000):
+        """Run every step of `pipeline` on the column in one pass per string and write the result back once."""
+        cleaned = pipeline.transform(dataframe[column], n_jobs=n_jobs, chunk_size=chunk_size)
+        df_copy = working_frame(dataframe, self.execution_mode)
+        df_copy[column] = cleaned
+        return df_copy
+
+
+class TextPipeline:
+    """
+    A chain of text cleaning steps compiled once and applied to each string in a single pass.
+
+    Steps are added in order with the builder methods (each returns the pipeline). Regexes are compiled when
+    added. Consecutive word steps (`filter_words`, `remove_stopwords`, `remove_repetitive_words`) are fused into a
+    single split / filter / join of the string, their word sets being merged. Missing values are passed through.
+
+    Example:
+        pipeline = (TextPipeline().replace_regex(TextCleaner.RegexPatterns.PUNCTUATION)
+                    .remove_stopwords('english').remove_repetitive_words())
+        df = TextCleaner().apply_pipeline(df, 'CAUSE', pipeline)
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.steps = []
+
+    def replace_regex(self, regex: Union[TextCleaner.RegexPatterns, str] = TextCleaner.RegexPatterns.PUNCTUATION,
+                      replacement: str = '') -> "TextPipeline":
+        pattern = regex.value if isinstance(regex, TextCleaner.RegexPatterns) else regex
+        self.steps.append(('regex', re.compile(pattern), replacement))
+        return self
+
+    def filter_words(self, remove=['fword']) -> "TextPipeline":
+        """Drop the words whose lowercase form is in `remove`, like `TextCleaner.filter_words`."""
+        return self._add_word_step(set(remove), False)
+
+    def remove_stopwords(self, language: str = 'english') -> "TextPipeline":
+        try:
+            stop_words = set(stopwords.words(language))
+        except OSError:
+            raise ValueError(f"Language '{language}' is not supported for stopword removal.")
+        return self._add_word_step(stop_words, False)
+
+    def remove_repetitive_words(self) -> "TextPipeline":
+        """Keep the first occurrence of every word."""
+        return self._add_word_step(set(), True)
+
+    def _add_word_step(self, removed: set, deduplicate: bool) -> "TextPipeline":
+        # Filtering by word and keeping first occurrences commute, so adjacent word steps merge into one
+        if self.steps and self.steps[-1][0] == 'words':
+            _, previous_removed, previous_deduplicate = self.steps[-1]
+            self.steps[-1] = ('words', previous_removed | removed, previous_deduplicate or deduplicate)
+        else:
+            self.steps.append(('words', removed, deduplicate))
+        return self
+
+    def clean(self, text):
+        """Apply every step to one string."""
+        if not isinstance(text, str):
+            return text
+        for kind, first, second in self.steps:
+            if kind == 'regex':
+                text = first.sub(second, text)
+            else:
+                words = [word for word in text.split() if word.lower() not in first] if first else text.split()
+                if second:
+                    words = list(dict.fromkeys(words))
+                text = ' '.join(words)
+        return text
+
+    def transform(self, series: pd.Series, n_jobs: int = 1, chunk_size: int = 100_000) -> pd.Series:
+        """
+        Clean a whole column. With n_jobs != 1, columns longer than `chunk_size` are split in chunks cleaned by a
+        process pool, the pipeline being shipped once per worker.
+        """
+        values = series.to_numpy(dtype=object)
+        if n_jobs == 1 or len(values) <= chunk_size:
+            cleaned = [self.clean(text) for text in values]
+        else:
+            chunks = (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+            cleaned = [text for chunk in map_in_processes(_clean_chunk, chunks, n_jobs=n_jobs,
+                                                          initializer=_init_pipeline_worker, initargs=(self,),
+                                                          state=_pipeline_state)
+                       for text in chunk]
+        return pd.Series(cleaned, index=series.index, name=series.name, dtype=object)
+
+
+# -------------- PROCESS POOL WORKERS --------------
+_pipeline_state = {}
+
+
+def _init_pipeline_worker(pipeline: TextPipeline):
+    _pipeline_state['pipeline'] = pipeline
+
+
+def _clean_chunk(values) -> list:
+    clean = _pipeline_state['pipeline'].clean
+    return [clean(text) for text in values]
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+
+from modules.helpers.batch_scaler import BatchScaler
+
+SCALERS = [(BatchScaler.Method.STANDARD, StandardScaler), (BatchScaler.Method.MINMAX, MinMaxScaler),
+           (BatchScaler.Method.ROBUST, RobustScaler)]
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'delay': rng.lognormal(2, 1, 20_000), 'distance': rng.uniform(50, 3000, 20_000),
+                         'constant': np.full(20_000, 7.0)})
+
+
+@pytest.mark.parametrize('method, reference', SCALERS)
+def test_fit_equals_sklearn(frame, method, reference):
+    scaled = BatchScaler(method).fit_transform(frame)
+    np.testing.assert_allclose(scaled.to_numpy(), reference().fit_transform(frame), rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize('method, reference', SCALERS)
+def test_missing_values_are_ignored_and_kept(frame, method, reference):
+    frame.iloc[::7, 0] = np.nan
+    scaled = BatchScaler(method).fit_transform(frame)
+    np.testing.assert_allclose(scaled.to_numpy(), reference().fit_transform(frame), rtol=1e-10, atol=1e-10)
+    assert scaled['delay'].isna().sum() == frame['delay'].isna().sum()
+
+
+@pytest.mark.parametrize('method', [BatchScaler.Method.STANDARD, BatchScaler.Method.MINMAX])
+def test_partial_fit_equals_fit(frame, method):
+    scaler = BatchScaler(method)
+    for start in range(0, len(frame), 3000):
+        scaler.partial_fit(frame.iloc[start:start + 3000])
+    fitted = BatchScaler(method).fit(frame)
+    np.testing.assert_allclose(scaler.center_, fitted.center_, rtol=1e-12)
+    np.testing.assert_allclose(scaler.scale_, fitted.scale_, rtol=1e-10)
+
+
+def test_robust_partial_fit_is_close(frame):
+    scaler = BatchScaler(BatchScaler.Method.ROBUST)
+    for start in range(0, len(frame), 3000):
+        scaler.partial_fit(frame.iloc[start:start + 3000])
+    for column in ['delay', 'distance']:
+        rank = (frame[column] <= scaler.center_[column]).mean()
+        assert abs(rank - 0.5) < 0.0165
+
+
+def test_inverse_transform_round_trips(frame):
+    scaler = BatchScaler(BatchScaler.Method.ROBUST).fit(frame)
+    pd.testing.assert_frame_equal(scaler.inverse_transform(scaler.transform(frame)), frame)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+from modules.helpers.categorical_encoder import CategoricalEncoder
+
+
+@pytest.fixture
+def flights():
+    rng = np.random.default_rng(0)
+    cities = np.array(['Boston', 'Austin', 'Denver', 'Chicago', 'Seattle'])
+    return pd.DataFrame({'ORIGIN_CITY': rng.choice(cities[:4], 500), 'DEST_CITY': rng.choice(cities[1:], 500),
+                         'CARRIER': rng.choice(['AA', 'DL', 'UA'], 500)})
+
+
+def test_codes_equal_label_encoder(flights):
+    encoded = CategoricalEncoder().fit_transform(flights)
+    for column in flights.columns:
+        np.testing.assert_array_equal(encoded[column], LabelEncoder().fit_transform(flights[column]))
+        assert encoded[column].dtype == np.int8
+
+
+def test_shared_vocabulary_gives_equal_codes(flights):
+    encoder = CategoricalEncoder().fit(flights, shared=[['ORIGIN_CITY', 'DEST_CITY']])
+    encoded = encoder.transform(flights)
+    same_city = (flights['ORIGIN_CITY'] == flights['DEST_CITY']).to_numpy()
+    assert same_city.any()
+    np.testing.assert_array_equal(encoded['ORIGIN_CITY'][same_city], encoded['DEST_CITY'][same_city])
+    assert encoder.vocabularies_['ORIGIN_CITY'] is encoder.vocabularies_['DEST_CITY']
+
+
+def test_inverse_transform_round_trips(flights):
+    encoder = CategoricalEncoder().fit(flights, shared=[['ORIGIN_CITY', 'DEST_CITY']])
+    decoded = encoder.inverse_transform(encoder.transform(flights))
+    pd.testing.assert_frame_equal(decoded.astype(object), flights)
+
+
+def test_unknown_values(flights):
+    later = pd.DataFrame({'CARRIER': ['AA', 'B6', None]})
+    encoder = CategoricalEncoder().fit(flights, ['CARRIER'])
+    np.testing.assert_array_equal(encoder.transform(later)['CARRIER'], [0, -1, -1])
+    with pytest.raises(ValueError):
+        CategoricalEncoder(CategoricalEncoder.Unknown.ERROR).fit(flights, ['CARRIER']).transform(later)
+
+
+def test_saved_vocabularies_stay_shared(flights, tmp_path):
+    encoder = CategoricalEncoder().fit(flights, shared=[['ORIGIN_CITY', 'DEST_CITY']])
+    encoder.save(tmp_path / 'vocabularies.pkl')
+    loaded = CategoricalEncoder.load(tmp_path / 'vocabularies.pkl')
+    assert loaded.vocabularies_['ORIGIN_CITY'] is loaded.vocabularies_['DEST_CITY']
+    pd.testing.assert_frame_equal(loaded.transform(flights), encoder.transform(flights))
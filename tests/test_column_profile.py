@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from modules.helpers.column_profile import ColumnProfileCache
+
+
+@pytest.fixture
+def cache():
+    return ColumnProfileCache()
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    values = rng.normal(5, 2, 1000)
+    values[::13] = np.nan
+    return pd.DataFrame({'x': values, 'copy': values.copy()})
+
+
+def test_profile_is_computed_once(cache, frame):
+    profile = cache.profile(frame['x'])
+    assert cache.profile(frame['x']) is profile
+    # Identical content shares the profile
+    assert cache.profile(frame['copy']) is profile
+    values = frame['x'].dropna()
+    assert profile.count == len(values) and profile.missing_count == frame['x'].isna().sum()
+    assert profile.mean == pytest.approx(values.mean()) and profile.std == pytest.approx(values.std())
+    assert (profile.q1, profile.median, profile.q3) == pytest.approx(tuple(values.quantile([0.25, 0.5, 0.75])))
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda df: df.__setitem__('x', df['x'] + 1),
+    lambda df: df.loc.__setitem__((3, 'x'), 100.0),
+    lambda df: df.fillna({'x': 0}, inplace=True),
+])
+def test_profile_is_invalidated_when_the_column_changes(cache, frame, mutate):
+    before = cache.profile(frame['x'])
+    cache.normality_test(frame['x'], 'shapiro')
+    mutate(frame)
+    after = cache.profile(frame['x'])
+    assert after is not before
+    assert after.mean == pytest.approx(frame['x'].mean())
+    assert after.tests == {}
+
+
+@pytest.mark.parametrize('test, reference', [
+    ('shapiro', lambda values: stats.shapiro(values)),
+    ('kstest', lambda values: stats.kstest(values, 'norm')),
+    ('kstest_fitted', lambda values: stats.kstest(values, 'norm', args=(values.mean(), values.std(ddof=1)))),
+    ('normaltest', lambda values: stats.normaltest(values)),
+])
+def test_cached_tests_equal_scipy(cache, frame, test, reference):
+    values = frame['x'].dropna().to_numpy()
+    expected = reference(values)
+    assert cache.normality_test(frame['x'], test) == pytest.approx((expected[0], expected[1]))
+    # Second call is a cache hit with the same result
+    assert cache.normality_test(frame['x'], test) == cache.profile(frame['x']).tests[test]
+
+
+def test_unknown_test_and_eviction(cache, frame):
+    with pytest.raises(ValueError):
+        cache.normality_test(frame['x'], 'lilliefors')
+    small = ColumnProfileCache(max_entries=2)
+    first = small.profile(frame['x'])
+    small.profile(frame['x'] + 1)
+    small.profile(frame['x'] + 2)
+    assert small.profile(frame['x']) is not first
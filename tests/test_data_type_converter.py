@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from modules.data_type_converter import DataTypeConverter
+
+
+@pytest.fixture
+def converter():
+    return DataTypeConverter()
+
+
+@pytest.fixture
+def mixed_frame():
+    rng = np.random.default_rng(0)
+    n = 2000
+    return pd.DataFrame({
+        'small': rng.integers(-100, 100, n),
+        'medium': rng.integers(0, 30_000, n),
+        'halves': rng.integers(0, 8, n) / 2,
+        'gaussian': rng.normal(size=n),
+        'whole': rng.integers(0, 50, n).astype(float),
+        'with_nan': np.where(rng.random(n) < 0.1, np.nan, rng.integers(0, 500, n).astype(float)),
+        'carrier': np.array(['AA', 'DL', 'UA'], dtype=object)[rng.integers(0, 3, n)],
+        'tail': np.array([f"N{i}" for i in range(n)], dtype=object),
+    })
+
+
+def test_compact_dtypes_keeps_values(converter, mixed_frame):
+    compacted, report = converter.compact_dtypes(mixed_frame, return_report=True)
+    assert compacted['small'].dtype == np.int8
+    assert compacted['medium'].dtype == np.int16
+    assert compacted['halves'].dtype == np.float32
+    assert compacted['gaussian'].dtype == np.float64
+    assert compacted['whole'].dtype == np.int8
+    assert compacted['carrier'].dtype == 'category'
+    assert compacted['tail'].dtype == object
+    for column in mixed_frame:
+        pd.testing.assert_series_equal(compacted[column].astype(mixed_frame[column].dtype), mixed_frame[column])
+    assert (report['bytes_after'] <= report['bytes_before']).all()
+    assert report['bytes_saved'].sum() > 0
+
+
+def test_compact_dtypes_nullable_backend(converter, mixed_frame):
+    compacted = converter.compact_dtypes(mixed_frame, backend=DataTypeConverter.DtypeBackend.NULLABLE,
+                                         category_threshold=None)
+    assert compacted['with_nan'].dtype == 'Int16'
+    assert compacted['tail'].dtype == 'string'
+    assert compacted['with_nan'].isna().sum() == mixed_frame['with_nan'].isna().sum()
+
+
+def test_categorical_encoding_equals_label_encoder(converter, mixed_frame):
+    encoded = converter.categorical_encoding(mixed_frame, ['carrier'], suffix='_ENCODED')
+    np.testing.assert_array_equal(encoded['carrier_ENCODED'], LabelEncoder().fit_transform(mixed_frame['carrier']))
+
+
+def test_sparse_one_hot_equals_get_dummies(converter, mixed_frame):
+    dense = converter.one_hot_encoding(mixed_frame, 'carrier')
+    sparse = converter.one_hot_encoding(mixed_frame, 'carrier', sparse_output=True)
+    assert list(sparse.columns) == list(dense.columns)
+    for column in ['carrier_AA', 'carrier_DL', 'carrier_UA']:
+        np.testing.assert_array_equal(sparse[column].sparse.to_dense(), dense[column].astype(np.uint8))
+
+
+def test_standardize_data_equals_standard_scaler(converter, mixed_frame):
+    standardized = converter.standardize_data(mixed_frame, 'gaussian')
+    expected = StandardScaler().fit_transform(mixed_frame[['gaussian']])[:, 0]
+    np.testing.assert_allclose(standardized['gaussian'], expected, rtol=1e-10)
+    pd.testing.assert_frame_equal(standardized.drop(columns='gaussian'), mixed_frame.drop(columns='gaussian'))
+
+
+def test_streaming_scaler_equals_in_memory_fit(converter, mixed_frame, tmp_path):
+    columns = ['medium', 'gaussian', 'with_nan']
+    mixed_frame.to_csv(tmp_path / 'frame.csv', index=False)
+    streamed = converter.fit_scaler_streaming(tmp_path / 'frame.csv', columns, chunksize=300)
+    expected = converter.scale_columns(mixed_frame, columns)
+    pd.testing.assert_frame_equal(converter.scale_columns(mixed_frame, columns, scaler=streamed), expected)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data_type_converter import DataTypeConverter
+from modules.helpers.execution import ExecutionMode, working_frame
+from modules.missing_value_handler import MissingValueHandler
+from modules.outlier_handler import OutlierHandler
+from modules.text_cleaner import TextCleaner
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=200)
+    values[::9] = np.nan
+    values[5] = 40.0
+    return pd.DataFrame({'value': values, 'other': rng.normal(size=200),
+                         'text': np.array(['a, b', 'c!', 'd e'], dtype=object)[rng.integers(0, 3, 200)]})
+
+
+# Each call replaces the 'value' (or 'text') column and leaves 'other' alone
+TRANSFORMS = {
+    'replace_mean': (MissingValueHandler, lambda handler, df: handler.replace_mean(df, 'value'), 'value'),
+    'handle_outliers': (OutlierHandler, lambda handler, df: handler.handle_outliers(
+        df, 'value', filling_strategy=MissingValueHandler.Strategy.MEDIAN), 'value'),
+    'standardize_data': (DataTypeConverter, lambda handler, df: handler.standardize_data(df, 'other'), 'other'),
+    'replace_regex': (TextCleaner, lambda handler, df: handler.replace_regex(df, 'text', r'[^\w\s]'), 'text'),
+}
+
+
+def test_working_frame_modes(frame):
+    assert working_frame(frame, ExecutionMode.INPLACE) is frame
+    for mode in (ExecutionMode.COPY, ExecutionMode.COLUMN_COPY):
+        assert working_frame(frame, mode) is not frame
+    assert not np.shares_memory(working_frame(frame, ExecutionMode.COPY)['other'].to_numpy(),
+                                frame['other'].to_numpy())
+    assert np.shares_memory(working_frame(frame, ExecutionMode.COLUMN_COPY)['other'].to_numpy(),
+                            frame['other'].to_numpy())
+
+
+@pytest.mark.parametrize('name', TRANSFORMS)
+def test_copy_leaves_the_input_untouched(frame, name):
+    cls, transform, changed = TRANSFORMS[name]
+    original = frame.copy()
+    result = transform(cls(ExecutionMode.COPY), frame)
+    pd.testing.assert_frame_equal(frame, original)
+    assert not result[changed].equals(original[changed])
+    for column in frame:
+        assert not np.shares_memory(result[column].to_numpy(), frame[column].to_numpy())
+
+
+@pytest.mark.parametrize('name', TRANSFORMS)
+def test_column_copy_does_not_write_through(frame, name):
+    cls, transform, changed = TRANSFORMS[name]
+    original = frame.copy()
+    result = transform(cls(ExecutionMode.COLUMN_COPY), frame)
+    pd.testing.assert_frame_equal(frame, original)
+    pd.testing.assert_frame_equal(result, transform(cls(ExecutionMode.COPY), original))
+    assert not np.shares_memory(result[changed].to_numpy(), frame[changed].to_numpy())
+    # Untouched columns are shared rather than copied
+    untouched = next(column for column in ('other', 'value') if column != changed)
+    assert np.shares_memory(result[untouched].to_numpy(), frame[untouched].to_numpy())
+
+
+@pytest.mark.parametrize('name', TRANSFORMS)
+def test_inplace_returns_the_same_object(frame, name):
+    cls, transform, changed = TRANSFORMS[name]
+    expected = transform(cls(ExecutionMode.COPY), frame)
+    result = transform(cls(ExecutionMode.INPLACE), frame)
+    assert result is frame
+    pd.testing.assert_frame_equal(frame, expected)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from sklearn.mixture import GaussianMixture
+
+from modules.helpers.gmm_imputer import GaussianMixtureImputer
+
+
+@pytest.fixture
+def clusters():
+    rng = np.random.default_rng(0)
+    first = rng.multivariate_normal([0, 0, 0], [[1, 0.8, 0.2], [0.8, 1, 0.1], [0.2, 0.1, 1]], 1500)
+    second = rng.multivariate_normal([6, -4, 2], [[1, -0.6, 0], [-0.6, 1, 0.3], [0, 0.3, 1]], 1000)
+    return np.concatenate([first, second])
+
+
+def test_complete_data_equals_gaussian_mixture(clusters):
+    imputer = GaussianMixtureImputer(n_components=2, tol=1e-10, max_iter=500).fit(clusters)
+    reference = GaussianMixture(2, random_state=42, tol=1e-10, max_iter=500).fit(clusters)
+    order, reference_order = np.argsort(imputer.means_[:, 0]), np.argsort(reference.means_[:, 0])
+    np.testing.assert_allclose(imputer.weights_[order], reference.weights_[reference_order], atol=1e-6)
+    np.testing.assert_allclose(imputer.means_[order], reference.means_[reference_order], atol=1e-6)
+    np.testing.assert_allclose(imputer.covariances_[order], reference.covariances_[reference_order], atol=1e-6)
+
+
+def test_chunked_transform_equals_full_transform(clusters):
+    incomplete = clusters.copy()
+    incomplete[np.random.default_rng(1).random(incomplete.shape) < 0.15] = np.nan
+    imputer = GaussianMixtureImputer(n_components=2).fit(incomplete)
+    full = imputer.transform(incomplete)
+    imputer.batch_size = 333
+    np.testing.assert_allclose(imputer.transform(incomplete), full, rtol=1e-12)
+    assert not np.isnan(full).any()
+    np.testing.assert_array_equal(full[~np.isnan(incomplete)], incomplete[~np.isnan(incomplete)])
+
+
+def test_imputes_from_the_right_component(clusters):
+    incomplete = clusters.copy()
+    missing = np.random.default_rng(2).random(len(incomplete)) < 0.2
+    incomplete[missing, 1] = np.nan
+
+    def error(imputed):
+        return np.sqrt(np.mean((imputed[missing, 1] - clusters[missing, 1]) ** 2))
+
+    mixture = error(GaussianMixtureImputer(n_components=2).fit_transform(incomplete))
+    single = error(GaussianMixtureImputer(n_components=1).fit_transform(incomplete))
+    assert mixture < 0.8 * single
+    assert mixture < 0.4 * error(np.where(np.isnan(incomplete), np.nanmean(incomplete, axis=0), incomplete))
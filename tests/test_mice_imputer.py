@@ -0,0 +1,79 @@
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer
+
+from modules.helpers.mice_imputer import ParallelMICEImputer
+
+
+@pytest.fixture
+def collinear_data():
+    # DEP_DELAY / ARR_DELAY like pair, missing together, plus two other incomplete columns
+    rng = np.random.default_rng(0)
+    n = 3000
+    departure = rng.normal(10, 30, n)
+    arrival = departure + rng.normal(0, 3, n)
+    data = np.c_[departure, arrival, rng.normal(15, 5, n), rng.normal(800, 300, n) + 0.1 * departure]
+    together = rng.random(n) < 0.2
+    data[together, 0] = np.nan
+    data[together, 1] = np.nan
+    data[rng.random(n) < 0.1, 2] = np.nan
+    data[rng.random(n) < 0.05, 3] = np.nan
+    return data
+
+
+def test_converges_like_iterative_imputer(collinear_data):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        reference = IterativeImputer(max_iter=10, random_state=0)
+        expected = reference.fit_transform(collinear_data)
+    imputer = ParallelMICEImputer(max_iter=10)
+    imputed = imputer.fit_transform(collinear_data)
+
+    assert imputer.converged_
+    assert imputer.n_iter_ == reference.n_iter_
+    np.testing.assert_allclose(imputed, expected, atol=1e-8)
+
+
+def test_result_does_not_depend_on_max_iter_parity(collinear_data):
+    odd = ParallelMICEImputer(max_iter=9).fit_transform(collinear_data)
+    even = ParallelMICEImputer(max_iter=10).fit_transform(collinear_data)
+    np.testing.assert_array_equal(odd, even)
+
+
+def test_observed_values_are_kept(collinear_data):
+    imputed = ParallelMICEImputer().fit_transform(collinear_data)
+    observed = ~np.isnan(collinear_data)
+    assert not np.isnan(imputed).any()
+    np.testing.assert_array_equal(imputed[observed], collinear_data[observed])
+
+
+@pytest.mark.parametrize('n_imputations', [1, 3])
+def test_parallel_result_equals_serial(collinear_data, n_imputations):
+    serial = ParallelMICEImputer(n_imputations=n_imputations, random_state=1)
+    parallel = ParallelMICEImputer(n_imputations=n_imputations, random_state=1, n_jobs=2)
+    np.testing.assert_array_equal(serial.fit_transform(collinear_data), parallel.fit_transform(collinear_data))
+    assert len(parallel.imputations_) == n_imputations
+
+
+def test_multiple_imputations_keep_early_stopping(collinear_data):
+    single = ParallelMICEImputer(max_iter=10)
+    expected = single.fit_transform(collinear_data)
+    multiple = ParallelMICEImputer(max_iter=10, n_imputations=4, n_jobs=2)
+    imputed = multiple.fit_transform(collinear_data)
+
+    assert multiple.converged_ and multiple.n_iter_ == single.n_iter_ < 10
+    missing = np.isnan(collinear_data)
+    draws = np.array(multiple.imputations_)[:, missing]
+    assert (draws.std(axis=0) > 0).all()
+    # Draws scatter around the converged conditional means
+    assert np.abs(imputed[missing] - expected[missing]).mean() < draws.std(axis=0).mean()
+
+
+def test_independent_imputations_are_reproducible(collinear_data):
+    first = ParallelMICEImputer(max_iter=3, n_imputations=3, random_state=1)
+    second = ParallelMICEImputer(max_iter=3, n_imputations=3, random_state=1, n_jobs=2)
+    np.testing.assert_allclose(first.fit_transform(collinear_data), second.fit_transform(collinear_data))
+    assert len(first.imputations_) == 3
@@ -0,0 +1,297 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.impute import KNNImputer
+from sklearn.linear_model import LinearRegression
+
+from modules.missing_value_handler import MissingValueHandler, StreamingImputer
+
+
+@pytest.fixture
+def handler():
+    return MissingValueHandler()
+
+
+@pytest.fixture
+def sparse_frame():
+    # Every row has a missing cell and one column is almost empty, like the DIV* columns of the flight data
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(1500, 5))
+    values[:, 1] += values[:, 0]
+    values[rng.random(values.shape) < 0.2] = np.nan
+    values[:, 4] = np.where(rng.random(len(values)) < 0.995, np.nan, values[:, 4])
+    return pd.DataFrame(values, columns=list('abcde'))
+
+
+@pytest.mark.parametrize('block_size, n_jobs', [(64, 1), (500, 2)])
+def test_blocked_knn_equals_knn_imputer(handler, sparse_frame, block_size, n_jobs):
+    expected = KNNImputer(n_neighbors=3).fit_transform(sparse_frame)
+    imputed = handler.knn_imputation(sparse_frame, n_neighbors=3, block_size=block_size, n_jobs=n_jobs)
+    np.testing.assert_allclose(imputed.to_numpy(), expected, atol=1e-10)
+
+
+def test_blocked_knn_keeps_empty_columns_missing(handler, sparse_frame):
+    sparse_frame['empty'] = np.nan
+    imputed = handler.knn_imputation(sparse_frame, block_size=256)
+    assert imputed['empty'].isna().all()
+    assert not imputed.drop(columns='empty').isna().any().any()
+
+
+def test_nan_ratios_see_in_place_writes(handler):
+    frame = pd.DataFrame({'a': np.arange(10.0), 'b': ['x'] * 10})
+    assert handler.calculate_nan_ratios(frame, [])['a'] == 0
+    frame.loc[3, 'a'] = np.nan
+    assert handler.calculate_nan_ratios(frame, [])['a'] == pytest.approx(0.1)
+    assert handler.scan_missing_values(frame)['nan_count']['a'] == 1
+
+
+def test_scan_counts_sentinels_like_replace(handler):
+    frame = pd.DataFrame({'a': [1.0, -999, np.nan, 4.0], 'b': ['?', 'x', None, '?']})
+    expected = frame.replace(['?', -999], np.nan).isna().sum()
+    scan = handler.scan_missing_values(frame, ['?', -999])
+    pd.testing.assert_series_equal(scan['missing_count'], expected, check_names=False)
+
+
+def test_scan_of_chunks_equals_scan_of_frame(handler, sparse_frame):
+    chunks = [sparse_frame.iloc[start:start + 400] for start in range(0, len(sparse_frame), 400)]
+    pd.testing.assert_frame_equal(handler.scan_missing_values(chunks), handler.scan_missing_values(sparse_frame))
+
+
+@pytest.fixture
+def grouped_frame():
+    # Unsorted index and order key, interleaved groups
+    rng = np.random.default_rng(1)
+    n = 1200
+    frame = pd.DataFrame({'group': rng.integers(0, 15, n), 'key': rng.permutation(n) * 2.0,
+                          'when': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.permutation(n), unit='h'),
+                          'a': rng.normal(size=n).cumsum(), 'b': rng.normal(size=n)},
+                         index=rng.permutation(n) * 5)
+    frame.loc[rng.random(n) < 0.3, 'a'] = np.nan
+    frame.loc[rng.random(n) < 0.2, 'b'] = np.nan
+    return frame
+
+
+def _grouped_reference(frame, method, key=None):
+    """pandas' interpolation of every group, rows sorted by the interpolation key."""
+    parts = []
+    for _, group in frame.groupby('group'):
+        group = group.sort_index() if key is None else group.sort_values(key, kind='stable')
+        keyed = group[['a', 'b']] if key is None else group.set_index(key)[['a', 'b']]
+        parts.append(keyed.interpolate(method=method).set_axis(group.index))
+    return pd.concat(parts).reindex(frame.index)
+
+
+@pytest.mark.parametrize('method', ['linear', 'pad'])
+def test_grouped_interpolation_in_row_order(handler, grouped_frame, method):
+    reference = (lambda s: s.ffill()) if method == 'pad' else (lambda s: s.interpolate(method=method))
+    expected = grouped_frame.groupby('group')[['a', 'b']].transform(reference)
+    result = handler.interpolate_missings(grouped_frame, ['a', 'b'], method, group_by='group')
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-10)
+
+
+def test_grouped_index_interpolation_on_unsorted_index(handler, grouped_frame):
+    result = handler.interpolate_missings(grouped_frame, ['a', 'b'], 'index', group_by='group', n_jobs=2)
+    expected = _grouped_reference(grouped_frame, 'index')
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-10)
+
+
+@pytest.mark.parametrize('method, key', [('values', 'key'), ('time', 'when')])
+def test_grouped_interpolation_along_order_by(handler, grouped_frame, method, key):
+    result = handler.interpolate_missings(grouped_frame, ['a', 'b'], method, group_by='group', order_by=key)
+    expected = _grouped_reference(grouped_frame, method, key)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-10)
+
+
+@pytest.mark.parametrize('sizes', [[10, 90], [90, 10], [1, 1, 198], [3, 500]])
+@pytest.mark.parametrize('n_jobs', [2, 3])
+def test_grouped_interpolation_with_skewed_groups(handler, sizes, n_jobs):
+    rng = np.random.default_rng(2)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+    frame = pd.DataFrame({'group': groups, 'a': rng.normal(size=len(groups)), 'b': rng.normal(size=len(groups))})
+    frame.loc[rng.random(len(frame)) < 0.3, ['a', 'b']] = np.nan
+    result = handler.interpolate_missings(frame, ['a', 'b'], 'linear', group_by='group', n_jobs=n_jobs)
+    expected = frame.groupby('group')[['a', 'b']].transform(lambda s: s.interpolate())
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, atol=1e-10)
+
+
+def test_grouped_interpolation_ties_take_the_observed_value(handler):
+    frame = pd.DataFrame({'group': [0] * 5, 'key': [3.0, 1.0, 1.0, 3.0, 5.0], 'a': [np.nan, 10.0, np.nan, 30.0, 50.0]})
+    result = handler.interpolate_missings(frame, 'a', 'values', group_by='group', order_by='key')
+    assert result['a'].tolist() == [30.0, 10.0, 10.0, 30.0, 50.0]
+
+
+@pytest.fixture
+def mixed_missing_frame():
+    rng = np.random.default_rng(3)
+    n = 400
+    frame = pd.DataFrame({'x': rng.normal(size=n), 'y': rng.integers(0, 5, n).astype(float),
+                          'z': rng.lognormal(size=n), 'w': rng.normal(size=n),
+                          'label': np.array(['a', 'b', 'c'], dtype=object)[rng.integers(0, 3, n)]})
+    for column in frame:
+        frame.loc[rng.random(n) < 0.15, column] = np.nan
+    return frame
+
+
+SINGLE_COLUMN_STRATEGIES = [MissingValueHandler.Strategy.MODE, MissingValueHandler.Strategy.MEAN,
+                            MissingValueHandler.Strategy.MEDIAN, MissingValueHandler.Strategy.REMOVE_ROW,
+                            MissingValueHandler.Strategy.REMOVE_COLUMN, MissingValueHandler.Strategy.FORWARD,
+                            MissingValueHandler.Strategy.BACKWARD]
+
+
+@pytest.mark.parametrize('strategy', SINGLE_COLUMN_STRATEGIES)
+def test_batch_plan_equals_replace_missing_values(handler, mixed_missing_frame, strategy):
+    expected = handler.replace_missing_values(mixed_missing_frame, 'y', strategy)
+    result = handler.replace_missing_values_batch(mixed_missing_frame, {'y': strategy})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_batch_constant_equals_replace_missing_values(handler, mixed_missing_frame):
+    expected = handler.replace_missing_values(mixed_missing_frame, 'label', MissingValueHandler.Strategy.CONSTANT,
+                                              'unknown')
+    pd.testing.assert_frame_equal(handler.replace_missing_values_batch(mixed_missing_frame, {'label': 'unknown'}),
+                                  expected)
+
+
+def test_batch_plan_equals_chained_calls(handler, mixed_missing_frame):
+    # Removals come first in the batch plan, so the chained reference applies them first too
+    plan = {'w': MissingValueHandler.Strategy.REMOVE_ROW, 'x': MissingValueHandler.Strategy.MEAN,
+            'y': MissingValueHandler.Strategy.MODE, 'z': MissingValueHandler.Strategy.MEDIAN,
+            'label': MissingValueHandler.Strategy.FORWARD}
+    expected = mixed_missing_frame
+    for column, strategy in plan.items():
+        expected = handler.replace_missing_values(expected, column, strategy)
+    result = handler.replace_missing_values_batch(mixed_missing_frame, plan)
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(result) < len(mixed_missing_frame)
+
+
+@pytest.fixture
+def hot_deck_frame():
+    rng = np.random.default_rng(4)
+    frame = pd.DataFrame(rng.normal(size=(600, 4)), columns=list('abcd'))
+    frame = frame.mask(rng.random(frame.shape) < 0.15)
+    frame.iloc[0] = np.nan
+    return frame
+
+
+def test_hot_deck_donors_are_complete_nearby_rows(handler, hot_deck_frame):
+    imputed = handler.hot_deck_imputation(hot_deck_frame, n_neighbors=5, random_state=0)
+    values, filled = hot_deck_frame.to_numpy(), imputed.to_numpy()
+    donors = values[~np.isnan(values).any(axis=1)]
+    for row in np.flatnonzero(np.isnan(values).any(axis=1)):
+        pattern = np.isnan(values[row])
+        # One complete row supplies every missing cell of the row
+        matches = np.flatnonzero((donors[:, pattern] == filled[row, pattern]).all(axis=1))
+        assert len(matches) == 1
+        if not pattern.all():
+            distances = np.linalg.norm(donors[:, ~pattern] - values[row, ~pattern], axis=1)
+            assert distances[matches[0]] <= np.sort(distances)[4]
+    np.testing.assert_array_equal(filled[~np.isnan(values)], values[~np.isnan(values)])
+
+
+def test_hot_deck_is_reproducible(handler, hot_deck_frame):
+    first = handler.hot_deck_imputation(hot_deck_frame, random_state=7)
+    pd.testing.assert_frame_equal(first, handler.hot_deck_imputation(hot_deck_frame, random_state=7))
+    assert not first.equals(handler.hot_deck_imputation(hot_deck_frame, random_state=8))
+
+
+@pytest.fixture
+def streamed_frame():
+    rng = np.random.default_rng(5)
+    n = 5000
+    frame = pd.DataFrame({'mean': rng.normal(size=n), 'median': rng.lognormal(size=n),
+                          'mode': rng.integers(0, 20, n).astype(float), 'forward': rng.normal(size=n).cumsum(),
+                          'key': rng.normal(size=n), 'constant': rng.normal(size=n)})
+    for column in frame:
+        frame.loc[rng.random(n) < 0.1, column] = np.nan
+    # Runs of missing values crossing chunk boundaries, one covering a whole chunk
+    frame.loc[995:1010, 'forward'] = np.nan
+    frame.loc[2000:2499, 'forward'] = np.nan
+    return frame
+
+
+def _chunks(frame, size=500):
+    return [frame.iloc[start:start + size] for start in range(0, len(frame), size)]
+
+
+def test_streaming_forward_fill_crosses_chunk_boundaries(streamed_frame):
+    imputer = StreamingImputer({'forward': MissingValueHandler.Strategy.FORWARD}).fit(_chunks(streamed_frame))
+    streamed = pd.concat(imputer.transform_chunks(_chunks(streamed_frame)))
+    pd.testing.assert_series_equal(streamed['forward'], streamed_frame['forward'].ffill())
+
+
+def test_streaming_statistics_match_the_one_shot_fill(handler, streamed_frame):
+    Strategy = MissingValueHandler.Strategy
+    plan = {'mean': Strategy.MEAN, 'median': Strategy.MEDIAN, 'mode': Strategy.MODE, 'constant': 0.0,
+            'key': Strategy.REMOVE_ROW}
+    imputer = StreamingImputer(plan).fit(_chunks(streamed_frame))
+    expected = handler.replace_missing_values_batch(streamed_frame, plan)
+    streamed = pd.concat(imputer.transform_chunks(_chunks(streamed_frame)))
+
+    pd.testing.assert_index_equal(streamed.index, expected.index)
+    for column in ['mean', 'mode', 'constant']:
+        pd.testing.assert_series_equal(streamed[column], expected[column], check_exact=False, rtol=1e-12)
+    # The median comes from a KLL sketch: its rank among the surviving values is within the sketch error
+    survivors = streamed_frame.loc[expected.index, 'median'].dropna()
+    assert abs((survivors <= imputer.fill_values_['median']).mean() - 0.5) < 0.0165
+    observed = streamed_frame.loc[expected.index, 'median'].notna()
+    pd.testing.assert_series_equal(streamed['median'][observed], expected['median'][observed])
+
+
+def test_streaming_csv_equals_batch_plan(handler, streamed_frame, tmp_path):
+    Strategy = MissingValueHandler.Strategy
+    plan = {'mean': Strategy.MEAN, 'forward': Strategy.FORWARD, 'key': Strategy.REMOVE_ROW,
+            'constant': Strategy.REMOVE_COLUMN}
+    streamed_frame.to_csv(tmp_path / 'input.csv', index=False)
+    handler.replace_missing_values_streaming(tmp_path / 'input.csv', tmp_path / 'output.csv', plan, chunksize=700)
+    expected = handler.replace_missing_values_batch(streamed_frame, plan).reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'output.csv'), expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.fixture
+def regression_frame():
+    rng = np.random.default_rng(6)
+    n = 800
+    frame = pd.DataFrame(rng.normal(size=(n, 3)), columns=['p1', 'p2', 'p3'])
+    frame['t1'] = 2 * frame['p1'] - frame['p2'] + rng.normal(0, 0.1, n)
+    frame['t2'] = frame['p3'] + 0.5 * frame['p1'] + rng.normal(0, 0.1, n)
+    frame.loc[rng.random(n) < 0.2, 't1'] = np.nan
+    frame.loc[rng.random(n) < 0.3, 't2'] = np.nan
+    return frame
+
+
+def _per_target_regression(frame, target, predictors):
+    """The per-target LinearRegression the shared normal equations replace, one sub-model per pattern."""
+    filled = frame[target].copy()
+    complete = frame[predictors].notna().all(axis=1)
+    train = complete & frame[target].notna()
+    patterns = frame[predictors].isna().apply(tuple, axis=1)
+    for pattern, rows in frame[frame[target].isna()].groupby(patterns).groups.items():
+        observed = [column for column, is_missing in zip(predictors, pattern) if not is_missing]
+        if observed:
+            model = LinearRegression().fit(frame.loc[train, observed], frame.loc[train, target])
+            filled[rows] = model.predict(frame.loc[rows, observed])
+        else:
+            filled[rows] = frame.loc[train, target].mean()
+    return filled
+
+
+def test_multi_target_regression_equals_per_target_models(handler, regression_frame):
+    predictors = ['p1', 'p2', 'p3']
+    result = handler.regression_imputation(regression_frame, ['t1', 't2'], predictors)
+    for target in ['t1', 't2']:
+        expected = _per_target_regression(regression_frame, target, predictors)
+        pd.testing.assert_series_equal(result[target], expected, check_exact=False, atol=1e-9)
+
+
+def test_regression_with_partially_missing_predictors(handler, regression_frame):
+    rng = np.random.default_rng(7)
+    regression_frame.loc[rng.random(len(regression_frame)) < 0.15, 'p2'] = np.nan
+    regression_frame.loc[rng.random(len(regression_frame)) < 0.1, 'p3'] = np.nan
+    regression_frame.loc[regression_frame.index[:3], ['p1', 'p2', 'p3']] = np.nan
+    predictors = ['p1', 'p2', 'p3']
+    result = handler.regression_imputation(regression_frame, ['t1', 't2'], predictors)
+    for target in ['t1', 't2']:
+        expected = _per_target_regression(regression_frame, target, predictors)
+        pd.testing.assert_series_equal(result[target], expected, check_exact=False, atol=1e-9)
+        assert not result[target].isna().any()
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from modules.helpers.one_hot_encoder import SparseOneHotEncoder
+
+
+def test_sparse_encoding_equals_get_dummies():
+    series = pd.Series(np.random.default_rng(0).choice(list('abcdef'), 1000), name='letter')
+    encoded = SparseOneHotEncoder().fit(series).transform_frame(series)
+    expected = pd.get_dummies(series, prefix='letter', dtype=np.uint8)
+    pd.testing.assert_frame_equal(encoded.sparse.to_dense(), expected)
+
+
+def test_hashed_encoding_keeps_types_apart():
+    series = pd.Series([1, '1', 1.0, True], dtype=object)
+    matrix = SparseOneHotEncoder(hash_features=2 ** 20).fit_transform(series)
+    assert len(set(matrix.indices)) == 4
+
+
+def test_hashed_encoding_is_consistent_across_dtypes():
+    encoder = SparseOneHotEncoder(hash_features=64)
+    typed = encoder.fit_transform(pd.Series([3, 1, 3, 2, None], dtype='Int64'))
+    mixed = encoder.transform(pd.Series([3, 1, 3, 2, None], dtype=object))
+    np.testing.assert_array_equal(typed.toarray(), mixed.toarray())
+    assert typed[4].nnz == 0
+
+
+def test_hashed_object_keys_equal_formatted_values():
+    values = [1, '1', 1.0, True, 'a', 2, 'a', 1.0, None, False, 0]
+    series = pd.Series(values, dtype=object).dropna()
+    keys = SparseOneHotEncoder._hash_keys(series)
+    assert list(keys) == [repr(value) for value in series]
+
+
+def test_other_column_does_not_collide_with_an_other_level():
+    series = pd.Series(['other'] * 5 + ['a'] * 4 + ['b'] * 3 + ['c'], name='kind')
+    encoder = SparseOneHotEncoder(max_categories=2).fit(series)
+    assert encoder.feature_names_ == ['kind_a', 'kind_other', 'kind__other']
+    encoded = encoder.transform_frame(series).sparse.to_dense()
+    assert encoded['kind_other'].sum() == 5 and encoded['kind__other'].sum() == 4
+    # Without a clash the label is kept
+    assert SparseOneHotEncoder(max_categories=2).fit(series[5:]).feature_names_ == ['kind_a', 'kind_b', 'kind_other']
@@ -0,0 +1,267 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from scipy.spatial import distance
+from sklearn.cluster import DBSCAN
+from sklearn.neighbors import LocalOutlierFactor
+
+from modules.helpers.model_cache import ModelCache, shared_model_cache
+from modules.missing_value_handler import MissingValueHandler
+from modules.outlier_handler import OutlierHandler, OnlineOutlierDetector
+
+
+def _level_shift_batches(shift: float = 10.0, batch_size: int = 50):
+    rng = np.random.default_rng(0)
+    before = [rng.normal(0, 1, batch_size) for _ in range(10)]
+    after = [rng.normal(shift, 1, batch_size) for _ in range(10)]
+    return [pd.DataFrame({'x': batch}) for batch in before + after]
+
+
+@pytest.mark.parametrize('mode', list(OnlineOutlierDetector.Mode))
+def test_online_detector_adapts_to_level_shift(mode):
+    detector = OnlineOutlierDetector(['x'], mode=mode, rebaseline_after=50)
+    flagged = [detector.update(batch).counts()['x'] for batch in _level_shift_batches()]
+    assert flagged[10] == 50
+    assert sum(flagged[12:]) <= 5
+
+
+@pytest.mark.parametrize('mode', list(OnlineOutlierDetector.Mode))
+def test_online_detector_without_rebaseline_keeps_flagging(mode):
+    detector = OnlineOutlierDetector(['x'], mode=mode, rebaseline_after=None)
+    flagged = [detector.update(batch).counts()['x'] for batch in _level_shift_batches()]
+    assert all(count == 50 for count in flagged[10:])
+
+
+def test_online_detector_isolated_outliers_do_not_rebaseline():
+    detector = OnlineOutlierDetector(['x'], rebaseline_after=5)
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        detector.update(pd.DataFrame({'x': rng.normal(0, 1, 100)}))
+    spiky = rng.normal(0, 1, 100)
+    spiky[::10] = 50.0
+    mask = detector.update(pd.DataFrame({'x': spiky}))
+    assert mask.column_mask('x')[::10].all()
+    assert abs(detector.mean_[0]) < 0.5
+
+
+@pytest.mark.parametrize('n_columns, sample_size', [(1, 100), (2, 500), (3, 997), (12, 50)])
+def test_stratified_sample_never_exceeds_sample_size(n_columns, sample_size):
+    values = np.random.default_rng(0).standard_cauchy((5000, n_columns))
+    rows = OutlierHandler._stratified_sample(values, sample_size, random_state=0)
+    assert len(rows) <= sample_size
+    assert len(np.unique(rows)) == len(rows)
+
+
+def test_stratified_sample_includes_rows_with_missing_values():
+    values = np.random.default_rng(0).normal(size=(5000, 2))
+    values[:50, 0] = np.nan
+    values[50:60, 1] = np.nan
+    rows = OutlierHandler._stratified_sample(values, 500, random_state=0)
+    assert len(rows) <= 500
+    # Each missing pattern is its own stratum, sampled in proportion
+    assert np.isnan(values[rows, 0]).sum() == 5
+    assert np.isnan(values[rows, 1]).sum() >= 1
+
+
+def test_stratified_sample_with_many_columns():
+    values = np.random.default_rng(0).normal(size=(2000, 48))
+    rows = OutlierHandler._stratified_sample(values, 200, random_state=0)
+    assert 0 < len(rows) <= 200 and len(np.unique(rows)) == len(rows)
+
+
+def test_handlers_share_the_model_cache_by_default():
+    frame = pd.DataFrame({'x': np.random.default_rng(0).normal(size=300)})
+    fits = []
+
+    def build_model():
+        fits.append(1)
+        return LocalOutlierFactor(novelty=True)
+
+    shared_model_cache.clear()
+    first = OutlierHandler()._predict_with_cached_model(frame, 'x', 'lof', build_model, {})
+    second = OutlierHandler()._predict_with_cached_model(frame, 'x', 'lof', build_model, {})
+    np.testing.assert_array_equal(first, second)
+    assert len(fits) == 1
+    assert OutlierHandler(model_cache=ModelCache()).model_cache is not shared_model_cache
+
+
+def _counting_lof(fits: list):
+    def build_model():
+        fits.append(1)
+        return LocalOutlierFactor(novelty=True)
+    return build_model
+
+
+def test_cached_fit_is_reused_for_appended_rows():
+    frame = pd.DataFrame({'x': np.random.default_rng(9).normal(size=400)})
+    cache, fits = ModelCache(), []
+    handler = OutlierHandler(model_cache=cache)
+    first = handler._predict_with_cached_model(frame.iloc[:300], 'x', 'lof', _counting_lof(fits), {})
+    extended = handler._predict_with_cached_model(frame, 'x', 'lof', _counting_lof(fits), {})
+    assert len(fits) == 1 and len(cache) == 1
+    np.testing.assert_array_equal(extended[:300], first)
+
+
+def test_handler_without_model_cache_always_fits():
+    frame = pd.DataFrame({'x': np.random.default_rng(10).normal(size=200)})
+    shared_model_cache.clear()
+    handler, fits = OutlierHandler(use_model_cache=False), []
+    for _ in range(2):
+        handler._predict_with_cached_model(frame, 'x', 'lof', _counting_lof(fits), {})
+    assert len(fits) == 2 and len(shared_model_cache) == 0
+
+
+def test_model_cache_is_bounded_by_bytes():
+    cache = ModelCache(max_bytes=3 * 8 * 10_000 + 1000)
+    for position in range(5):
+        cache.put(('model', position), np.zeros(10_000))
+    assert len(cache) == 3 and cache.nbytes <= cache.max_bytes
+    assert cache.get(('model', 0)) is None and cache.get(('model', 4)) is not None
+    cache.put(('large',), np.zeros(100_000))
+    assert cache.get(('large',)) is None and len(cache) == 3
+    assert shared_model_cache.max_bytes is not None
+
+
+@pytest.fixture
+def handler():
+    return OutlierHandler()
+
+
+@pytest.fixture
+def skewed_frame():
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({'normal': rng.normal(10, 2, 2000), 'skewed': rng.lognormal(size=2000),
+                         'heavy': rng.standard_t(2, 2000)})
+
+
+@pytest.mark.parametrize('chunk_size', [500_000, 333])
+def test_mahalanobis_equals_scipy_distances(handler, skewed_frame, chunk_size):
+    columns = ['normal', 'heavy']
+    values = skewed_frame[columns].to_numpy()
+    inverse = np.linalg.inv(np.cov(values, rowvar=False))
+    mean = values.mean(axis=0)
+    squared = np.array([distance.mahalanobis(row, mean, inverse) ** 2 for row in values])
+    expected = skewed_frame.index[squared > stats.chi2.ppf(0.99, len(columns))]
+    flagged = handler.identify_outliers_mahalanobis_distance(skewed_frame, columns, chunk_size=chunk_size)
+    pd.testing.assert_index_equal(flagged, expected)
+
+
+@pytest.mark.parametrize('identifier, single', [(OutlierHandler.Identifier.IQR, 'identify_outliers_iqr'),
+                                                (OutlierHandler.Identifier.ZSCORE, 'identify_outliers_zscore')])
+def test_detect_all_equals_per_column_detection(handler, skewed_frame, identifier, single):
+    mask = handler.detect_all(skewed_frame, identifier=identifier)
+    for column in skewed_frame.columns:
+        expected = getattr(handler, single)(skewed_frame, column)
+        pd.testing.assert_index_equal(mask.indices(column), expected)
+
+
+def test_detect_all_auto_picks_the_per_column_method(handler, skewed_frame):
+    mask = handler.detect_all(skewed_frame)
+    for column in skewed_frame.columns:
+        assert mask.bounds.loc[column, 'method'] == handler.choose_outlier_method(skewed_frame, column).name
+
+
+def test_vectorized_ks_equals_scipy(skewed_frame):
+    values = skewed_frame.to_numpy().copy()
+    values[:500, 1] = np.nan
+    ordered = np.sort(values, axis=0)
+    counts = (~np.isnan(ordered)).sum(axis=0)
+    mean, std = np.nanmean(values, axis=0), np.nanstd(values, axis=0, ddof=1)
+    p_values = OutlierHandler._ks_normality_pvalues(ordered, counts, mean, std)
+    for position in range(values.shape[1]):
+        column = values[:, position][~np.isnan(values[:, position])]
+        expected = stats.kstest(column, 'norm', args=(column.mean(), column.std(ddof=1))).pvalue
+        assert p_values[position] == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+
+def test_handle_outliers_all_equals_per_column_handling(handler, skewed_frame):
+    expected = skewed_frame
+    for column in skewed_frame.columns:
+        expected = handler.handle_outliers(expected, column, OutlierHandler.Identifier.IQR,
+                                           MissingValueHandler.Strategy.MEAN)
+    handled = handler.handle_outliers_all(skewed_frame, identifier=OutlierHandler.Identifier.IQR)
+    pd.testing.assert_frame_equal(handled, expected)
+
+
+def test_sampled_dbscan_noise_equals_dbscan(handler):
+    rng = np.random.default_rng(6)
+    centers = rng.uniform(-10, 10, (4, 2))
+    values = np.concatenate([rng.normal(centers[cluster], 0.3, (600, 2)) for cluster in range(4)]
+                            + [rng.uniform(-12, 12, (150, 2))])
+    frame = pd.DataFrame(values, columns=['x', 'y'])
+    expected = frame.index[DBSCAN(eps=0.4, min_samples=8).fit(frame).labels_ == -1]
+    flagged = handler.identify_outliers_dbscan(frame, ['x', 'y'], eps=0.4, min_samples=8, sample_size=800,
+                                               chunk_size=700, random_state=0)
+    pd.testing.assert_index_equal(flagged, expected)
+
+
+def test_lof_equals_fit_predict(handler, skewed_frame):
+    columns = ['normal', 'heavy']
+    expected = LocalOutlierFactor(n_neighbors=20, contamination=0.1).fit_predict(skewed_frame[columns]) == -1
+    flagged = OutlierHandler(model_cache=ModelCache()).identify_outliers_lof(skewed_frame, columns)
+    pd.testing.assert_index_equal(flagged, skewed_frame.index[expected])
+
+
+def test_detect_grouped_equals_per_group_detection(handler, skewed_frame):
+    skewed_frame['group'] = np.random.default_rng(5).choice(['a', 'b', 'c'], len(skewed_frame))
+    mask = handler.detect_grouped(skewed_frame, 'group', ['skewed', 'heavy'])
+    for column in ['skewed', 'heavy']:
+        expected = np.concatenate([handler.identify_outliers_iqr(group, column)
+                                   for _, group in skewed_frame.groupby('group')])
+        np.testing.assert_array_equal(mask.indices(column), np.sort(expected))
+
+
+def test_ewma_equals_sequential_recursion():
+    rng = np.random.default_rng(7)
+    values = rng.normal(5, 2, (400, 2))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    detector = OnlineOutlierDetector(['a', 'b'], alpha=0.05)
+    for start in range(0, len(values), 37):
+        detector.partial_fit(values[start:start + 37])
+
+    for position in range(2):
+        column = values[:, position]
+        first = column[:37][~np.isnan(column[:37])]
+        mean, square = first.mean(), first.var() + first.mean() ** 2
+        for value in column[37:][~np.isnan(column[37:])]:
+            mean = 0.95 * mean + 0.05 * value
+            square = 0.95 * square + 0.05 * value ** 2
+        assert detector.mean_[position] == pytest.approx(mean, rel=1e-10)
+        assert detector.var_[position] == pytest.approx(square - mean ** 2, rel=1e-8)
+
+
+@pytest.fixture
+def delays_csv(tmp_path):
+    rng = np.random.default_rng(8)
+    frame = pd.DataFrame({'delay': rng.lognormal(2, 1, 30_000), 'taxi': rng.normal(15, 4, 30_000)})
+    frame.loc[rng.random(len(frame)) < 0.05, 'taxi'] = np.nan
+    frame.to_csv(tmp_path / 'delays.csv', index=False)
+    return frame, tmp_path / 'delays.csv'
+
+
+def test_streaming_iqr_bounds_within_sketch_error(handler, delays_csv):
+    frame, _ = delays_csv
+    chunks = [frame.iloc[start:start + 4000] for start in range(0, len(frame), 4000)]
+    bounds = handler.iqr_bounds_streaming(chunks, ['delay', 'taxi'], random_state=0)
+    for column in ['delay', 'taxi']:
+        values = frame[column].dropna()
+        for quantile, name in [(0.25, 'q1'), (0.5, 'median'), (0.75, 'q3')]:
+            assert abs((values <= bounds.loc[column, name]).mean() - quantile) < 0.0165
+
+
+def test_streaming_handling_is_reproducible_and_close_to_in_memory(handler, delays_csv, tmp_path):
+    frame, path = delays_csv
+    outputs = []
+    for run in range(2):
+        output = tmp_path / f'handled_{run}.csv'
+        handler.handle_outliers_streaming(path, output, ['delay', 'taxi'], chunksize=4000, random_state=0)
+        outputs.append(pd.read_csv(output))
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+    for column in ['delay', 'taxi']:
+        streamed = outputs[0][column].isna() & frame[column].notna()
+        in_memory = frame.index.isin(handler.identify_outliers_iqr(frame, column))
+        # Only values next to the bounds can change side, a small share of the rows
+        assert (streamed.to_numpy() != in_memory).mean() < 0.01
+        assert in_memory.sum() > 0
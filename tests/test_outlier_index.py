@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from langgraph_agent.tools.outlier_handler_tool import OutlierHandler
+from langgraph_agent.tools.outlier_index import OutlierIndex
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    normal = rng.permutation(stats.norm.ppf((np.arange(400) + 0.5) / 400))
+    normal[0] = 4.5
+    skewed = rng.exponential(1, 400)
+    skewed[10] = 60
+    return pd.DataFrame({'normal': normal, 'skewed': skewed, 'clean': rng.uniform(0, 1, 400),
+                         'label': ['a', 'b'] * 200})
+
+
+def test_index_matches_direct_detection(frame):
+    index = OutlierIndex(frame, version=1)
+    assert index.version == 1
+    assert list(index.columns) == ['normal', 'skewed', 'clean']
+    assert index.is_normal == {'normal': True, 'skewed': False, 'clean': False}
+
+    handler = OutlierHandler(frame)
+    for column in index.columns:
+        np.testing.assert_array_equal(index.outlier_mask(column), np.asarray(handler._detect_outliers(frame[column])))
+    q1, q3 = frame['skewed'].quantile([0.25, 0.75])
+    assert index.outlier_count('skewed') == ((frame['skewed'] < q1 - 1.5 * (q3 - q1)) |
+                                             (frame['skewed'] > q3 + 1.5 * (q3 - q1))).sum()
+    assert index.has_outliers('normal') and index.has_outliers('skewed') and not index.has_outliers('clean')
+    assert index.any_outliers()
+
+
+def test_covers_only_indexed_columns(frame):
+    index = OutlierIndex(frame)
+    assert index.covers(frame['normal'])
+    assert not index.covers(frame['label'])
+    assert not index.covers(pd.Series(frame['normal'].to_numpy(), name='other'))
+    assert not index.covers(frame['normal'].iloc[:10])
+
+
+def test_handler_with_index_matches_handler_without(frame):
+    with_index = frame.copy()
+    without_index = frame.copy()
+    log = OutlierHandler(with_index, OutlierIndex(with_index)).handle_outliers()
+    assert log == OutlierHandler(without_index).handle_outliers()
+    pd.testing.assert_frame_equal(with_index, without_index)
+
+
+class TestToolIndex:
+    @pytest.fixture
+    def tools(self, frame):
+        pytest.importorskip('langgraph')
+        from langgraph_agent.tools import tools
+        tools.dataset = frame
+        tools.mark_dataset_changed()
+        return tools
+
+    def test_index_is_built_once_per_version(self, tools):
+        index = tools.get_outlier_index()
+        assert index.version == tools.dataset_version
+        assert tools.get_outlier_index() is index
+        tools.mark_dataset_changed()
+        assert tools.get_outlier_index() is not index
+
+    def test_tool_write_invalidates_index(self, tools):
+        tools.dataset.loc[:4, 'clean'] = np.nan
+        index = tools.get_outlier_index()
+        tools.replace_with_mean.invoke({'column_name': 'clean'})
+        assert tools.get_outlier_index() is not index
+
+        index = tools.get_outlier_index()
+        tools.handle_outliers.invoke({})
+        rebuilt = tools.get_outlier_index()
+        assert rebuilt is not index
+        assert rebuilt.outlier_count('skewed') == OutlierIndex(tools.dataset).outlier_count('skewed')
@@ -0,0 +1,35 @@
+import numpy as np
+
+from modules.helpers.parallel import map_in_processes, resolve_n_jobs
+
+_test_state = {}
+
+
+def _init_state(array):
+    _test_state['array'] = array
+
+
+def _row_sum(row):
+    return float(_test_state['array'][row].sum())
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(3) == 3
+    assert resolve_n_jobs(-1) >= 1
+
+
+def test_serial_path_clears_worker_state():
+    array = np.arange(12.0).reshape(4, 3)
+    results = map_in_processes(_row_sum, range(4), n_jobs=1, initializer=_init_state, initargs=(array,),
+                               state=_test_state)
+    assert results == [3.0, 12.0, 21.0, 30.0]
+    assert _test_state == {}
+
+
+def test_parallel_path_keeps_task_order():
+    array = np.arange(40.0).reshape(20, 2)
+    tasks = (row for row in range(20))
+    results = map_in_processes(_row_sum, tasks, n_jobs=2, initializer=_init_state, initargs=(array,),
+                               state=_test_state)
+    assert results == [float(array[row].sum()) for row in range(20)]
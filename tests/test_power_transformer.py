@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import PowerTransformer
+
+from modules.helpers.power_transformer import ColumnPowerTransformer
+
+
+@pytest.fixture
+def positive_frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'lognormal': rng.lognormal(size=5000), 'gamma': rng.gamma(0.5, 3, 5000) + 1e-3,
+                         'square': rng.uniform(1, 4, 5000) ** 2})
+
+
+@pytest.mark.parametrize('method, name', [(ColumnPowerTransformer.Method.BOX_COX, 'box-cox'),
+                                          (ColumnPowerTransformer.Method.YEO_JOHNSON, 'yeo-johnson')])
+def test_power_transform_equals_sklearn(positive_frame, method, name):
+    frame = positive_frame if name == 'box-cox' else positive_frame - 2
+    transformer = ColumnPowerTransformer(method).fit(frame)
+    reference = PowerTransformer(method=name, standardize=False).fit(frame)
+    np.testing.assert_allclose(transformer.lambdas_, reference.lambdas_, rtol=1e-4)
+    np.testing.assert_allclose(transformer.transform(frame).to_numpy(), reference.transform(frame),
+                               rtol=1e-4, atol=1e-6)
+
+
+@pytest.mark.parametrize('method', list(ColumnPowerTransformer.Method))
+def test_inverse_transform_round_trips(positive_frame, method):
+    transformer = ColumnPowerTransformer(method).fit(positive_frame)
+    restored = transformer.inverse_transform(transformer.transform(positive_frame))
+    np.testing.assert_allclose(restored.to_numpy(), positive_frame.to_numpy(), rtol=1e-9)
+
+
+def test_out_of_domain_values_become_missing():
+    frame = pd.DataFrame({'x': [-2.0, -1.0, 0.0, 1.0]})
+    for method, missing in [(ColumnPowerTransformer.Method.LOG, 3), (ColumnPowerTransformer.Method.LOG1P, 2),
+                            (ColumnPowerTransformer.Method.SQRT, 2)]:
+        assert ColumnPowerTransformer(method).fit_transform(frame)['x'].isna().sum() == missing
+
+
+@pytest.mark.parametrize('method, column', [(ColumnPowerTransformer.Method.BOX_COX, [-1.0, 0.0, -3.0]),
+                                            (ColumnPowerTransformer.Method.BOX_COX, [np.nan] * 3),
+                                            (ColumnPowerTransformer.Method.YEO_JOHNSON, [np.nan] * 3),
+                                            (ColumnPowerTransformer.Method.YEO_JOHNSON, [2.0, 2.0, np.nan])])
+def test_fit_rejects_columns_without_usable_values(method, column):
+    frame = pd.DataFrame({'ok': [1.0, 2.0, 5.0], 'bad': column})
+    with pytest.raises(ValueError, match="'bad'"):
+        ColumnPowerTransformer(method).fit(frame)
+
+
+def test_fixed_transforms_accept_any_column():
+    frame = pd.DataFrame({'x': [np.nan, np.nan]})
+    assert ColumnPowerTransformer(ColumnPowerTransformer.Method.LOG).fit_transform(frame)['x'].isna().all()
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.helpers.sketches import FrequentItems, KLLSketch, RunningMoments, sketch_chunks
+
+
+@pytest.fixture
+def stream():
+    return np.random.default_rng(0).lognormal(size=200_000)
+
+
+def _rank_errors(values: np.ndarray, sketch: KLLSketch, levels: np.ndarray) -> np.ndarray:
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantile(levels), side='right') / len(ordered)
+    return np.abs(ranks - levels)
+
+
+def test_running_moments_merge_equals_numpy(stream):
+    chunks = np.array_split(stream, 7)
+    moments = RunningMoments()
+    for chunk in chunks:
+        moments.merge(RunningMoments().update(chunk))
+    assert moments.count == len(stream)
+    assert moments.mean == pytest.approx(stream.mean(), rel=1e-12)
+    assert moments.variance == pytest.approx(stream.var(ddof=1), rel=1e-10)
+    assert (moments.min, moments.max) == (stream.min(), stream.max())
+
+
+def test_kll_is_exact_below_capacity():
+    values = np.random.default_rng(1).normal(size=150)
+    levels = np.linspace(0.01, 0.99, 25)
+    np.testing.assert_array_equal(KLLSketch(200).update(values).quantile(levels),
+                                  np.quantile(values, levels, method='inverted_cdf'))
+
+
+def test_kll_rank_error_within_bound(stream):
+    levels = np.linspace(0.01, 0.99, 99)
+    sketch = KLLSketch(200, random_state=0)
+    for chunk in np.array_split(stream, 50):
+        sketch.update(chunk)
+    assert _rank_errors(stream, sketch, levels).max() < 0.0165
+
+
+def test_kll_merged_chunks_within_bound(stream):
+    levels = np.linspace(0.01, 0.99, 99)
+    merged = KLLSketch(200, random_state=0)
+    for seed, chunk in enumerate(np.array_split(stream, 16)):
+        merged.merge(KLLSketch(200, random_state=seed + 1).update(chunk))
+    assert merged.count == len(stream)
+    assert _rank_errors(stream, merged, levels).max() < 0.0165
+
+
+def test_sketch_chunks_independent_of_n_jobs(stream):
+    frame = pd.DataFrame({'a': stream, 'b': -stream})
+    chunks = [frame.iloc[start:start + 20_000] for start in range(0, len(frame), 20_000)]
+    serial = sketch_chunks(chunks, ['a', 'b'], n_jobs=1, random_state=0)
+    parallel = sketch_chunks(chunks, ['a', 'b'], n_jobs=2, random_state=0)
+    for column in ['a', 'b']:
+        assert serial[column].quantile(0.5) == parallel[column].quantile(0.5)
+    assert serial['a'].quantile(0.25) == pytest.approx(np.quantile(stream, 0.25), rel=0.05)
+
+
+def test_frequent_items_exact_below_capacity():
+    values = pd.Series(np.random.default_rng(2).integers(0, 50, 10_000))
+    items = FrequentItems(capacity=100)
+    for chunk in np.array_split(values.to_numpy(), 4):
+        items.merge(FrequentItems(capacity=100).update(chunk))
+    pd.testing.assert_series_equal(items.counts.sort_index(), values.value_counts().astype(float).sort_index(),
+                                   check_names=False)
+    assert items.most_common() == values.mode()[0]
+
+
+def test_frequent_items_error_bound():
+    rng = np.random.default_rng(3)
+    values = pd.Series(np.concatenate([np.full(3000, -1), rng.integers(0, 5000, 20_000)]))
+    capacity = 50
+    items = FrequentItems(capacity)
+    for chunk in np.array_split(values.sample(frac=1, random_state=0).to_numpy(), 10):
+        items.update(chunk)
+    exact = values.value_counts()
+    bound = len(values) / (capacity + 1)
+    assert items.most_common() == -1
+    estimated = items.counts.reindex(exact.index, fill_value=0)
+    assert (estimated <= exact).all()
+    assert (exact - estimated <= bound).all()
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.text_cleaner import TextCleaner, TextPipeline
+
+
+@pytest.fixture
+def causes():
+    rng = np.random.default_rng(0)
+    words = np.array(['Heart', 'disease,', 'heart', 'Stroke!', 'of', 'the', 'lung', 'cancer', 'THE', 'fword'])
+    texts = [' '.join(rng.choice(words, rng.integers(1, 12))) for _ in range(3000)]
+    return pd.DataFrame({'cause': texts})
+
+
+def _sequential(frame: pd.DataFrame) -> pd.Series:
+    cleaner = TextCleaner()
+    frame = cleaner.replace_regex(frame, 'cause', TextCleaner.RegexPatterns.PUNCTUATION.value)
+    frame = cleaner.filter_words(frame, 'cause', remove=['the', 'of'])
+    frame = cleaner.filter_words(frame, 'cause')
+    frame = cleaner.remove_repetitive_words(frame, 'cause')
+    return cleaner.replace_regex(frame, 'cause', TextCleaner.RegexPatterns.MULTI_BLANK_CHARACTERS.value, ' ')['cause']
+
+
+def _pipeline() -> TextPipeline:
+    return (TextPipeline()
+            .replace_regex(TextCleaner.RegexPatterns.PUNCTUATION)
+            .filter_words(['the', 'of'])
+            .filter_words()
+            .remove_repetitive_words()
+            .replace_regex(TextCleaner.RegexPatterns.MULTI_BLANK_CHARACTERS, ' '))
+
+
+@pytest.mark.parametrize('n_jobs, chunk_size', [(1, 100_000), (2, 700)])
+def test_pipeline_equals_sequential_cleaners(causes, n_jobs, chunk_size):
+    cleaned = TextCleaner().apply_pipeline(causes, 'cause', _pipeline(), n_jobs=n_jobs, chunk_size=chunk_size)
+    pd.testing.assert_series_equal(cleaned['cause'], _sequential(causes))
+
+
+def test_pipeline_fuses_adjacent_word_steps():
+    assert [kind for kind, _, _ in _pipeline().steps] == ['regex', 'words', 'regex']
+
+
+def test_pipeline_passes_missing_values_through():
+    series = pd.Series(['a a b', None, np.nan], dtype=object)
+    cleaned = TextPipeline().remove_repetitive_words().transform(series)
+    assert cleaned[0] == 'a b'
+    assert cleaned[1] is None and np.isnan(cleaned[2])
+
+
+def test_filter_words_matches_the_removal_set_as_given():
+    # Like TextCleaner.filter_words, lowercased words are looked up in `remove` without lowercasing it
+    frame = pd.DataFrame({'cause': ['The heart', 'the HEART of', 'Heart']})
+    pipeline = TextPipeline().filter_words(['the', 'HEART'])
+    expected = TextCleaner().filter_words(frame, 'cause', remove=['the', 'HEART'])['cause']
+    pd.testing.assert_series_equal(pipeline.transform(frame['cause']), expected)
+    assert list(expected) == ['heart', 'HEART of', 'Heart']